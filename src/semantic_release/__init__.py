@@ -22,6 +22,7 @@ from semantic_release.errors import (
 from semantic_release.version import (
     Version,
     VersionTranslator,
+    latest_tags_and_versions,
     next_version,
     tags_and_versions,
 )
@@ -42,6 +43,7 @@ __all__ = [
     "InvalidVersion",
     "Version",
     "VersionTranslator",
+    "latest_tags_and_versions",
     "next_version",
     "tags_and_versions",
 ]
@@ -0,0 +1,195 @@
+"""Persistence of the released segments of a release history between runs"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime
+from hashlib import sha256
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from git.objects.commit import Commit
+from git.util import Actor, hex_to_bin
+
+from semantic_release.commit_parser.cache import (
+    deserialize_parse_results,
+    parser_fingerprint,
+    prepare_cache_dir,
+    serialize_parse_results,
+)
+from semantic_release.commit_parser.util import force_str
+from semantic_release.globals import logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Iterable
+
+    from git.repo.base import Repo
+
+    from semantic_release.commit_parser import (
+        CommitParser,
+        ParseResult,
+        ParserOptions,
+    )
+    from semantic_release.version.translator import VersionTranslator
+
+
+_HISTORY_CACHE_FILENAME = "release_history.json"
+# v2: the cached releases match a walk from the newest of their tags
+_HISTORY_CACHE_SCHEMA_VERSION = 2
+
+
+def release_history_fingerprint(
+    commit_parser: CommitParser[ParseResult, ParserOptions],
+    translator: VersionTranslator,
+) -> str:
+    """
+    Create a stable hash of the configuration that determines the contents of a
+    release history, a change of which invalidates any persisted history.
+    """
+    return sha256(
+        str.join(
+            "\n",
+            [
+                f"schema={_HISTORY_CACHE_SCHEMA_VERSION}",
+                f"parser={parser_fingerprint(commit_parser)}",
+                f"tag_format={translator.tag_format}",
+            ],
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+class CachedRelease(NamedTuple):
+    """A release along with the commits (and their parse results) that it contains"""
+
+    tag_name: str
+    tag_commit_sha: str
+    tagger: Actor
+    committer: Actor
+    tagged_date: datetime
+    commits: list[tuple[Commit, ParseResult | list[ParseResult]]]
+
+
+class ReleaseHistoryCache:
+    """
+    Stores the released segments of a release history as a JSON file inside of
+    ``directory``, so a later run only needs to walk & parse the commits made after
+    the releases it contains.
+
+    A release is immutable once tagged, so it is the responsibility of the consumer
+    to verify that the tags of the cached releases are unchanged before reuse. Any
+    failure to read or write the file is logged and treated as an empty cache.
+    """
+
+    def __init__(self, directory: Path | str) -> None:
+        self.directory = Path(directory)
+
+    @property
+    def history_file(self) -> Path:
+        return self.directory / _HISTORY_CACHE_FILENAME
+
+    def load(self, repo: Repo, fingerprint: str) -> list[CachedRelease]:
+        """Load the persisted releases (newest first) if created by the same config"""
+        if not self.history_file.exists():
+            return []
+
+        try:
+            data = json.loads(self.history_file.read_text(encoding="utf-8"))
+            if data.get("fingerprint") != fingerprint:
+                logger.debug("Ignoring release history cache from another config")
+                return []
+
+            releases = [
+                self._deserialize_release(repo, release) for release in data["releases"]
+            ]
+
+        except (OSError, ValueError, KeyError, TypeError) as err:
+            logger.warning("Unable to read the release history cache: %s", err)
+            return []
+
+        logger.debug("Loaded %s releases from the release history cache", len(releases))
+        return releases
+
+    def save(self, fingerprint: str, releases: Iterable[CachedRelease]) -> None:
+        """Persist the releases (newest first), replacing any previous contents"""
+        serialized_releases = []
+        for release in releases:
+            if (serialized_release := self._serialize_release(release)) is None:
+                logger.debug(
+                    "Not caching the release history as %s contains custom parse results",
+                    release.tag_name,
+                )
+                return
+
+            serialized_releases.append(serialized_release)
+
+        tmp_file = self.history_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            prepare_cache_dir(self.directory)
+            tmp_file.write_text(
+                json.dumps(
+                    {"fingerprint": fingerprint, "releases": serialized_releases}
+                ),
+                encoding="utf-8",
+            )
+            # Atomic replacement prevents a concurrent run from reading a partial file
+            os.replace(tmp_file, self.history_file)
+
+        except OSError as err:
+            logger.warning("Unable to write the release history cache: %s", err)
+            tmp_file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _serialize_release(release: CachedRelease) -> dict[str, Any] | None:
+        serialized_commits = []
+        for commit, parse_results in release.commits:
+            if (payload := serialize_parse_results(commit, parse_results)) is None:
+                return None
+
+            serialized_commits.append(
+                {
+                    "sha": commit.hexsha,
+                    "parents": [parent.hexsha for parent in commit.parents],
+                    "message": force_str(commit.message),
+                    "parse_results": payload,
+                }
+            )
+
+        return {
+            "tag": release.tag_name,
+            "tag_commit_sha": release.tag_commit_sha,
+            "tagger": [release.tagger.name, release.tagger.email],
+            "committer": [release.committer.name, release.committer.email],
+            "tagged_date": release.tagged_date.isoformat(),
+            "commits": serialized_commits,
+        }
+
+    @staticmethod
+    def _deserialize_release(repo: Repo, data: dict[str, Any]) -> CachedRelease:
+        commits: list[tuple[Commit, ParseResult | list[ParseResult]]] = []
+        for commit_data in data["commits"]:
+            # The rest of the commit's attributes are lazily loaded by GitPython if used
+            commit = Commit(
+                repo,
+                hex_to_bin(commit_data["sha"]),
+                message=commit_data["message"],
+                parents=[
+                    Commit(repo, hex_to_bin(parent_sha))
+                    for parent_sha in commit_data["parents"]
+                ],
+            )
+            commits.append(
+                (
+                    commit,
+                    deserialize_parse_results(commit, commit_data["parse_results"]),
+                )
+            )
+
+        return CachedRelease(
+            tag_name=data["tag"],
+            tag_commit_sha=data["tag_commit_sha"],
+            tagger=Actor(*data["tagger"]),
+            committer=Actor(*data["committer"]),
+            tagged_date=datetime.fromisoformat(data["tagged_date"]),
+            commits=commits,
+        )
@@ -2,25 +2,31 @@ from __future__ import annotations
 
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+from itertools import takewhile
 from typing import TYPE_CHECKING, TypedDict
 
-from git.objects.tag import TagObject
-
+from semantic_release.changelog.history_cache import (
+    CachedRelease,
+    release_history_fingerprint,
+)
 from semantic_release.commit_parser import ParseError
 from semantic_release.commit_parser.token import ParsedCommit
 from semantic_release.commit_parser.util import force_str
 from semantic_release.enums import LevelBump
 from semantic_release.globals import logger
 from semantic_release.helpers import validate_types_in_sequence
-from semantic_release.version.algorithm import tags_and_versions
+from semantic_release.version.commit_graph import CommitGraph
+from semantic_release.version.snapshot import HistorySnapshot
 
 if TYPE_CHECKING:  # pragma: no cover
     from re import Pattern
     from typing import Iterable, Iterator
 
+    from git.objects.commit import Commit
     from git.repo.base import Repo
     from git.util import Actor
 
+    from semantic_release.changelog.history_cache import ReleaseHistoryCache
     from semantic_release.commit_parser import (
         CommitParser,
         ParseResult,
@@ -32,195 +38,252 @@ if TYPE_CHECKING:  # pragma: no cover
 
 class ReleaseHistory:
     @classmethod
-    def from_git_history(
+    def from_git_history(  # noqa: C901
         cls,
         repo: Repo,
         translator: VersionTranslator,
         commit_parser: CommitParser[ParseResult, ParserOptions],
         exclude_commit_patterns: Iterable[Pattern[str]] = (),
+        snapshot: HistorySnapshot | None = None,
+        cache: ReleaseHistoryCache | None = None,
+        max_releases: int | None = None,
+        since_tag: str | None = None,
     ) -> ReleaseHistory:
-        all_git_tags_and_versions = tags_and_versions(repo.tags, translator)
-        unreleased: dict[str, list[ParseResult]] = defaultdict(list)
-        released: dict[Version, Release] = {}
+        """
+        Build the release history from the commits reachable from HEAD.
+
+        When a `snapshot` of the history is provided, its tags, commit graph and
+        parse results are reused instead of being read from the repository again.
+
+        When a `cache` is provided, the releases persisted by a previous run are
+        reused as long as all of their tags are unchanged, and only the commits
+        which are not part of those releases are walked & parsed. Otherwise, the
+        history is rebuilt in full & persisted for the next run.
+
+        The history can be limited to a window of the most recent releases with
+        `max_releases`, and/or to the releases since (and including) the release
+        tagged `since_tag`. The commits of older releases are then neither walked
+        nor parsed, which bounds the work regardless of the age of the repository.
+        A windowed history is never read from or written to the `cache`.
+        """
+        if snapshot is None or snapshot.commit_parser is not commit_parser:
+            snapshot = HistorySnapshot.from_repo(repo, translator, commit_parser)
 
         # Performance optimization: create a mapping of tag sha to version
         # so we can quickly look up the version for a given commit based on sha
         tag_sha_2_version_lookup = {
-            tag.commit.hexsha: (tag, version)
-            for tag, version in all_git_tags_and_versions
+            snapshot.tag_commit_sha(tag): (tag, version)
+            for tag, version in snapshot.tags_and_versions
         }
 
+        # The releases expected to be found in the history of HEAD, by tag name
+        release_tags = {
+            tag.name: (tag_sha, version)
+            for tag_sha, (tag, version) in tag_sha_2_version_lookup.items()
+            if tag_sha is not None and tag.name in snapshot.reachable_tags
+        }
+
+        # The tags of the releases within a windowed history, and the tag of the
+        # most recent release outside of the window (if any)
+        window, window_boundary = _release_window(
+            [
+                tag.name
+                for tag, _ in snapshot.tags_and_versions
+                if tag.name in release_tags
+            ],
+            max_releases=max_releases,
+            since_tag=since_tag,
+        )
+
         ignore_merge_commits = bool(
             hasattr(commit_parser, "options")
             and hasattr(commit_parser.options, "ignore_merge_commits")
             and getattr(commit_parser.options, "ignore_merge_commits")  # noqa: B009
         )
 
-        # Strategy:
-        # Loop through commits in history, parsing as we go.
-        # Add these commits to `unreleased` as a key-value mapping
-        # of type_ to ParseResult, until we encounter a tag
-        # which matches a commit.
-        # Then, we add the version for that tag as a key to `released`,
-        # and set the value to an empty dict. Into that empty dict
-        # we place the key-value mapping type_ to ParseResult as before.
-        # We do this until we encounter a commit which another tag matches.
-
-        the_version: Version | None = None
-
-        for commit in repo.iter_commits("HEAD", topo_order=True):
-            # Determine if we have found another release
-            logger.debug("checking if commit %s matches any tags", commit.hexsha[:7])
-            t_v = tag_sha_2_version_lookup.get(commit.hexsha, None)
-
-            if t_v is None:
-                logger.debug("no tags correspond to commit %s", commit.hexsha)
-            else:
-                # Unpack the tuple (overriding the current version)
-                tag, the_version = t_v
-                # we have found the latest commit introduced by this tag
-                # so we create a new Release entry
-                logger.debug("found commit %s for tag %s", commit.hexsha, tag.name)
-
-                # tag.object is a Commit if the tag is lightweight, otherwise
-                # it is a TagObject with additional metadata about the tag
-                if isinstance(tag.object, TagObject):
-                    tagger = tag.object.tagger
-                    committer = tag.object.tagger.committer()
-                    _tz = timezone(timedelta(seconds=-1 * tag.object.tagger_tz_offset))
-                    tagged_date = datetime.fromtimestamp(tag.object.tagged_date, tz=_tz)
-                else:
-                    # For some reason, sometimes tag.object is a Commit
-                    tagger = tag.object.author
-                    committer = tag.object.author
-                    _tz = timezone(timedelta(seconds=-1 * tag.object.author_tz_offset))
-                    tagged_date = datetime.fromtimestamp(
-                        tag.object.committed_date, tz=_tz
-                    )
-
-                release = Release(
-                    tagger=tagger,
-                    committer=committer,
-                    tagged_date=tagged_date,
-                    elements=defaultdict(list),
-                    version=the_version,
+        fingerprint = release_history_fingerprint(commit_parser, translator)
+        if window is not None:
+            # A partial history must not replace or be mixed with the cached history
+            cache = None
+
+        cached_releases = [] if cache is None else cache.load(repo, fingerprint)
+
+        # Released segments are immutable once tagged, but if any tag has been
+        # moved or removed since, the cached history can no longer be trusted
+        if not all(
+            release_tags.get(cached_release.tag_name, ("", None))[0]
+            == cached_release.tag_commit_sha
+            for cached_release in cached_releases
+        ):
+            logger.info("Release tags have changed, rebuilding the release history")
+            cached_releases = []
+
+        def load_commits(cached_releases: list[CachedRelease]) -> CommitGraph:
+            # Both graphs iterate in topological order, when releases are cached or
+            # outside of the window, the commits of those releases are not loaded
+            excluded_shas = [release.tag_commit_sha for release in cached_releases]
+            if window_boundary is not None:
+                excluded_shas.append(release_tags[window_boundary][0])
+
+            return (
+                CommitGraph.from_git_log(
+                    repo, snapshot.head_sha, exclude=excluded_shas, topo_order=True
                 )
+                if excluded_shas
+                else snapshot.commit_graph
+            )
 
-                released.setdefault(the_version, release)
-
-            logger.info(
-                "parsing commit [%s] %s",
-                commit.hexsha[:8],
-                str(commit.message).replace("\n", " ")[:54],
+        commit_graph = load_commits(cached_releases)
+
+        # A commit made after the cached releases may still be walked after one of
+        # their tags in the full topological order (ex. a branch which forked before
+        # a release & merged the release in afterwards), or a new tag may be added to
+        # a commit of a cached release. Either way, the releases of the commits would
+        # differ from those of a full walk. Both are ruled out from the new commits
+        # alone, as long as they all descend from the newest cached release & any
+        # other release tag is among them.
+        cached_tag_names = {release.tag_name for release in cached_releases}
+        if cached_releases and not (
+            _descends_from(
+                commit_graph, commit_graph, cached_releases[0].tag_commit_sha
+            )
+            and all(
+                tag_sha in commit_graph
+                for tag_name, (tag_sha, _) in release_tags.items()
+                if tag_name not in cached_tag_names
+            )
+        ):
+            logger.info("Release history has diverged, rebuilding the release history")
+            cached_releases = []
+            commit_graph = load_commits(cached_releases)
+
+        def build(
+            cached_releases: list[CachedRelease], commit_graph: CommitGraph
+        ) -> _ReleaseHistoryBuilder:
+            builder = _ReleaseHistoryBuilder(
+                exclude_commit_patterns=exclude_commit_patterns,
+                ignore_merge_commits=ignore_merge_commits,
             )
-            # returns a ParseResult or list of ParseResult objects,
-            # it is usually one, but we split a commit if a squashed merge is detected
-            parse_results = commit_parser.parse(commit)
 
-            if not any(
-                (
-                    isinstance(parse_results, (ParseError, ParsedCommit)),
-                    (
-                        (
-                            isinstance(parse_results, list)
-                            or type(parse_results) == tuple
-                        )
-                        and validate_types_in_sequence(
-                            parse_results, (ParseError, ParsedCommit)
-                        )
-                    ),
+            # Strategy:
+            # Loop through commits in history, parsing as we go.
+            # Add these commits to `unreleased` as a key-value mapping
+            # of type_ to ParseResult, until we encounter a tag
+            # which matches a commit.
+            # Then, we add the version for that tag as a key to `released`,
+            # and set the value to an empty dict. Into that empty dict
+            # we place the key-value mapping type_ to ParseResult as before.
+            # We do this until we encounter a commit which another tag matches.
+
+            # Parse the whole history up front, which allows the snapshot to parse
+            # the commits in parallel if configured to do so
+            snapshot.parse_all(map(commit_graph.to_commit, commit_graph))
+
+            for commit in map(commit_graph.to_commit, commit_graph):
+                # Determine if we have found another release
+                logger.debug(
+                    "checking if commit %s matches any tags", commit.hexsha[:7]
                 )
-            ):
-                raise TypeError("Unexpected type returned from commit_parser.parse")
-
-            results: list[ParseResult] = [
-                *(
-                    [parse_results]
-                    if isinstance(parse_results, (ParseError, ParsedCommit))
-                    else parse_results
-                ),
-            ]
+                t_v = tag_sha_2_version_lookup.get(commit.hexsha, None)
 
-            is_squash_commit = bool(len(results) > 1)
+                if t_v is None:
+                    logger.debug("no tags correspond to commit %s", commit.hexsha)
+                else:
+                    # Unpack the tuple
+                    tag, the_version = t_v
+                    if window is not None and tag.name not in window:
+                        logger.debug("reached %s, outside of the window", tag.name)
+                        break
+
+                    # we have found the latest commit introduced by this tag
+                    # so we create a new Release entry
+                    logger.debug("found commit %s for tag %s", commit.hexsha, tag.name)
+
+                    # The tag index holds the tagger & date of an annotated tag, or the
+                    # author & commit date of the tagged commit if the tag is lightweight
+                    tag_info = snapshot.tag_index[tag.name]
+                    tagger = tag_info.tagger or commit.author
+                    committer = tagger.committer() if tag_info.is_annotated else tagger
+                    tagged_date = tag_info.tagged_date or datetime.fromtimestamp(
+                        commit.committed_date,
+                        tz=timezone(timedelta(seconds=-1 * commit.author_tz_offset)),
+                    )
 
-            # iterate through parsed commits to add to changelog definition
-            for parsed_result in results:
-                commit_message = force_str(parsed_result.commit.message)
-                commit_type = (
-                    "unknown"
-                    if isinstance(parsed_result, ParseError)
-                    else parsed_result.type
-                )
-                logger.debug("commit has type '%s'", commit_type)
+                    builder.start_release(
+                        tag_name=tag.name,
+                        tag_commit_sha=commit.hexsha,
+                        release=Release(
+                            tagger=tagger,
+                            committer=committer,
+                            tagged_date=tagged_date,
+                            elements=defaultdict(list),
+                            version=the_version,
+                        ),
+                    )
 
-                has_exclusion_match = any(
-                    pattern.match(commit_message) for pattern in exclude_commit_patterns
+                logger.info(
+                    "parsing commit [%s] %s",
+                    commit.hexsha[:8],
+                    str(commit.message).replace("\n", " ")[:54],
                 )
-
-                commit_level_bump = (
-                    LevelBump.NO_RELEASE
-                    if isinstance(parsed_result, ParseError)
-                    else parsed_result.bump
+                # returns a ParseResult or list of ParseResult objects,
+                # it is usually one, but we split a commit if a squashed merge is detected
+                builder.add_commit(commit, snapshot.parse(commit))
+
+            # The cached releases are older than any release found in the walk
+            for cached_release in cached_releases:
+                _, the_version = release_tags[cached_release.tag_name]
+                logger.debug("reusing cached release %s", the_version)
+                builder.start_release(
+                    tag_name=cached_release.tag_name,
+                    tag_commit_sha=cached_release.tag_commit_sha,
+                    release=Release(
+                        tagger=cached_release.tagger,
+                        committer=cached_release.committer,
+                        tagged_date=cached_release.tagged_date,
+                        elements=defaultdict(list),
+                        version=the_version,
+                    ),
                 )
+                for commit, parse_results in cached_release.commits:
+                    builder.add_commit(commit, parse_results)
 
-                if ignore_merge_commits and parsed_result.is_merge_commit():
-                    logger.info("Excluding merge commit[%s]", parsed_result.short_hash)
-                    continue
-
-                # Skip excluded commits except for any commit causing a version bump
-                # Reasoning: if a commit causes a version bump, and no other commits
-                # are included, then the changelog will be empty. Even if ther was other
-                # commits included, the true reason for a version bump would be missing.
-                if has_exclusion_match and commit_level_bump == LevelBump.NO_RELEASE:
-                    logger.info(
-                        "Excluding %s commit[%s] %s",
-                        "piece of squashed" if is_squash_commit else "",
-                        parsed_result.short_hash,
-                        commit_message.split("\n", maxsplit=1)[0][:20],
-                    )
-                    continue
-
-                if (
-                    isinstance(parsed_result, ParsedCommit)
-                    and not parsed_result.include_in_changelog
-                ):
-                    logger.info(
-                        str.join(
-                            " ",
-                            [
-                                "Excluding commit[%s] because parser determined",
-                                "it should not included in the changelog",
-                            ],
-                        ),
-                        parsed_result.short_hash,
-                    )
-                    continue
+            return builder
 
-                if the_version is None:
-                    logger.info(
-                        "[Unreleased] adding commit[%s] to unreleased '%s'",
-                        parsed_result.short_hash,
-                        commit_type,
-                    )
-                    unreleased[commit_type].append(parsed_result)
-                    continue
+        builder = build(cached_releases, commit_graph)
 
-                logger.info(
-                    "[%s] adding commit[%s] to release '%s'",
-                    the_version,
-                    parsed_result.short_hash,
-                    commit_type,
-                )
+        if cache is not None and len(builder.released) != len(cached_releases):
+            releases_to_cache = builder.cacheable_releases()
+            newest_tag_sha = releases_to_cache[0].tag_commit_sha
 
-                released[the_version]["elements"][commit_type].append(parsed_result)
+            # The cached releases are only reused by the next run if they are what a
+            # walk from the newest of their tags finds, which is the case as long as
+            # the commits walked before that tag all descend from it
+            if _descends_from(
+                commit_graph,
+                takewhile(lambda sha: sha != newest_tag_sha, commit_graph),
+                newest_tag_sha,
+            ):
+                cache.save(fingerprint, releases_to_cache)
+            else:
+                logger.info("Release history has diverged, it will not be cached")
 
-        return cls(unreleased=unreleased, released=released)
+        return cls(
+            unreleased=builder.unreleased,
+            released=builder.released,
+            truncated=window_boundary is not None,
+        )
 
     def __init__(
-        self, unreleased: dict[str, list[ParseResult]], released: dict[Version, Release]
+        self,
+        unreleased: dict[str, list[ParseResult]],
+        released: dict[Version, Release],
+        truncated: bool = False,
     ) -> None:
         self.released = released
         self.unreleased = unreleased
+        # Whether releases older than those in `released` were left out of the history
+        self.truncated = truncated
 
     def __iter__(
         self,
@@ -254,6 +317,7 @@ class ReleaseHistory:
                 },
                 **self.released,
             },
+            truncated=self.truncated,
         )
 
     def __repr__(self) -> str:
@@ -264,6 +328,207 @@ class ReleaseHistory:
         )
 
 
+def _release_window(
+    release_tags: list[str],
+    max_releases: int | None = None,
+    since_tag: str | None = None,
+) -> tuple[set[str] | None, str | None]:
+    """
+    Determine which of the release tags (ordered from newest to oldest) are within
+    the window of a windowed release history.
+
+    :returns: The tags within the window, or None if the history is not windowed,
+        and the newest tag outside of the window, or None if there is none
+    """
+    if max_releases is None and since_tag is None:
+        return None, None
+
+    window_size = len(release_tags)
+    if since_tag is not None:
+        if since_tag not in release_tags:
+            raise ValueError(f"{since_tag} is not a release in the history of HEAD")
+        window_size = release_tags.index(since_tag) + 1
+
+    if max_releases is not None:
+        if max_releases < 0:
+            raise ValueError("max_releases must not be negative")
+        window_size = min(window_size, max_releases)
+
+    return (
+        set(release_tags[:window_size]),
+        release_tags[window_size] if window_size < len(release_tags) else None,
+    )
+
+
+def _descends_from(
+    commit_graph: CommitGraph, shas: Iterable[str], base_sha: str
+) -> bool:
+    """
+    Whether all of the commits descend from the commit `base_sha`, without any other
+    path to older commits, such that they are all walked before `base_sha` and then
+    the walk continues exactly as a walk which starts from `base_sha`.
+    Only the parents of the commits are compared, the commits themselves are not read.
+    """
+    segment = set(shas)
+    return all(
+        # A root commit (ex. an unrelated history merged in) does not descend from it
+        (parent_shas := commit_graph.parents_of(sha))
+        and all(
+            parent_sha in segment or parent_sha == base_sha
+            for parent_sha in parent_shas
+        )
+        for sha in segment
+    )
+
+
+class _ReleaseHistoryBuilder:
+    """
+    Accumulates the parse results of the commits walked from newest to oldest into
+    the unreleased changes or the release that each commit belongs to.
+    """
+
+    def __init__(
+        self,
+        exclude_commit_patterns: Iterable[Pattern[str]],
+        ignore_merge_commits: bool,
+    ) -> None:
+        self.exclude_commit_patterns = tuple(exclude_commit_patterns)
+        self.ignore_merge_commits = ignore_merge_commits
+        self.unreleased: dict[str, list[ParseResult]] = defaultdict(list)
+        self.released: dict[Version, Release] = {}
+        self.the_version: Version | None = None
+        # The raw parse results of each release's commits & its tag, for caching
+        self._release_tags: dict[Version, tuple[str, str]] = {}
+        self._release_commits: dict[
+            Version, list[tuple[Commit, ParseResult | list[ParseResult]]]
+        ] = {}
+
+    def start_release(
+        self, tag_name: str, tag_commit_sha: str, release: Release
+    ) -> None:
+        """Assign all the following commits to the given release"""
+        self.the_version = release["version"]
+        self.released.setdefault(self.the_version, release)
+        self._release_tags.setdefault(self.the_version, (tag_name, tag_commit_sha))
+        self._release_commits.setdefault(self.the_version, [])
+
+    def cacheable_releases(self) -> list[CachedRelease]:
+        return [
+            CachedRelease(
+                tag_name=self._release_tags[version][0],
+                tag_commit_sha=self._release_tags[version][1],
+                tagger=release["tagger"],
+                committer=release["committer"],
+                tagged_date=release["tagged_date"],
+                commits=self._release_commits[version],
+            )
+            for version, release in self.released.items()
+        ]
+
+    def add_commit(
+        self, commit: Commit, parse_results: ParseResult | list[ParseResult]
+    ) -> None:
+        if self.the_version is not None:
+            self._release_commits[self.the_version].append((commit, parse_results))
+
+        if not any(
+            (
+                isinstance(parse_results, (ParseError, ParsedCommit)),
+                (
+                    (isinstance(parse_results, list) or type(parse_results) == tuple)
+                    and validate_types_in_sequence(
+                        parse_results, (ParseError, ParsedCommit)
+                    )
+                ),
+            )
+        ):
+            raise TypeError("Unexpected type returned from commit_parser.parse")
+
+        results: list[ParseResult] = [
+            *(
+                [parse_results]
+                if isinstance(parse_results, (ParseError, ParsedCommit))
+                else parse_results
+            ),
+        ]
+
+        is_squash_commit = bool(len(results) > 1)
+
+        # iterate through parsed commits to add to changelog definition
+        for parsed_result in results:
+            commit_message = force_str(parsed_result.commit.message)
+            commit_type = (
+                "unknown"
+                if isinstance(parsed_result, ParseError)
+                else parsed_result.type
+            )
+            logger.debug("commit has type '%s'", commit_type)
+
+            has_exclusion_match = any(
+                pattern.match(commit_message)
+                for pattern in self.exclude_commit_patterns
+            )
+
+            commit_level_bump = (
+                LevelBump.NO_RELEASE
+                if isinstance(parsed_result, ParseError)
+                else parsed_result.bump
+            )
+
+            if self.ignore_merge_commits and parsed_result.is_merge_commit():
+                logger.info("Excluding merge commit[%s]", parsed_result.short_hash)
+                continue
+
+            # Skip excluded commits except for any commit causing a version bump
+            # Reasoning: if a commit causes a version bump, and no other commits
+            # are included, then the changelog will be empty. Even if ther was other
+            # commits included, the true reason for a version bump would be missing.
+            if has_exclusion_match and commit_level_bump == LevelBump.NO_RELEASE:
+                logger.info(
+                    "Excluding %s commit[%s] %s",
+                    "piece of squashed" if is_squash_commit else "",
+                    parsed_result.short_hash,
+                    commit_message.split("\n", maxsplit=1)[0][:20],
+                )
+                continue
+
+            if (
+                isinstance(parsed_result, ParsedCommit)
+                and not parsed_result.include_in_changelog
+            ):
+                logger.info(
+                    str.join(
+                        " ",
+                        [
+                            "Excluding commit[%s] because parser determined",
+                            "it should not included in the changelog",
+                        ],
+                    ),
+                    parsed_result.short_hash,
+                )
+                continue
+
+            if self.the_version is None:
+                logger.info(
+                    "[Unreleased] adding commit[%s] to unreleased '%s'",
+                    parsed_result.short_hash,
+                    commit_type,
+                )
+                self.unreleased[commit_type].append(parsed_result)
+                continue
+
+            logger.info(
+                "[%s] adding commit[%s] to release '%s'",
+                self.the_version,
+                parsed_result.short_hash,
+                commit_type,
+            )
+
+            self.released[self.the_version]["elements"][commit_type].append(
+                parsed_result
+            )
+
+
 class Release(TypedDict):
     tagger: Actor
     committer: Actor
@@ -180,7 +180,10 @@ def write_changelog_files(
         mode=runtime_ctx.changelog_mode,
         insertion_flag=runtime_ctx.changelog_insertion_flag,
         prev_changelog_file=runtime_ctx.changelog_file,
-        mask_initial_release=runtime_ctx.changelog_mask_initial_release,
+        # The oldest release of a truncated history is not the initial release
+        mask_initial_release=(
+            runtime_ctx.changelog_mask_initial_release and not release_history.truncated
+        ),
     )
 
     user_templates = []
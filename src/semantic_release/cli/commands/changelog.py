@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from contextlib import suppress
+from contextlib import nullcontext, suppress
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -8,6 +8,8 @@ import click
 import tomlkit
 from git import GitCommandError, Repo
 
+from semantic_release.changelog.context import ChangelogMode
+from semantic_release.changelog.history_cache import ReleaseHistoryCache
 from semantic_release.changelog.release_history import ReleaseHistory
 from semantic_release.cli.changelog_writer import (
     generate_release_notes,
@@ -15,7 +17,9 @@ from semantic_release.cli.changelog_writer import (
 )
 from semantic_release.cli.util import noop_report
 from semantic_release.globals import logger
+from semantic_release.helpers import LazyFetchCounter, disable_lazy_fetch
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
+from semantic_release.version.snapshot import HistorySnapshot
 
 if TYPE_CHECKING:  # pragma: no cover
     from semantic_release.cli.cli_context import CliContextObj
@@ -98,21 +102,85 @@ def post_release_notes(
     default=None,
     help="Post the generated release notes to the remote VCS's release for this tag",
 )
+@click.option(
+    "--max-releases",
+    "max_releases",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Only include the unreleased changes and this many of the latest releases",
+)
+@click.option(
+    "--since-tag",
+    "since_tag",
+    default=None,
+    help="Only include the unreleased changes and the releases since this tag",
+)
 @click.pass_obj
-def changelog(cli_ctx: CliContextObj, release_tag: str | None) -> None:
+def changelog(
+    cli_ctx: CliContextObj,
+    release_tag: str | None,
+    max_releases: int | None,
+    since_tag: str | None,
+) -> None:
     """Generate and optionally publish a changelog for your project"""
     ctx = click.get_current_context()
     runtime = cli_ctx.runtime_ctx
     translator = runtime.version_translator
     hvcs_client = runtime.hvcs_client
 
-    with Repo(str(runtime.repo_dir)) as git_repo:
-        release_history = ReleaseHistory.from_git_history(
-            repo=git_repo,
-            translator=translator,
-            commit_parser=runtime.commit_parser,
-            exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
+    # A windowed history only holds the latest releases, it would replace the older
+    # releases of the changelog unless they are kept by updating it in place
+    if (max_releases is not None or since_tag is not None) and not (
+        runtime.changelog_mode == ChangelogMode.UPDATE
+        and runtime.changelog_file.exists()
+    ):
+        click.echo(
+            str.join(
+                " ",
+                [
+                    "--max-releases and --since-tag can only be used to update an",
+                    "existing changelog in place, but the changelog mode is",
+                    f"{runtime.changelog_mode.value!r}"
+                    if runtime.changelog_mode != ChangelogMode.UPDATE
+                    else f"'update' and {runtime.changelog_file} does not exist",
+                ],
+            ),
+            err=True,
         )
+        ctx.exit(1)
+
+    # The repository is kept open until the command completes
+    git_repo = Repo(str(runtime.repo_dir))
+    ctx.call_on_close(git_repo.close)
+
+    # Only commits & trees are needed to analyse the history, report any other object
+    # a partial clone had to fetch (ex. file contents read by a custom commit parser)
+    lazy_fetches = LazyFetchCounter(git_repo)
+
+    with disable_lazy_fetch(git_repo) if runtime.no_lazy_fetch else nullcontext():
+        try:
+            release_history = ReleaseHistory.from_git_history(
+                repo=git_repo,
+                translator=translator,
+                commit_parser=runtime.commit_parser,
+                exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
+                snapshot=HistorySnapshot.from_repo(
+                    repo=git_repo,
+                    translator=translator,
+                    commit_parser=runtime.commit_parser,
+                    parse_workers=runtime.commit_parser_workers,
+                ),
+                cache=(
+                    ReleaseHistoryCache(runtime.cache_dir)
+                    if runtime.cache_dir is not None
+                    else None
+                ),
+                max_releases=max_releases,
+                since_tag=since_tag,
+            )
+        except ValueError as err:
+            click.echo(str(err), err=True)
+            ctx.exit(1)
 
     write_changelog_files(
         runtime_ctx=runtime,
@@ -120,6 +188,7 @@ def changelog(cli_ctx: CliContextObj, release_tag: str | None) -> None:
         hvcs_client=hvcs_client,
         noop=runtime.global_cli_options.noop,
     )
+    lazy_fetches.warn_if_fetched("analysis of the history")
 
     if not release_tag:
         return
@@ -156,7 +225,9 @@ def changelog(cli_ctx: CliContextObj, release_tag: str | None) -> None:
         runtime.template_dir,
         release_history,
         style=runtime.changelog_style,
-        mask_initial_release=runtime.changelog_mask_initial_release,
+        mask_initial_release=(
+            runtime.changelog_mask_initial_release and not release_history.truncated
+        ),
         license_name=get_license_name_for_release(
             tag_name=release_tag,
             project_root=runtime.repo_dir,
@@ -9,7 +9,7 @@ from semantic_release.cli.util import noop_report
 from semantic_release.errors import AssetUploadError
 from semantic_release.globals import logger
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
-from semantic_release.version.algorithm import tags_and_versions
+from semantic_release.version.algorithm import latest_tags_and_versions
 
 if TYPE_CHECKING:  # pragma: no cover
     from semantic_release.cli.cli_context import CliContextObj
@@ -62,10 +62,13 @@ def publish(cli_ctx: CliContextObj, tag: str) -> None:
 
     with Repo(str(runtime.repo_dir)) as git_repo:
         repo_tags = git_repo.tags
+        latest_release = (
+            latest_tags_and_versions(git_repo, translator) if tag == "latest" else []
+        )
 
     if tag == "latest":
         try:
-            tag = str(tags_and_versions(repo_tags, translator)[0][0])
+            tag = str(latest_release[0][0])
         except IndexError:
             click.echo(
                 str.join(
@@ -4,6 +4,7 @@ import os
 import subprocess
 import sys
 from collections import defaultdict
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
@@ -13,6 +14,7 @@ from click_option_group import MutuallyExclusiveOptionGroup, optgroup
 from git import GitCommandError, Repo
 from requests import HTTPError
 
+from semantic_release.changelog.history_cache import ReleaseHistoryCache
 from semantic_release.changelog.release_history import ReleaseHistory
 from semantic_release.cli.changelog_writer import (
     generate_release_notes,
@@ -38,12 +40,17 @@ from semantic_release.errors import (
 )
 from semantic_release.gitproject import GitProject
 from semantic_release.globals import logger
+from semantic_release.helpers import LazyFetchCounter, disable_lazy_fetch
 from semantic_release.hvcs.github import Github
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
 from semantic_release.version.algorithm import (
+    _tag_to_version,
+    latest_tags_and_versions,
     next_version,
     tags_and_versions,
 )
+from semantic_release.version.snapshot import HistorySnapshot
+from semantic_release.version.tag_index import list_tags
 from semantic_release.version.translator import VersionTranslator
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -80,12 +87,22 @@ def is_forced_prerelease(
     )
 
 
+def is_full_release_tag(tag_name: str, translator: VersionTranslator) -> bool:
+    """
+    Determine if a tag is the tag of a full release, a tag which matches the tag
+    format but is not a valid version (ex. ``vlatest``) is not.
+    """
+    return (
+        version := _tag_to_version(tag_name, translator)
+    ) is not None and not version.is_prerelease
+
+
 def last_released(
     repo_dir: Path, tag_format: str, add_partial_tags: bool = False
 ) -> tuple[Tag, Version] | None:
     with Repo(str(repo_dir)) as git_repo:
-        ts_and_vs = tags_and_versions(
-            git_repo.tags,
+        ts_and_vs = latest_tags_and_versions(
+            git_repo,
             VersionTranslator(tag_format=tag_format, add_partial_tags=add_partial_tags),
         )
 
@@ -93,10 +110,18 @@ def last_released(
 
 
 def version_from_forced_level(
-    repo_dir: Path, forced_level_bump: LevelBump, translator: VersionTranslator
+    repo_dir: Path,
+    forced_level_bump: LevelBump,
+    translator: VersionTranslator,
+    snapshot: HistorySnapshot | None = None,
 ) -> Version:
-    with Repo(str(repo_dir)) as git_repo:
-        ts_and_vs = tags_and_versions(git_repo.tags, translator)
+    if snapshot is not None:
+        ts_and_vs = snapshot.tags_and_versions
+    else:
+        with Repo(str(repo_dir)) as git_repo:
+            ts_and_vs = tags_and_versions(
+                list_tags(git_repo, translator.tag_refs_pattern), translator
+            )
 
     # If we have no tags, return the default version
     if not ts_and_vs:
@@ -511,7 +536,18 @@ def version(  # noqa: C901
         commit_author=runtime.commit_author,
         credential_masker=runtime.masker,
     )
-    if project.is_shallow_clone():
+    # The project's repository is shared by every git operation of this run
+    ctx.call_on_close(project.close)
+
+    if project.is_shallow_clone() and runtime.incremental_unshallow:
+        logger.info("Repository is a shallow clone, deepening to the latest release...")
+        # The next version (& any prerelease) is based on the latest full release
+        project.git_deepen_to_release(
+            is_release_tag=lambda tag: is_full_release_tag(tag, translator),
+            noop=opts.noop,
+        )
+
+    elif project.is_shallow_clone():
         logger.info("Repository is a shallow clone, converting to full clone...")
         project.git_unshallow(noop=opts.noop)
 
@@ -532,44 +568,64 @@ def version(  # noqa: C901
         )
         make_vcs_release &= push_changes
 
-    if not forced_level_bump:
-        with Repo(str(runtime.repo_dir)) as git_repo:
+    # Only commits & trees are needed to analyse the history, report any other object
+    # a partial clone had to fetch (ex. file contents read by a custom commit parser)
+    lazy_fetches = LazyFetchCounter(project.repo)
+
+    # Only the analysis of the history runs without lazy fetches when configured, as
+    # the git operations of the release (ex. commit, push) may need missing objects
+    with disable_lazy_fetch(project.repo) if runtime.no_lazy_fetch else nullcontext():
+        # Capture the tags & commit history once so that every step of this run
+        # shares it
+        history = HistorySnapshot.from_repo(
+            repo=project.repo,
+            translator=translator,
+            commit_parser=parser,
+            parse_workers=runtime.commit_parser_workers,
+        )
+
+        if not forced_level_bump:
             new_version = next_version(
-                repo=git_repo,
+                repo=project.repo,
                 translator=translator,
                 commit_parser=parser,
                 prerelease=prerelease,
                 major_on_zero=major_on_zero,
                 allow_zero_version=runtime.allow_zero_version,
+                snapshot=history,
+                # Only the version is needed when printing, not a changelog of all
+                # commits
+                short_circuit=print_only or print_only_tag,
+            )
+        else:
+            logger.warning(
+                "Forcing a '%s' release due to '--%s' command-line flag",
+                force_level,
+                (
+                    force_level
+                    if forced_level_bump is not LevelBump.PRERELEASE_REVISION
+                    else "prerelease"
+                ),
             )
-    else:
-        logger.warning(
-            "Forcing a '%s' release due to '--%s' command-line flag",
-            force_level,
-            (
-                force_level
-                if forced_level_bump is not LevelBump.PRERELEASE_REVISION
-                else "prerelease"
-            ),
-        )
 
-        new_version = version_from_forced_level(
-            repo_dir=runtime.repo_dir,
-            forced_level_bump=forced_level_bump,
-            translator=translator,
-        )
+            new_version = version_from_forced_level(
+                repo_dir=runtime.repo_dir,
+                forced_level_bump=forced_level_bump,
+                translator=translator,
+                snapshot=history,
+            )
 
-        # We only turn the forced version into a prerelease if the user has specified
-        # that that is what they want on the command-line; otherwise we assume they are
-        # forcing a full release
-        new_version = (
-            new_version.to_prerelease(token=translator.prerelease_token)
-            if prerelease
-            else new_version.finalize_version()
-        )
+            # We only turn the forced version into a prerelease if the user has
+            # specified that that is what they want on the command-line; otherwise we
+            # assume they are forcing a full release
+            new_version = (
+                new_version.to_prerelease(token=translator.prerelease_token)
+                if prerelease
+                else new_version.finalize_version()
+            )
 
     if build_metadata:
-        new_version.build_metadata = build_metadata
+        new_version = new_version.with_build_metadata(build_metadata)
 
     # Update GitHub Actions output value with new version & set delayed write
     gha_output.version = new_version
@@ -582,15 +638,9 @@ def version(  # noqa: C901
     # Print the new version so that command-line output capture will work
     click.echo(version_to_print)
 
-    with Repo(str(runtime.repo_dir)) as git_repo:
-        # TODO: performance improvement - cache the result of tags_and_versions (previously done in next_version())
-        previously_released_versions = {
-            v for _, v in tags_and_versions(git_repo.tags, translator)
-        }
-
     # If the new version has already been released, we fail and abort if strict;
     # otherwise we exit with 0.
-    if new_version in previously_released_versions:
+    if new_version in history.released_versions:
         err_msg = f"No release will be made, {new_version!s} has already been released!"
         orange1_code = 214  # https://rich.readthedocs.io/en/stable/appendix/colors.html
 
@@ -602,20 +652,27 @@ def version(  # noqa: C901
         return
 
     if print_only or print_only_tag:
+        lazy_fetches.warn_if_fetched("evaluation of the next version")
         return
 
     # TODO: need a better way as this is inconsistent if releasing older version patches
-    if last_release := last_released(config.repo_dir, tag_format=config.tag_format):
+    if last_release := history.last_released:
         # If we have a last release, we can set the previous version for the
         # GitHub Actions output
         gha_output.prev_version = last_release[1]
 
-    with Repo(str(runtime.repo_dir)) as git_repo:
+    with disable_lazy_fetch(project.repo) if runtime.no_lazy_fetch else nullcontext():
         release_history = ReleaseHistory.from_git_history(
-            repo=git_repo,
+            repo=project.repo,
             translator=translator,
             commit_parser=parser,
             exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
+            snapshot=history,
+            cache=(
+                ReleaseHistoryCache(runtime.cache_dir)
+                if runtime.cache_dir is not None
+                else None
+            ),
         )
 
     rprint(f"[bold green]The next version is: [white]{new_version!s}[/white]! :rocket:")
@@ -702,6 +759,8 @@ def version(  # noqa: C901
         license_name="" if not isinstance(license_cfg, str) else license_cfg,
     )
 
+    lazy_fetches.warn_if_fetched("analysis of the history")
+
     # Preparing for committing changes; we always stage files even if we're not committing them in order to support a two-stage commit
     project.git_add(paths=all_paths_to_add, noop=opts.noop)
     if commit_changes:
@@ -732,8 +791,7 @@ def version(  # noqa: C901
             noop=opts.noop,
         )
 
-        with Repo(str(runtime.repo_dir)) as git_repo:
-            gha_output.commit_sha = git_repo.head.commit.hexsha
+        gha_output.commit_sha = project.repo.head.commit.hexsha
 
     if push_changes:
         remote_url = runtime.hvcs_client.remote_url(
@@ -769,44 +827,31 @@ def version(  # noqa: C901
                 click.echo("Unable to verify upstream due to error!", err=True)
                 ctx.exit(1)
 
-            # TODO: integrate into push branch
-            with Repo(str(runtime.repo_dir)) as git_repo:
-                active_branch = git_repo.active_branch.name
-
-            project.git_push_branch(
-                remote_url=remote_url,
-                branch=active_branch,
-                noop=opts.noop,
-            )
+        # Create or update partial tags for releases
+        partial_tags: list[str] = []
+        if create_tag and add_partial_tags and not prerelease:
+            partial_tags = [new_version.as_major_tag(), new_version.as_minor_tag()]
+            # If build metadata is set, also retag the version without the metadata
+            if build_metadata:
+                partial_tags.append(new_version.as_patch_tag())
+
+            for partial_tag in partial_tags:
+                project.git_tag(
+                    tag_name=partial_tag,
+                    message=f"{partial_tag} => {new_version.as_tag()}",
+                    isotimestamp=commit_date.isoformat(),
+                    noop=opts.noop,
+                    force=True,
+                )
 
-        if create_tag:
-            # push specific tag refspec (that we made) to remote
-            project.git_push_tag(
-                remote_url=remote_url,
-                tag=new_version.as_tag(),
-                noop=opts.noop,
-            )
-            # Create or update partial tags for releases
-            if add_partial_tags and not prerelease:
-                partial_tags = [new_version.as_major_tag(), new_version.as_minor_tag()]
-                # If build metadata is set, also retag the version without the metadata
-                if build_metadata:
-                    partial_tags.append(new_version.as_patch_tag())
-
-                for partial_tag in partial_tags:
-                    project.git_tag(
-                        tag_name=partial_tag,
-                        message=f"{partial_tag} => {new_version.as_tag()}",
-                        isotimestamp=commit_date.isoformat(),
-                        noop=opts.noop,
-                        force=True,
-                    )
-                    project.git_push_tag(
-                        remote_url=remote_url,
-                        tag=partial_tag,
-                        noop=opts.noop,
-                        force=True,
-                    )
+        # Push the release commit & all the tags in a single atomic push
+        project.git_push_refs(
+            remote_url=remote_url,
+            branches=[project.repo.active_branch.name] if commit_changes else [],
+            tags=[new_version.as_tag()] if create_tag else [],
+            force_tags=partial_tags,
+            noop=opts.noop,
+        )
 
     # Update GitHub Actions output value now that release has occurred
     gha_output.released = True
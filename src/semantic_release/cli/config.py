@@ -49,15 +49,18 @@ from semantic_release.cli.const import DEFAULT_CONFIG_FILE
 from semantic_release.cli.masking_filter import MaskingFilter
 from semantic_release.commit_parser import (
     AngularCommitParser,
+    CachedCommitParser,
     CommitParser,
     ConventionalCommitMonorepoParser,
     ConventionalCommitParser,
     EmojiCommitParser,
     ParseResult,
+    ParseResultCache,
     ParserOptions,
     ScipyCommitParser,
     TagCommitParser,
 )
+from semantic_release.commit_parser.cache import DEFAULT_CACHE_MAX_ENTRIES
 from semantic_release.const import COMMIT_MESSAGE, DEFAULT_COMMIT_AUTHOR
 from semantic_release.errors import (
     DetachedHeadGitError,
@@ -358,11 +361,18 @@ class PublishConfig(BaseModel):
     upload_to_vcs_release: bool = True
 
 
+class CacheConfig(BaseModel):
+    enabled: bool = False
+    directory: str = ".semantic_release_cache"
+    max_entries: int = Field(default=DEFAULT_CACHE_MAX_ENTRIES, gt=0)
+
+
 class RawConfig(BaseModel):
     assets: List[str] = []
     branches: Dict[str, BranchConfig] = {"main": BranchConfig()}
     build_command: Optional[str] = None
     build_command_env: List[str] = []
+    cache: CacheConfig = CacheConfig()
     changelog: ChangelogConfig = ChangelogConfig()
     commit_author: MaybeFromEnv = EnvConfigVar(
         env="GIT_COMMIT_AUTHOR", default=DEFAULT_COMMIT_AUTHOR
@@ -371,12 +381,15 @@ class RawConfig(BaseModel):
     commit_parser: NonEmptyString = "conventional"
     # It's up to the parser_options() method to validate these
     commit_parser_options: Dict[str, Any] = {}
+    commit_parser_workers: int = Field(default=1, ge=1)
+    incremental_unshallow: bool = False
     logging_use_named_masks: bool = False
     major_on_zero: bool = True
     allow_zero_version: bool = False
     repo_dir: Path = Field(default=cast("Path", "."), validate_default=True)
     remote: RemoteConfig = RemoteConfig()
     no_git_verify: bool = False
+    no_lazy_fetch: bool = False
     tag_format: str = "v{version}"
     add_partial_tags: bool = False
     publish: PublishConfig = PublishConfig()
@@ -558,12 +571,16 @@ class RuntimeContext:
 
     project_metadata: dict[str, Any]
     repo_dir: Path
+    cache_dir: Optional[Path]
     commit_parser: CommitParser[ParseResult, ParserOptions]
+    commit_parser_workers: int
     version_translator: VersionTranslator
     major_on_zero: bool
     allow_zero_version: bool
     prerelease: bool
     no_git_verify: bool
+    no_lazy_fetch: bool
+    incremental_unshallow: bool
     assets: List[str]
     commit_author: Actor
     commit_message: str
@@ -722,6 +739,20 @@ class RuntimeContext:
                 str.join("\n", [str(err), f"Failed to initialize {raw.commit_parser}"])
             ) from err
 
+        # Must use absolute after resolve because windows does not resolve if the path does not exist
+        cache_dir = (
+            Path(raw.cache.directory).expanduser().resolve().absolute()
+            if raw.cache.enabled
+            else None
+        )
+
+        if cache_dir is not None:
+            # Wrap the parser so results are re-used across runs
+            commit_parser = CachedCommitParser(
+                commit_parser,
+                cache=ParseResultCache(cache_dir, max_entries=raw.cache.max_entries),
+            )
+
         # We always exclude PSR's own release commits from the Changelog
         # when parsing commits
         psr_release_commit_regex = regexp(
@@ -896,7 +927,9 @@ class RuntimeContext:
         self = cls(
             project_metadata=project_metadata,
             repo_dir=raw.repo_dir,
+            cache_dir=cache_dir,
             commit_parser=commit_parser,
+            commit_parser_workers=raw.commit_parser_workers,
             version_translator=version_translator,
             major_on_zero=raw.major_on_zero,
             allow_zero_version=raw.allow_zero_version,
@@ -925,6 +958,8 @@ class RuntimeContext:
             global_cli_options=global_cli_options,
             masker=masker,
             no_git_verify=raw.no_git_verify,
+            no_lazy_fetch=raw.no_lazy_fetch,
+            incremental_unshallow=raw.incremental_unshallow,
         )
         # credential masker
         self.apply_log_masking(self.masker)
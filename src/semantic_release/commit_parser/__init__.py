@@ -6,6 +6,10 @@ from semantic_release.commit_parser.angular import (
     AngularCommitParser,
     AngularParserOptions,
 )
+from semantic_release.commit_parser.cache import (
+    CachedCommitParser,
+    ParseResultCache,
+)
 from semantic_release.commit_parser.conventional import (
     ConventionalCommitMonorepoParser,
     ConventionalCommitMonorepoParserOptions,
@@ -36,6 +40,8 @@ __all__ = [
     "ParserOptions",
     "AngularCommitParser",
     "AngularParserOptions",
+    "CachedCommitParser",
+    "ParseResultCache",
     "ConventionalCommitParser",
     "ConventionalCommitParserOptions",
     "ConventionalCommitMonorepoParser",
@@ -4,8 +4,11 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from semantic_release.commit_parser.token import ParseResultType
+from semantic_release.commit_parser.util import memoized_by_message
 
 if TYPE_CHECKING:  # pragma: no cover
+    from typing import Callable, Iterable
+
     from git.objects.commit import Commit
 
 
@@ -82,3 +85,60 @@ class CommitParser(ABC, Generic[_TT, _OPTS]):
 
     @abstractmethod
     def parse(self, commit: Commit) -> _TT | list[_TT]: ...
+
+    def parse_many(self, commits: Iterable[Commit]) -> list[_TT | list[_TT]]:
+        """
+        Parse a batch of commits and return the results in the same order as the
+        commits.
+
+        The default implementation calls :py:meth:`parse` for each commit. Parsers
+        which can share work between commits (ex. compiling patterns, querying an
+        issue tracker or memoizing results) can override this method to process the
+        whole batch at once; it is used whenever a range of the git history is parsed.
+
+        The built-in parsers implement :py:meth:`parse` through the :py:meth:`_parse`
+        & :py:meth:`_parse_commit` hooks around their ``parse_message`` method, which
+        lets this method parse each distinct commit message of the batch only once (ex.
+        repeated merge or revert messages).
+        """
+        if not self._parses_through_hooks():
+            return [self.parse(commit) for commit in commits]
+
+        parse_message = memoized_by_message(getattr(self, "parse_message"))  # noqa: B009
+
+        def parse_commit(commit: Commit) -> _TT:
+            return self._parse_commit(commit, parse_message)
+
+        return [self._parse(commit, parse_commit) for commit in commits]
+
+    def _parse(
+        self, commit: Commit, parse_commit: Callable[[Commit], _TT]
+    ) -> _TT | list[_TT]:
+        """
+        Parse a commit, using `parse_commit` to parse each of the commits it contains
+        (ex. the commits of a squashed merge).
+        """
+        raise NotImplementedError
+
+    def _parse_commit(self, commit: Commit, parse_message: Callable[..., Any]) -> _TT:
+        """Parse a single commit, using `parse_message` to parse its message."""
+        raise NotImplementedError
+
+    def _parses_through_hooks(self) -> bool:
+        """
+        Whether :py:meth:`parse` & ``parse_commit`` are the implementations provided
+        alongside the :py:meth:`_parse` & :py:meth:`_parse_commit` hooks, ie. they are
+        not overridden by a subclass of the parser which implements the hooks, nor
+        replaced on the instance itself.
+        """
+
+        def is_hook_method(name: str, hook_name: str) -> bool:
+            hook_cls = next(cls for cls in type(self).__mro__ if hook_name in vars(cls))
+            return hook_cls is not CommitParser and (
+                getattr(getattr(self, name, None), "__func__", None)
+                is getattr(hook_cls, name, None)
+            )
+
+        return is_hook_method("parse", "_parse") and is_hook_method(
+            "parse_commit", "_parse_commit"
+        )
@@ -23,9 +23,11 @@ from semantic_release.commit_parser.token import (
     ParseResult,
 )
 from semantic_release.commit_parser.util import (
+    CommitView,
     breaking_re,
-    deep_copy_commit,
     force_str,
+    issue_number_re,
+    issue_predicate_separator_re,
     parse_paragraphs,
 )
 from semantic_release.enums import LevelBump
@@ -34,6 +36,8 @@ from semantic_release.globals import logger
 from semantic_release.helpers import sort_numerically, text_reducer
 
 if TYPE_CHECKING:  # pragma: no cover
+    from typing import Callable
+
     from git.objects.commit import Commit
 
 
@@ -242,16 +246,15 @@ class AngularCommitParser(CommitParser[ParseResult, AngularParserOptions]):
 
         elif match := self.issue_selector.search(text):
             # if match := self.issue_selector.search(text):
-            predicate = regexp(r",? and | *[,;/& ] *").sub(
+            predicate = issue_predicate_separator_re.sub(
                 ",", match.group("issue_predicate") or ""
             )
             # Almost all issue trackers use a number to reference an issue so
             # we use a simple regexp to validate the existence of a number which helps filter out
             # any non-issue references that don't fit our expected format
-            has_number = regexp(r"\d+")
             new_issue_refs: set[str] = set(
                 filter(
-                    lambda issue_str, validator=has_number: validator.search(issue_str),  # type: ignore[arg-type]
+                    issue_number_re.search,
                     predicate.split(","),
                 )
             )
@@ -321,7 +324,12 @@ class AngularCommitParser(CommitParser[ParseResult, AngularParserOptions]):
         return len(commit.parents) > 1
 
     def parse_commit(self, commit: Commit) -> ParseResult:
-        if not (parsed_msg_result := self.parse_message(force_str(commit.message))):
+        return self._parse_commit(commit, self.parse_message)
+
+    def _parse_commit(
+        self, commit: Commit, parse_message: Callable[[str], ParsedMessageResult | None]
+    ) -> ParseResult:
+        if not (parsed_msg_result := parse_message(force_str(commit.message))):
             return _logged_parse_error(
                 commit,
                 f"Unable to parse commit message: {commit.message!r}",
@@ -341,6 +349,11 @@ class AngularCommitParser(CommitParser[ParseResult, AngularParserOptions]):
         multiple commits, each of which will be parsed separately. Single commits
         will be returned as a list of a single ParseResult.
         """
+        return self._parse(commit, self.parse_commit)
+
+    def _parse(
+        self, commit: Commit, parse_commit: Callable[[Commit], ParseResult]
+    ) -> ParseResult | list[ParseResult]:
         if self.options.ignore_merge_commits and self.is_merge_commit(commit):
             return _logged_parse_error(
                 commit, "Ignoring merge commit: %s" % commit.hexsha[:8]
@@ -353,9 +366,7 @@ class AngularCommitParser(CommitParser[ParseResult, AngularParserOptions]):
         )
 
         # Parse each commit individually if there were more than one
-        parsed_commits: list[ParseResult] = list(
-            map(self.parse_commit, separate_commits)
-        )
+        parsed_commits: list[ParseResult] = list(map(parse_commit, separate_commits))
 
         def add_linked_merge_request(
             parsed_result: ParseResult, mr_number: str
@@ -428,13 +439,8 @@ class AngularCommitParser(CommitParser[ParseResult, AngularParserOptions]):
 
         # Return a list of artificial commits (each with a single commit message)
         return [
-            # create a artificial commit object (copy of original but with modified message)
-            Commit(
-                **{
-                    **deep_copy_commit(commit),
-                    "message": commit_msg,
-                }
-            )
+            # create a view of the original commit with the separated message
+            CommitView(commit, commit_msg)
             for commit_msg in self.unsquash_commit_message(force_str(commit.message))
         ] or [commit]
 
@@ -0,0 +1,393 @@
+"""Persistent, on-disk cache of commit parse results"""
+
+from __future__ import annotations
+
+import atexit
+import importlib.metadata
+import json
+import sqlite3
+import time
+from dataclasses import asdict, is_dataclass
+from hashlib import sha256
+from pathlib import Path
+from threading import RLock
+from typing import TYPE_CHECKING, Any, cast
+
+from semantic_release.commit_parser._base import CommitParser, ParserOptions
+from semantic_release.commit_parser.token import ParsedCommit, ParseError, ParseResult
+from semantic_release.commit_parser.util import CommitView, force_str
+from semantic_release.enums import LevelBump
+from semantic_release.globals import logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Iterable
+
+    from git.objects.commit import Commit
+
+DEFAULT_CACHE_MAX_ENTRIES = 100_000
+
+_CACHE_DB_FILENAME = "parse_results.sqlite3"
+_CACHE_SCHEMA_VERSION = 1
+_FLUSH_THRESHOLD = 1000
+
+
+def parser_fingerprint(parser: CommitParser[Any, Any]) -> str:
+    """
+    Create a stable hash which identifies a parser's behavior, made from the
+    parser class, its options, and the version of python-semantic-release.
+
+    A change to any of these values produces a new fingerprint which implicitly
+    invalidates any previously cached results.
+    """
+    # A cached parser produces exactly the same results as the parser it wraps
+    if isinstance(parser, CachedCommitParser):
+        return parser.fingerprint
+
+    options = getattr(parser, "options", None)
+    options_state = (
+        asdict(options)
+        if is_dataclass(options) and not isinstance(options, type)
+        else getattr(options, "__dict__", options)
+    )
+    parser_cls = parser.__class__
+
+    try:
+        psr_version = importlib.metadata.version("python-semantic-release")
+    except importlib.metadata.PackageNotFoundError:
+        psr_version = "unknown"
+
+    return sha256(
+        str.join(
+            "\n",
+            [
+                f"schema={_CACHE_SCHEMA_VERSION}",
+                f"psr={psr_version}",
+                f"parser={parser_cls.__module__}.{parser_cls.__qualname__}",
+                f"options={options_state!r}",
+            ],
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def prepare_cache_dir(directory: Path) -> None:
+    """
+    Create the cache directory and, similar to mypy & pytest, keep it out of
+    version control.
+
+    :raises OSError: if the directory cannot be created
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    gitignore_file = directory / ".gitignore"
+    if not gitignore_file.exists():
+        gitignore_file.write_text(
+            "# Created by python-semantic-release automatically.\n*\n",
+            encoding="utf-8",
+        )
+
+
+class ParseResultCache:
+    """
+    A size-bounded key-value store of serialized parse results persisted to a
+    SQLite database inside of ``directory``.
+
+    SQLite provides the locking that makes it safe for multiple processes (ex.
+    parallel CI jobs sharing a cache directory) to read & write simultaneously.
+    Writes are buffered in memory and flushed in batches, at which time the least
+    recently used entries beyond ``max_entries`` are evicted.
+
+    Any failure to read or write the cache is logged and the cache disables itself
+    rather than interrupting a release.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be a positive integer")
+
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self._lock = RLock()
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = False
+        self._pending_writes: dict[tuple[str, str], str] = {}
+        self._pending_touches: set[tuple[str, str]] = set()
+        atexit.register(self.close)
+
+    @property
+    def db_file(self) -> Path:
+        return self.directory / _CACHE_DB_FILENAME
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._conn is not None or self._disabled:
+            return self._conn
+
+        try:
+            prepare_cache_dir(self.directory)
+            conn = sqlite3.connect(
+                str(self.db_file),
+                timeout=30,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                str.join(
+                    " ",
+                    [
+                        "CREATE TABLE IF NOT EXISTS parse_results (",
+                        "fingerprint TEXT NOT NULL,",
+                        "sha TEXT NOT NULL,",
+                        "payload TEXT NOT NULL,",
+                        "last_used REAL NOT NULL,",
+                        "PRIMARY KEY (fingerprint, sha))",
+                    ],
+                )
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_last_used ON parse_results (last_used)"
+            )
+            conn.commit()
+
+        except (OSError, sqlite3.Error) as err:
+            self._disable(err)
+            return None
+
+        self._conn = conn
+        return self._conn
+
+    def _disable(self, err: Exception) -> None:
+        logger.warning("Disabling the commit parse cache due to an error: %s", err)
+        self._disabled = True
+        self._pending_writes.clear()
+        self._pending_touches.clear()
+
+    def get(self, fingerprint: str, sha: str) -> Any | None:
+        key = (fingerprint, sha)
+        with self._lock:
+            if key in self._pending_writes:
+                return json.loads(self._pending_writes[key])
+
+            if (conn := self._connect()) is None:
+                return None
+
+            try:
+                row = conn.execute(
+                    "SELECT payload FROM parse_results WHERE fingerprint = ? AND sha = ?",
+                    key,
+                ).fetchone()
+            except sqlite3.Error as err:
+                self._disable(err)
+                return None
+
+            if row is None:
+                return None
+
+            self._pending_touches.add(key)
+            return json.loads(row[0])
+
+    def set(self, fingerprint: str, sha: str, payload: Any) -> None:
+        with self._lock:
+            if self._disabled:
+                return
+
+            self._pending_writes[(fingerprint, sha)] = json.dumps(payload)
+
+            if len(self._pending_writes) >= _FLUSH_THRESHOLD:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered entries to disk & evict the least recently used entries"""
+        with self._lock:
+            if not (self._pending_writes or self._pending_touches):
+                return
+
+            if (conn := self._connect()) is None:
+                return
+
+            now = time.time()
+            try:
+                with conn:
+                    conn.executemany(
+                        "UPDATE parse_results SET last_used = ? WHERE fingerprint = ? AND sha = ?",
+                        [(now, *key) for key in self._pending_touches],
+                    )
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO parse_results VALUES (?, ?, ?, ?)",
+                        [
+                            (*key, payload, now)
+                            for key, payload in self._pending_writes.items()
+                        ],
+                    )
+                    conn.execute(
+                        str.join(
+                            " ",
+                            [
+                                "DELETE FROM parse_results WHERE rowid IN (",
+                                "SELECT rowid FROM parse_results ORDER BY last_used ASC, rowid ASC",
+                                "LIMIT max(0, (SELECT count(*) FROM parse_results) - ?))",
+                            ],
+                        ),
+                        (self.max_entries,),
+                    )
+            except sqlite3.Error as err:
+                self._disable(err)
+                return
+
+            self._pending_writes.clear()
+            self._pending_touches.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def serialize_parse_results(
+    commit: Commit, parse_results: ParseResult | list[ParseResult]
+) -> dict[str, Any] | None:
+    """
+    Convert the results of parsing ``commit`` into a JSON serializable payload, or
+    None if any of the results is not a :py:class:`ParsedCommit` or
+    :py:class:`ParseError` (ex. a custom result type) as those cannot be rebuilt.
+    """
+    # NOTE: ParsedCommit & ParseError are tuples themselves so check the exact type
+    is_list = isinstance(parse_results, list) or type(parse_results) == tuple
+    results: list[ParseResult] = (
+        list(parse_results)  # type: ignore[arg-type]
+        if is_list
+        else [parse_results]  # type: ignore[list-item]
+    )
+    original_message = force_str(commit.message)
+    serialized_results: list[dict[str, Any]] = []
+
+    for result in results:
+        # Only our own result types are safe to rebuild, ignore anything custom
+        if type(result) not in (ParsedCommit, ParseError):
+            return None
+
+        result_message = force_str(result.commit.message)
+        # Only store the message when it differs, ie. an unsquashed commit
+        message = result_message if result_message != original_message else None
+
+        if isinstance(result, ParseError):
+            serialized_results.append(
+                {"kind": "error", "error": result.error, "message": message}
+            )
+            continue
+
+        serialized_results.append(
+            {
+                "kind": "commit",
+                "message": message,
+                **{
+                    field: value
+                    for field, value in result._asdict().items()
+                    if field != "commit"
+                },
+                "bump": int(result.bump),
+            }
+        )
+
+    return {"is_list": is_list, "results": serialized_results}
+
+
+def deserialize_parse_results(
+    commit: Commit, payload: dict[str, Any]
+) -> ParseResult | list[ParseResult]:
+    """Rebuild the results of parsing ``commit`` from a serialized payload"""
+    results: list[ParseResult] = []
+
+    for item in payload["results"]:
+        result_commit = (
+            commit
+            if item["message"] is None
+            # create a view of the original commit with the separated message
+            else CommitView(commit, item["message"])
+        )
+
+        if item["kind"] == "error":
+            results.append(ParseError(result_commit, error=item["error"]))
+            continue
+
+        results.append(
+            ParsedCommit(
+                bump=LevelBump(item["bump"]),
+                type=item["type"],
+                scope=item["scope"],
+                descriptions=list(item["descriptions"]),
+                breaking_descriptions=list(item["breaking_descriptions"]),
+                commit=result_commit,
+                release_notices=tuple(item["release_notices"]),
+                linked_issues=tuple(item["linked_issues"]),
+                linked_merge_request=item["linked_merge_request"],
+                include_in_changelog=item["include_in_changelog"],
+            )
+        )
+
+    return results if payload["is_list"] else results[0]
+
+
+class CachedCommitParser(CommitParser[ParseResult, ParserOptions]):
+    """
+    A commit parser which wraps another parser and persists its results in a
+    :py:class:`ParseResultCache` so that the commits of a repository only need to be
+    parsed once across multiple runs.
+
+    Results are keyed by the commit sha & the fingerprint of the wrapped parser. Only
+    :py:class:`ParsedCommit` and :py:class:`ParseError` results are cached, custom
+    result types are always delegated to the wrapped parser.
+    """
+
+    def __init__(self, parser: CommitParser[Any, Any], cache: ParseResultCache) -> None:
+        self.parser = parser
+        self.cache = cache
+        self.fingerprint = parser_fingerprint(parser)
+        # The options are passed through so that consumers can inspect the
+        # wrapped parser's configuration (ex. ignore_merge_commits)
+        super().__init__(parser.options)
+
+    def get_default_options(self) -> ParserOptions:
+        return self.parser.get_default_options()
+
+    def load(self, commit: Commit) -> ParseResult | list[ParseResult] | None:
+        """The cached results of parsing the commit, or None if not cached"""
+        if (payload := self.cache.get(self.fingerprint, commit.hexsha)) is None:
+            return None
+
+        logger.debug("using cached parse result for commit %s", commit.hexsha[:8])
+        return deserialize_parse_results(commit, payload)
+
+    def store(
+        self, commit: Commit, parse_results: ParseResult | list[ParseResult]
+    ) -> None:
+        """Cache the results of parsing the commit with the wrapped parser"""
+        if (payload := serialize_parse_results(commit, parse_results)) is not None:
+            self.cache.set(self.fingerprint, commit.hexsha, payload)
+
+    def parse(self, commit: Commit) -> ParseResult | list[ParseResult]:
+        if (parse_results := self.load(commit)) is not None:
+            return parse_results
+
+        parse_results = self.parser.parse(commit)
+        self.store(commit, parse_results)
+        return parse_results
+
+    def parse_many(
+        self, commits: Iterable[Commit]
+    ) -> list[ParseResult | list[ParseResult]]:
+        """Parse the commits missing from the cache as a single batch"""
+        commits = list(commits)
+        results = list(map(self.load, commits))
+        misses = [index for index, result in enumerate(results) if result is None]
+
+        for index, parse_results in zip(
+            misses, self.parser.parse_many([commits[index] for index in misses])
+        ):
+            self.store(commits[index], parse_results)
+            results[index] = parse_results
+
+        return cast("list[ParseResult | list[ParseResult]]", results)
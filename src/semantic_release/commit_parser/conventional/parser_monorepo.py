@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from fnmatch import fnmatch
+from fnmatch import translate
 from logging import getLogger
 from pathlib import Path, PurePath, PurePosixPath, PureWindowsPath
 from re import DOTALL, compile as regexp, error as RegexError  # noqa: N812
@@ -21,11 +21,18 @@ from semantic_release.commit_parser.token import (
     ParseError,
     ParseResult,
 )
-from semantic_release.commit_parser.util import force_str
+from semantic_release.commit_parser.util import (
+    changed_files_by_commit,
+    force_str,
+)
 from semantic_release.errors import InvalidParserOptions
 
 if TYPE_CHECKING:  # pragma: no cover
+    from re import Pattern
+    from typing import Callable, Iterable, Sequence
+
     from git.objects.commit import Commit
+    from git.repo.base import Repo
 
 
 class ConventionalCommitMonorepoParser(
@@ -71,6 +78,8 @@ class ConventionalCommitMonorepoParser(
                 )
             ) from err
 
+        self._commit_scope_pattern = commit_scope_pattern
+
         # This regular expression includes scope prefix into the pattern and forces a scope to be present
         # PSR will match the full scope but we don't include it in the scope match,
         # which implicitly strips it from being included in the returned scope.
@@ -108,6 +117,9 @@ class ConventionalCommitMonorepoParser(
         self._file_selection_filters: list[str] = file_select_filters
         self._file_ignore_filters: list[str] = file_ignore_filters
 
+        # The sandboxed path filters by git root & working directory
+        self._repo_path_filters: dict[tuple[str, str], _RepoPathFilters] = {}
+
         self._logger = getLogger(
             str.join(".", [self.__module__, self.__class__.__name__])
         )
@@ -245,6 +257,11 @@ class ConventionalCommitMonorepoParser(
         return ParseError(commit, error=error)
 
     def parse(self, commit: Commit) -> ParseResult | list[ParseResult]:
+        return self._parse(commit, self.parse_commit)
+
+    def _parse(
+        self, commit: Commit, parse_commit: Callable[[Commit], ParseResult]
+    ) -> ParseResult | list[ParseResult]:
         if self.options.ignore_merge_commits and self._base_parser.is_merge_commit(
             commit
         ):
@@ -252,6 +269,17 @@ class ConventionalCommitMonorepoParser(
                 commit, "Ignoring merge commit: %s" % commit.hexsha[:8]
             )
 
+        # Without any changes in the package (as found by git) & without the package
+        # scope, the commit can only result in a parse error so skip parsing it
+        if not self._get_changed_files(commit) and not (
+            self.options.scope_prefix
+            and self._commit_scope_pattern.search(force_str(commit.message))
+        ):
+            return self.logged_parse_error(
+                commit,
+                f"Commit {commit.hexsha[:7]} has no changed files matching the path filter(s)",
+            )
+
         separate_commits: list[Commit] = (
             self._base_parser.unsquash_commit(commit)
             if self.options.parse_squash_commits
@@ -259,9 +287,7 @@ class ConventionalCommitMonorepoParser(
         )
 
         # Parse each commit individually if there were more than one
-        parsed_commits: list[ParseResult] = list(
-            map(self.parse_commit, separate_commits)
-        )
+        parsed_commits: list[ParseResult] = list(map(parse_commit, separate_commits))
 
         def add_linked_merge_request(
             parsed_result: ParseResult, mr_number: str
@@ -313,6 +339,19 @@ class ConventionalCommitMonorepoParser(
 
         return parsed_commits
 
+    def parse_many(
+        self, commits: Iterable[Commit]
+    ) -> list[ParseResult | list[ParseResult]]:
+        """
+        Parse a batch of commits, loading the changed files of every commit with a
+        single git process & parsing each distinct commit message only once (ex.
+        repeated merge or revert messages).
+        """
+        commits = list(commits)
+        self._load_changed_files(commits)
+
+        return super().parse_many(commits)
+
     def parse_message(
         self, message: str, strict_scope: bool = False
     ) -> ParsedMessageResult | None:
@@ -331,6 +370,13 @@ class ConventionalCommitMonorepoParser(
 
     def parse_commit(self, commit: Commit) -> ParseResult:
         """Attempt to parse the commit message with a regular expression into a ParseResult."""
+        return self._parse_commit(commit, self.parse_message)
+
+    def _parse_commit(
+        self,
+        commit: Commit,
+        parse_message: Callable[[str, bool], ParsedMessageResult | None],
+    ) -> ParseResult:
         # Multiple scenarios to consider when parsing a commit message [Truth table]:
         # =======================================================================================================
         # |    ||                         INPUTS                         ||                                     |
@@ -367,10 +413,7 @@ class ConventionalCommitMonorepoParser(
         strict_scope = bool(
             not has_relevant_changed_files and self.options.scope_prefix
         )
-        pmsg_result = self.parse_message(
-            message=force_str(commit.message),
-            strict_scope=strict_scope,
-        )
+        pmsg_result = parse_message(force_str(commit.message), strict_scope)
 
         if pmsg_result and (has_relevant_changed_files or strict_scope):
             self._logger.debug(
@@ -387,7 +430,7 @@ class ConventionalCommitMonorepoParser(
                 f"Commit {commit.hexsha[:7]} has no changed files matching the path filter(s)",
             )
 
-        if strict_scope and self.parse_message(str(commit.message), strict_scope=False):
+        if strict_scope and parse_message(force_str(commit.message), False):
             return self.logged_parse_error(
                 commit,
                 str.join(
@@ -407,14 +450,49 @@ class ConventionalCommitMonorepoParser(
     def unsquash_commit_message(self, message: str) -> list[str]:
         return self._base_parser.unsquash_commit_message(message)
 
-    def _has_relevant_changed_files(self, commit: Commit) -> bool:
-        # Extract git root from commit
-        git_root = (
-            Path(commit.repo.working_tree_dir or commit.repo.working_dir)
-            .absolute()
-            .resolve()
+    def _load_changed_files(self, commits: Iterable[Commit]) -> None:
+        """
+        Load the changed files of all the commits that are not loaded yet, limited to
+        the paths selected by the path filters
+        """
+        commits = list(commits)
+        if not commits:
+            return
+
+        path_filters = self._get_path_filters(commits[0].repo)
+        unloaded = {
+            commit.hexsha
+            for commit in commits
+            if commit.hexsha not in path_filters.changed_files
+        }
+        if not unloaded:
+            return
+
+        path_filters.changed_files.update(
+            changed_files_by_commit(commits[0].repo, unloaded, path_filters.pathspecs)
+            if path_filters.selection_matcher is not None
+            else dict.fromkeys(unloaded, ())
         )
 
+    def _get_changed_files(self, commit: Commit) -> tuple[str, ...]:
+        path_filters = self._get_path_filters(commit.repo)
+        if commit.hexsha not in path_filters.changed_files:
+            self._load_changed_files([commit])
+
+        return path_filters.changed_files[commit.hexsha]
+
+    def _get_path_filters(self, repo: Repo) -> _RepoPathFilters:
+        """
+        The path filters sandboxed to the repository, created once per git root &
+        working directory.
+        """
+        cache_key = (str(repo.working_tree_dir or repo.working_dir), os.getcwd())
+        if cache_key in self._repo_path_filters:
+            return self._repo_path_filters[cache_key]
+
+        # Extract git root from the repository
+        git_root = Path(cache_key[0]).absolute().resolve()
+
         cwd = Path.cwd().absolute().resolve()
 
         rel_cwd = cwd.relative_to(git_root) if git_root in cwd.parents else Path(".")
@@ -445,23 +523,95 @@ class ConventionalCommitMonorepoParser(
             if git_root in file_filter.parents
         ]
 
-        # Check if the changed files of the commit that match the path filters
-        for full_path in iter(
-            str(git_root / rel_git_path) for rel_git_path in commit.stats.files
-        ):
+        self._repo_path_filters[cache_key] = _RepoPathFilters(
+            git_root=str(git_root),
+            selection_filters=sandboxed_selection_filters,
+            ignore_filters=sandboxed_ignore_filters,
+        )
+        return self._repo_path_filters[cache_key]
+
+    def _has_relevant_changed_files(self, commit: Commit) -> bool:
+        path_filters = self._get_path_filters(commit.repo)
+        if path_filters.selection_matcher is None:
+            return False
+
+        # Check if any of the changed files of the commit match the path filters
+        for rel_git_path in self._get_changed_files(commit):
+            full_path = os.path.normcase(
+                os.path.join(path_filters.git_root, rel_git_path)
+            )
+
             # Check if the filepath matches any of the file selection filters
-            if not any(
-                fnmatch(full_path, select_filter)
-                for select_filter in sandboxed_selection_filters
-            ):
+            if not path_filters.selection_matcher.match(full_path):
                 continue
 
             # Pass filter matches, so now evaluate if it is supposed to be ignored
-            if not any(
-                fnmatch(full_path, ignore_filter)
-                for ignore_filter in sandboxed_ignore_filters
+            if path_filters.ignore_matcher is None or not (
+                path_filters.ignore_matcher.match(full_path)
             ):
                 # No ignore filter matched, so it must be a relevant file
                 return True
 
         return False
+
+
+class _RepoPathFilters:
+    """The path filters of a parser, sandboxed to a git root & working directory"""
+
+    def __init__(
+        self,
+        git_root: str,
+        selection_filters: Sequence[str],
+        ignore_filters: Sequence[str],
+    ) -> None:
+        self.git_root = git_root
+        self.selection_matcher = _compile_fnmatch_patterns(selection_filters)
+        self.ignore_matcher = _compile_fnmatch_patterns(ignore_filters)
+        self.pathspecs = _fnmatch_patterns_to_pathspecs(git_root, selection_filters)
+        # The changed files (matching the pathspecs) of each commit by sha
+        self.changed_files: dict[str, tuple[str, ...]] = {}
+
+
+def _fnmatch_patterns_to_pathspecs(
+    git_root: str, patterns: Sequence[str]
+) -> tuple[str, ...]:
+    """
+    Convert the absolute fnmatch patterns into git pathspecs which match at least
+    every path matched by the patterns, so git can skip the rest of the tree when
+    comparing commits. Like fnmatch, the wildcards of a pathspec match across
+    directories.
+
+    Returns no pathspecs (i.e. all paths) when a pattern cannot be safely converted
+    """
+    # fnmatch & git disagree on backslashes & negated character classes
+    if any(char in pattern for pattern in patterns for char in "[\\"):
+        return ()
+
+    magic = "top" if os.path.normcase("A") == "A" else "top,icase"
+    pathspecs: list[str] = []
+    for pattern in patterns:
+        rel_pattern = PurePath(pattern).relative_to(git_root)
+        # A path from git never contains "..", so neither can a matching pattern
+        if ".." in rel_pattern.parts:
+            continue
+
+        pathspecs.append(f":({magic}){rel_pattern.as_posix()}")
+
+    return tuple(pathspecs)
+
+
+def _compile_fnmatch_patterns(patterns: Sequence[str]) -> Pattern[str] | None:
+    """
+    Combine the fnmatch patterns into a single regular expression, which matches a
+    (normcase'd) path exactly when ``fnmatch`` would match any of the patterns, or
+    None if there are no patterns.
+    """
+    if not patterns:
+        return None
+
+    return regexp(
+        str.join(
+            "|",
+            [f"(?:{translate(os.path.normcase(pattern))})" for pattern in patterns],
+        )
+    )
@@ -7,7 +7,7 @@ from functools import reduce
 from itertools import zip_longest
 from re import compile as regexp
 from textwrap import dedent
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 
 from git.objects.commit import Commit
 from pydantic.dataclasses import dataclass
@@ -20,8 +20,10 @@ from semantic_release.commit_parser.token import (
     ParseResult,
 )
 from semantic_release.commit_parser.util import (
-    deep_copy_commit,
+    CommitView,
     force_str,
+    issue_number_re,
+    issue_predicate_separator_re,
     parse_paragraphs,
 )
 from semantic_release.enums import LevelBump
@@ -29,6 +31,9 @@ from semantic_release.errors import InvalidParserOptions
 from semantic_release.globals import logger
 from semantic_release.helpers import sort_numerically, text_reducer
 
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Callable
+
 
 @dataclass
 class EmojiParserOptions(ParserOptions):
@@ -245,16 +250,15 @@ class EmojiCommitParser(CommitParser[ParseResult, EmojiParserOptions]):
         if self.options.parse_linked_issues and (
             match := self.issue_selector.search(text)
         ):
-            predicate = regexp(r",? and | *[,;/& ] *").sub(
+            predicate = issue_predicate_separator_re.sub(
                 ",", match.group("issue_predicate") or ""
             )
             # Almost all issue trackers use a number to reference an issue so
             # we use a simple regexp to validate the existence of a number which helps filter out
             # any non-issue references that don't fit our expected format
-            has_number = regexp(r"\d+")
             new_issue_refs: set[str] = set(
                 filter(
-                    lambda issue_str, validator=has_number: validator.search(issue_str),  # type: ignore[arg-type]
+                    issue_number_re.search,
                     predicate.split(","),
                 )
             )
@@ -326,8 +330,13 @@ class EmojiCommitParser(CommitParser[ParseResult, EmojiParserOptions]):
         return len(commit.parents) > 1
 
     def parse_commit(self, commit: Commit) -> ParseResult:
+        return self._parse_commit(commit, self.parse_message)
+
+    def _parse_commit(
+        self, commit: Commit, parse_message: Callable[[str], ParsedMessageResult]
+    ) -> ParseResult:
         return ParsedCommit.from_parsed_message_result(
-            commit, self.parse_message(force_str(commit.message))
+            commit, parse_message(force_str(commit.message))
         )
 
     def parse(self, commit: Commit) -> ParseResult | list[ParseResult]:
@@ -338,6 +347,11 @@ class EmojiCommitParser(CommitParser[ParseResult, EmojiParserOptions]):
         multiple commits, each of which will be parsed separately. Single commits
         will be returned as a list of a single ParseResult.
         """
+        return self._parse(commit, self.parse_commit)
+
+    def _parse(
+        self, commit: Commit, parse_commit: Callable[[Commit], ParseResult]
+    ) -> ParseResult | list[ParseResult]:
         if self.options.ignore_merge_commits and self.is_merge_commit(commit):
             err_msg = "Ignoring merge commit: %s" % commit.hexsha[:8]
             logger.debug(err_msg)
@@ -350,9 +364,7 @@ class EmojiCommitParser(CommitParser[ParseResult, EmojiParserOptions]):
         )
 
         # Parse each commit individually if there were more than one
-        parsed_commits: list[ParseResult] = list(
-            map(self.parse_commit, separate_commits)
-        )
+        parsed_commits: list[ParseResult] = list(map(parse_commit, separate_commits))
 
         def add_linked_merge_request(
             parsed_result: ParseResult, mr_number: str
@@ -412,13 +424,8 @@ class EmojiCommitParser(CommitParser[ParseResult, EmojiParserOptions]):
         #
         # Return a list of artificial commits (each with a single commit message)
         return [
-            # create a artificial commit object (copy of original but with modified message)
-            Commit(
-                **{
-                    **deep_copy_commit(commit),
-                    "message": commit_msg,
-                }
-            )
+            # create a view of the original commit with the separated message
+            CommitView(commit, commit_msg)
             for commit_msg in self.unsquash_commit_message(force_str(commit.message))
         ] or [commit]
 
@@ -0,0 +1,160 @@
+"""Parsing of commits in a pool of worker processes"""
+
+from __future__ import annotations
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any
+
+from git.objects.commit import Commit
+from git.repo.base import Repo
+from git.util import hex_to_bin
+
+from semantic_release.commit_parser.cache import (
+    CachedCommitParser,
+    deserialize_parse_results,
+    serialize_parse_results,
+)
+from semantic_release.commit_parser.util import force_str
+from semantic_release.globals import logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Iterable
+
+    from semantic_release.commit_parser._base import CommitParser
+    from semantic_release.commit_parser.token import ParseResult
+
+# Below this many commits, starting the worker processes costs more than it saves
+DEFAULT_MIN_PARALLEL_COMMITS = 256
+
+# The state of each worker process, set once by the pool's initializer
+_worker_parser: CommitParser[Any, Any] | None = None
+_worker_repo: Repo | None = None
+
+
+def _init_worker(commit_parser: CommitParser[ParseResult, Any], git_dir: str) -> None:
+    global _worker_parser, _worker_repo  # noqa: PLW0603
+    _worker_parser = commit_parser
+    _worker_repo = Repo(git_dir)
+
+
+def _parse_in_worker(
+    items: list[tuple[str, str, tuple[str, ...]]],
+) -> list[dict[str, Any] | None]:
+    if _worker_parser is None or _worker_repo is None:
+        raise RuntimeError("Parse worker used before initialization")
+
+    # The rest of the commits' attributes are lazily loaded by GitPython if used
+    commits = [
+        Commit(
+            _worker_repo,
+            hex_to_bin(sha),
+            message=message,
+            parents=[
+                Commit(_worker_repo, hex_to_bin(parent)) for parent in parent_shas
+            ],
+        )
+        for sha, message, parent_shas in items
+    ]
+    return [
+        serialize_parse_results(commit, parse_results)
+        for commit, parse_results in zip(commits, _worker_parser.parse_many(commits))
+    ]
+
+
+def parse_commits_in_parallel(
+    commit_parser: CommitParser[ParseResult, Any],
+    repo: Repo,
+    commits: Iterable[Commit],
+    max_workers: int,
+    min_commits: int = DEFAULT_MIN_PARALLEL_COMMITS,
+) -> list[ParseResult | list[ParseResult]]:
+    """
+    Parse the commits with a pool of ``max_workers`` processes and return the
+    results in the same order as the commits.
+
+    Only the sha, message & parent shas of each commit are sent to the workers, which
+    return their results in a serialized form to be rebuilt around the original commit
+    objects. Results which cannot be serialized (ex. custom result types), as well as
+    any commits when the parser cannot be sent to the workers, are parsed within the
+    current process instead. Every process parses its commits in batches with the
+    parser's ``parse_many`` method. When the parser is a :py:class:`CachedCommitParser`, only
+    the commits missing from the cache are sent to the workers.
+    """
+    commits = list(commits)
+    cached_parser = (
+        commit_parser if isinstance(commit_parser, CachedCommitParser) else None
+    )
+    parser: CommitParser[ParseResult, Any] = (
+        cached_parser.parser if cached_parser is not None else commit_parser
+    )
+
+    results: dict[int, ParseResult | list[ParseResult]] = {}
+    pending: list[int] = []
+    for index, commit in enumerate(commits):
+        if cached_parser is not None and (
+            (cached_results := cached_parser.load(commit)) is not None
+        ):
+            results[index] = cached_results
+            continue
+
+        pending.append(index)
+
+    payloads: list[dict[str, Any] | None] = [None] * len(pending)
+    if max_workers > 1 and len(pending) >= max(min_commits, 1):
+        logger.info(
+            "parsing %s commits with %s worker processes", len(pending), max_workers
+        )
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(parser, str(repo.git_dir)),
+            ) as executor:
+                items = [
+                    (
+                        commits[index].hexsha,
+                        force_str(commits[index].message),
+                        tuple(parent.hexsha for parent in commits[index].parents),
+                    )
+                    for index in pending
+                ]
+                # Each worker parses a batch of commits at a time with parse_many()
+                batch_size = max(1, len(items) // (max_workers * 4))
+                payloads = [
+                    payload
+                    for batch in executor.map(
+                        _parse_in_worker,
+                        [
+                            items[start : start + batch_size]
+                            for start in range(0, len(items), batch_size)
+                        ],
+                    )
+                    for payload in batch
+                ]
+
+        except (BrokenProcessPool, pickle.PicklingError, AttributeError) as err:
+            logger.warning(
+                "Unable to parse commits in parallel, parsing serially instead: %s",
+                err,
+            )
+            payloads = [None] * len(pending)
+
+    unparsed: list[int] = []
+    for index, payload in zip(pending, payloads):
+        if payload is None:
+            unparsed.append(index)
+            continue
+
+        results[index] = deserialize_parse_results(commits[index], payload)
+
+    results.update(
+        zip(unparsed, parser.parse_many([commits[index] for index in unparsed]))
+    )
+
+    if cached_parser is not None:
+        for index in pending:
+            cached_parser.store(commits[index], results[index])
+
+    return [results[index] for index in range(len(commits))]
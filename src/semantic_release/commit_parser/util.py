@@ -4,26 +4,37 @@ from contextlib import suppress
 from copy import deepcopy
 from functools import reduce
 from re import MULTILINE, compile as regexp
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
+
+from git.objects.commit import Commit
 
 # TODO: remove in v11
 from semantic_release.helpers import (
     sort_numerically,  # noqa: F401 # TODO: maintained for compatibility
+    stream_git_records,
 )
 
 if TYPE_CHECKING:  # pragma: no cover
     from re import Pattern
-    from typing import Any, TypedDict
+    from typing import Any, Callable, Hashable, Iterable, Sequence, TypedDict
 
-    from git import Commit
+    from git import Repo
 
     class RegexReplaceDef(TypedDict):
         pattern: Pattern
         repl: str
 
 
+_R = TypeVar("_R")
+
 breaking_re = regexp(r"BREAKING[ -]CHANGE:\s?(.*)")
 
+# Separates the issue references of an issue footer (ex. "Closes: #12, #13 and #14")
+issue_predicate_separator_re = regexp(r",? and | *[,;/& ] *")
+
+# Almost all issue trackers use a number to reference an issue
+issue_number_re = regexp(r"\d+")
+
 un_word_wrap: RegexReplaceDef = {
     # Match a line ending where the next line is not indented, or a bullet
     "pattern": regexp(r"((?<!-)\n(?![\s*-]))"),
@@ -99,6 +110,49 @@ def force_str(msg: str | bytes | bytearray | memoryview) -> str:
     )
 
 
+class CommitView(Commit):
+    """
+    A read-only view of a commit with a different commit message, as created when
+    a squashed commit is separated into one commit per squashed commit message.
+
+    Every other attribute (sha, parents, author, dates, etc.) is shared with the
+    original commit when first accessed, so no data is copied and the commit object
+    is only loaded from the repository once, by the original commit. The message
+    is decoded once when the view is created.
+    """
+
+    __slots__ = ("_commit",)
+
+    def __init__(self, commit: Commit, message: str | bytes) -> None:
+        if isinstance(commit, CommitView):
+            commit = commit.commit
+
+        # The attributes are set directly as the view is otherwise read-only
+        object.__setattr__(self, "_commit", commit)
+        object.__setattr__(self, "repo", commit.repo)
+        object.__setattr__(self, "binsha", commit.binsha)
+        object.__setattr__(self, "message", force_str(message))
+
+    def _set_cache_(self, attr: str) -> None:
+        # Share the (lazily loaded) value of the original commit
+        object.__setattr__(self, attr, getattr(self._commit, attr))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __reduce__(self) -> tuple[type[CommitView], tuple[Commit, str | bytes]]:
+        return (self.__class__, (self._commit, self.message))
+
+    @property
+    def commit(self) -> Commit:
+        """The original commit"""
+        return self._commit
+
+
+# TODO: remove in v11, replaced by CommitView
 def deep_copy_commit(commit: Commit) -> dict[str, Any]:
     keys = [
         "repo",
@@ -127,3 +181,87 @@ def deep_copy_commit(commit: Commit) -> dict[str, Any]:
                 kwargs[key] = deepcopy(value)
 
     return kwargs
+
+
+def memoized_by_message(parse_message: Callable[..., _R]) -> Callable[..., _R]:
+    """
+    Wrap a parser's ``parse_message`` method so that each distinct commit message (&
+    positional arguments) is only parsed once and the same result is returned for any
+    repeated message.
+
+    Used by the built-in parsers to share work between the commits of a single
+    ``parse_many`` call, as merge, revert & release commits frequently repeat the
+    same message. The memo belongs to the returned function, so it is never shared
+    between batches or threads. The parsed message results are immutable, so they
+    are safe to share between commits.
+    """
+    parsed_messages: dict[tuple[Hashable, ...], _R] = {}
+
+    def parse_message_once(message: str, *args: Hashable) -> _R:
+        key = (message, *args)
+        if key not in parsed_messages:
+            parsed_messages[key] = parse_message(message, *args)
+
+        return parsed_messages[key]
+
+    return parse_message_once
+
+
+def changed_files_by_commit(
+    repo: Repo, commit_shas: Iterable[str], pathspecs: Sequence[str] = ()
+) -> dict[str, tuple[str, ...]]:
+    """
+    Find the paths (relative to the repository root) changed by each of the commits
+    with a single ``git log`` process.
+
+    Only the trees of the commits are compared so no file contents are read. As with
+    GitPython's ``Commit.stats``, renames are reported as a deletion & an addition,
+    merge commits are compared to their first parent and the root commit is compared
+    to an empty tree.
+
+    :param pathspecs: git pathspecs to limit the comparison to, when given only the
+        changed paths matching a pathspec are returned and git does not descend into
+        any other directories of the trees
+    """
+    commit_shas = list(commit_shas)
+    if not commit_shas:
+        return {}
+
+    changed_files: dict[str, list[str]] = {}
+    commit_files: list[str] = []
+    is_header = False
+    # Each commit is output as "\0<sha>\0\n<path>\0<path>\0...", with --no-walk
+    # the --first-parent option only limits the diff of merge commits to their first
+    # parent. Commits without any matching changes are not output.
+    for record in stream_git_records(
+        repo,
+        "log",
+        "--no-walk",
+        "--stdin",
+        "--no-show-signature",
+        "--first-parent",
+        "-m",
+        "--root",
+        "--no-renames",
+        "--name-only",
+        "-z",
+        "--format=%x00%H",
+        "--",
+        *pathspecs,
+        stdin=str.join("", [f"{sha}\n" for sha in commit_shas]),
+    ):
+        if not record:
+            is_header = True
+            continue
+
+        if is_header:
+            is_header = False
+            commit_files = changed_files.setdefault(record, [])
+            continue
+
+        # The first path is separated from the header by a newline
+        commit_files.append(
+            record[1:] if not commit_files and record.startswith("\n") else record
+        )
+
+    return {sha: tuple(changed_files.get(sha, ())) for sha in commit_shas}
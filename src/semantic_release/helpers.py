@@ -5,9 +5,12 @@ import os
 import re
 import string
 import sys
+from contextlib import contextmanager, suppress
 from functools import lru_cache, reduce, wraps
+from io import DEFAULT_BUFFER_SIZE
 from pathlib import Path, PurePosixPath
 from re import IGNORECASE, compile as regexp
+from subprocess import PIPE
 from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Sequence, TypeVar
 from urllib.parse import urlsplit, urlunsplit
 
@@ -16,7 +19,10 @@ from semantic_release.globals import logger
 if TYPE_CHECKING:  # pragma: no cover
     from logging import Logger
     from re import Pattern
-    from typing import Iterable
+    from typing import Iterable, Iterator
+
+    from git.cmd import Git
+    from git.repo.base import Repo
 
 
 number_pattern = regexp(r"(?P<prefix>\S*?)(?P<number>\d[\d,]*)\b")
@@ -307,3 +313,178 @@ def parse_git_url(url: str) -> ParsedGitUrl:
         namespace=namespace,
         repo_name=name,
     )
+
+
+def _start_git_process(
+    repo: Repo, command: str, args: Sequence[str], stdin: str | None
+) -> Git.AutoInterrupt:
+    proc = getattr(repo.git, command)(
+        *args,
+        as_process=True,
+        istream=(PIPE if stdin is not None else None),
+    )
+    if stdin is not None:
+        # git reads all of its input before it produces any output
+        proc.stdin.write(stdin.encode("utf-8"))
+        proc.stdin.close()
+
+    return proc
+
+
+def stream_git_lines(
+    repo: Repo, command: str, *args: str, stdin: str | None = None
+) -> Iterator[str]:
+    """
+    Run a git command as a single subprocess and yield its output line by line
+    as the process produces it, rather than buffering the entire output in memory.
+
+    :param stdin: text to write to the standard input of the git process
+
+    :raises GitCommandError: if the git command exits with a non-zero status
+    """
+    proc = _start_git_process(repo, command, args, stdin)
+    try:
+        for raw_line in proc.stdout:
+            if line := raw_line.decode("utf-8").rstrip("\n"):
+                yield line
+    finally:
+        # Validates the exit status & raises GitCommandError on failure
+        proc.wait()
+
+
+def stream_git_records(
+    repo: Repo, command: str, *args: str, stdin: str | None = None
+) -> Iterator[str]:
+    """
+    Run a git command as a single subprocess and yield each of the NUL delimited
+    records of its output (ex. from ``git log -z``) as the process produces them.
+
+    :param stdin: text to write to the standard input of the git process
+
+    :raises GitCommandError: if the git command exits with a non-zero status
+    """
+    proc = _start_git_process(repo, command, args, stdin)
+    try:
+        remainder = b""
+        for chunk in iter(lambda: proc.stdout.read(DEFAULT_BUFFER_SIZE), b""):
+            *records, remainder = (remainder + chunk).split(b"\0")
+            for record in records:
+                yield record.decode("utf-8", errors="replace")
+
+        if remainder:
+            yield remainder.decode("utf-8", errors="replace")
+    finally:
+        # Validates the exit status & raises GitCommandError on failure
+        proc.wait()
+
+
+class LazyFetchCounter:
+    """
+    Count the missing objects that a partial clone (ex. ``git clone --filter=blob:none``)
+    lazily fetches from its promisor remote, such as the contents of files read by a
+    custom commit parser. Analysing the history only needs commits & trees, but each
+    read of a missing blob is a network round-trip that can slow a long history down.
+
+    A repository is a partial clone when it is configured with a promisor remote.
+    Every fetch from a promisor remote is stored in its own ``.promisor`` pack, so the
+    objects fetched are counted from the packs added since the counter was created.
+    """
+
+    def __init__(self, repo: Repo) -> None:
+        self._pack_dir = Path(repo.common_dir, "objects", "pack")
+        self._known_packs = self._promisor_packs()
+        self._is_partial_clone = _has_promisor_remote(repo)
+
+    def _promisor_packs(self) -> set[Path]:
+        if not self._pack_dir.is_dir():
+            return set()
+
+        return set(self._pack_dir.glob("*.promisor"))
+
+    @property
+    def is_partial_clone(self) -> bool:
+        return self._is_partial_clone
+
+    def count(self) -> int:
+        """
+        Return the number of objects fetched since the counter was created (or since
+        the last call to :py:meth:`warn_if_fetched`).
+        """
+        return sum(
+            _count_pack_objects(promisor_pack.with_suffix(".idx"))
+            for promisor_pack in self._promisor_packs() - self._known_packs
+        )
+
+    def warn_if_fetched(self, operation: str) -> int:
+        """
+        Log a warning when objects were fetched since the counter was created (or
+        since the last call), then start counting again.
+
+        :return: The number of objects fetched
+        """
+        if not self.is_partial_clone:
+            return 0
+
+        if fetched_objects := self.count():
+            logger.warning(
+                str.join(
+                    " ",
+                    [
+                        "The %s fetched %s missing objects from the remote of this",
+                        "partial clone, which is slow for a long history. Enable the",
+                        "no_lazy_fetch setting (git v2.44+) to make such reads fail instead.",
+                    ],
+                ),
+                operation,
+                fetched_objects,
+            )
+
+        self._known_packs = self._promisor_packs()
+        return fetched_objects
+
+
+def _has_promisor_remote(repo: Repo) -> bool:
+    """
+    Check if a repository is configured with a promisor remote, as done by a partial
+    clone (``extensions.partialClone``) or for any remote (``remote.<name>.promisor``)
+    """
+    with repo.config_reader() as config:
+        return bool(config.get_value("extensions", "partialclone", default="")) or any(
+            config.get_value(section, "promisor", default=False) is True
+            for section in config.sections()
+            if section.startswith("remote ")
+        )
+
+
+@contextmanager
+def disable_lazy_fetch(repo: Repo) -> Iterator[None]:
+    """
+    Within the context, every git command run for a repository fails to read an
+    object missing from a partial clone, rather than lazily fetching it from the
+    promisor remote. The previous environment is restored when the context exits.
+
+    Sets ``GIT_NO_LAZY_FETCH=1`` in the environment of the repository's git commands,
+    which is ignored before git v2.44.
+    """
+    previous_env = repo.git.update_environment(GIT_NO_LAZY_FETCH="1")
+    # Restart the persistent git processes (ex. cat-file) with the new environment
+    repo.git.clear_cache()
+    try:
+        yield
+    finally:
+        repo.git.update_environment(**previous_env)
+        repo.git.clear_cache()
+
+
+def _count_pack_objects(index_file: Path) -> int:
+    """Read the number of objects in a pack from the header of its index file"""
+    with suppress(OSError), index_file.open("rb") as fd:
+        header = fd.read(8 + 256 * 4)
+        # Version 2+ indexes start with a magic number & a version before the fan-out
+        # table, whose last entry is the total number of objects
+        fanout_offset = 8 if header[:4] == b"\377tOc" else 0
+        return int.from_bytes(
+            header[fanout_offset + 255 * 4 : fanout_offset + 256 * 4], "big"
+        )
+
+    return 0
@@ -1,5 +1,6 @@
 import semantic_release.version.declaration as declaration
 from semantic_release.version.algorithm import (
+    latest_tags_and_versions,
     next_version,
     tags_and_versions,
 )
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 import logging
-from contextlib import suppress
-from functools import reduce
-from queue import LifoQueue
 from typing import TYPE_CHECKING, Iterable
 
+from git.refs.tag import TagReference
+
 from semantic_release.commit_parser import ParsedCommit
 from semantic_release.commit_parser.token import ParseError
 from semantic_release.const import DEFAULT_VERSION
@@ -13,9 +12,11 @@ from semantic_release.enums import LevelBump, SemanticReleaseLogLevels
 from semantic_release.errors import InternalError, InvalidVersion
 from semantic_release.globals import logger
 from semantic_release.helpers import validate_types_in_sequence
+from semantic_release.version.commit_graph import CommitGraph
+from semantic_release.version.tag_index import find_reachable_tags, list_tags
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Sequence
+    from typing import Callable, Iterator, Sequence
 
     from git.objects.commit import Commit
     from git.refs.tag import Tag
@@ -26,10 +27,24 @@ if TYPE_CHECKING:  # pragma: no cover
         ParseResult,
         ParserOptions,
     )
+    from semantic_release.version.snapshot import HistorySnapshot
     from semantic_release.version.translator import VersionTranslator
     from semantic_release.version.version import Version
 
 
+def _tag_to_version(tag_name: str, translator: VersionTranslator) -> Version | None:
+    try:
+        return translator.from_tag(tag_name)
+    except (NotImplementedError, InvalidVersion) as e:
+        logger.warning(
+            "Couldn't parse tag %s as as Version: %s",
+            tag_name,
+            str(e),
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
+        return None
+
+
 def tags_and_versions(
     tags: Iterable[Tag], translator: VersionTranslator
 ) -> list[tuple[Tag, Version]]:
@@ -41,68 +56,71 @@ def tags_and_versions(
 
     Tags which are not matched by `translator` are ignored.
     """
-    ts_and_vs: list[tuple[Tag, Version]] = []
-    for tag in tags:
-        try:
-            version = translator.from_tag(tag.name)
-        except (NotImplementedError, InvalidVersion) as e:
-            logger.warning(
-                "Couldn't parse tag %s as as Version: %s",
-                tag.name,
-                str(e),
-                exc_info=logger.isEnabledFor(logging.DEBUG),
-            )
-            continue
-
-        if version:
-            ts_and_vs.append((tag, version))
+    ts_and_vs: list[tuple[Tag, Version]] = [
+        (tag, version)
+        for tag in tags
+        if (version := _tag_to_version(tag.name, translator))
+    ]
 
     logger.info("found %s previous tags", len(ts_and_vs))
-    return sorted(ts_and_vs, reverse=True, key=lambda v: v[1])
+    return sorted(ts_and_vs, reverse=True, key=lambda v: v[1].sort_key)
 
 
-def _traverse_graph_for_commits(
-    head_commit: Commit,
-    latest_release_tag_str: str = "",
-) -> Sequence[Commit]:
-    # Depth-first search
-    def dfs(start_commit: Commit, stop_nodes: set[Commit]) -> Sequence[Commit]:
-        # Create a stack for DFS
-        stack: LifoQueue[Commit] = LifoQueue()
+def latest_tags_and_versions(
+    repo: Repo, translator: VersionTranslator, count: int = 1
+) -> list[tuple[Tag, Version]]:
+    """
+    Return the `count` tags of the repository with the highest versions, as a list
+    of (tag, version) tuples sorted like :py:func:`tags_and_versions`.
 
-        # Create a set to store visited graph nodes (commit objects in this case)
-        visited: set[Commit] = set()
+    Rather than parsing every tag, git lists the tags in descending version order,
+    which only differs from semver ordering between the prereleases & the release of
+    the same major.minor.patch version. So tags are only parsed until one with a
+    lower major.minor.patch version than the `count` highest versions is reached.
+    """
+    latest: list[tuple[Tag, Version]] = []
+    for tag_name in repo.git.for_each_ref(
+        "--sort=-version:refname",
+        "--format=%(refname:strip=2)",
+        translator.tag_refs_pattern,
+    ).splitlines():
+        if not (version := _tag_to_version(tag_name, translator)):
+            continue
 
-        # Initialize the result
-        commits: list[Commit] = []
+        if len(latest) >= count and (
+            (version.major, version.minor, version.patch)
+            < (latest[-1][1].major, latest[-1][1].minor, latest[-1][1].patch)
+        ):
+            # Every remaining tag has a lower version
+            break
 
-        # Add the source node in the queue to start the search
-        stack.put(start_commit)
+        latest.append((TagReference(repo, f"refs/tags/{tag_name}"), version))
+        latest = sorted(latest, reverse=True, key=lambda v: v[1].sort_key)[:count]
 
-        # Traverse the git history capturing each commit found before it reaches a stop node
-        while not stack.empty():
-            if (node := stack.get()) in visited or node in stop_nodes:
-                continue
+    return latest
 
-            visited.add(node)
-            commits.append(node)
 
-            # Add all parent commits to the stack from left to right so that the rightmost is popped first
-            # as the left side is generally the merged into branch
-            for parent in node.parents:
-                stack.put(parent)
+def _traverse_graph_for_commits(
+    head_commit: Commit,
+    latest_release_tag_str: str = "",
+) -> Sequence[Commit]:
+    """
+    Find all the commits reachable from `head_commit` that are not reachable from the
+    latest release tag, in depth-first order.
 
-        return commits
+    The exclusion is performed by git as a revision range (``HEAD ^tag``) so the
+    cost scales with the number of unreleased commits rather than the age of the
+    repository. The metadata of the commits found is loaded in bulk as they are
+    all parsed afterwards.
+    """
+    graph = CommitGraph.from_git_log(
+        head_commit.repo,
+        head_commit.hexsha,
+        exclude=[latest_release_tag_str] if latest_release_tag_str else [],
+    )
 
     # Run a Depth First Search to find all the commits since the last release
-    return dfs(
-        start_commit=head_commit,
-        stop_nodes=set(
-            head_commit.repo.iter_commits(latest_release_tag_str)
-            if latest_release_tag_str
-            else []
-        ),
-    )
+    return graph.to_commits(graph.traverse(head_commit.hexsha))
 
 
 def _increment_version(
@@ -241,6 +259,69 @@ def _increment_version(
     return target_next_version
 
 
+def _parse_in_batches(
+    commits: Sequence[Commit],
+    parse_many: Callable[[Sequence[Commit]], list[ParseResult | list[ParseResult]]],
+    first_batch_size: int = 32,
+) -> Iterator[ParseResult | list[ParseResult]]:
+    """
+    Lazily parse the commits in batches of doubling size, so that only the first
+    few batches are parsed when the consumer stops early while a full parse still
+    takes a handful of batches.
+    """
+    start, batch_size = 0, first_batch_size
+    while start < len(commits):
+        yield from parse_many(commits[start : start + batch_size])
+        start, batch_size = start + batch_size, batch_size * 2
+
+
+def _highest_level_bump(
+    parsed_results: Iterable[ParseResult | list[ParseResult]],
+    ceiling: LevelBump | None = None,
+) -> LevelBump:
+    """
+    Stream through the results of parsing each commit and return the highest bump
+    level found. When a `ceiling` level is given, the results stop being consumed
+    once it is reached as no further commit could change the outcome.
+    """
+    level_bump = LevelBump.NO_RELEASE
+    if ceiling is not None and level_bump >= ceiling:
+        return level_bump
+
+    for p_results in parsed_results:
+        # Cast to list if not already a list (could return multiple results per commit)
+        results: Sequence[ParseResult] = (
+            p_results
+            if isinstance(p_results, list) or type(p_results) == tuple
+            else [p_results]
+        )
+
+        # Validation type check for the parser results (important because of possible custom parsers)
+        if not validate_types_in_sequence(results, (ParseError, ParsedCommit)):
+            raise TypeError("Unexpected type returned from commit_parser.parse")
+
+        level_bump = max(
+            [
+                level_bump,
+                *(
+                    parsed_result.bump
+                    for parsed_result in results
+                    # Filter out any non-ParsedCommit results (i.e. ParseErrors)
+                    if isinstance(parsed_result, ParsedCommit)
+                ),
+            ]
+        )
+
+        if ceiling is not None and level_bump >= ceiling:
+            logger.debug(
+                "stopped evaluating commits at the highest possible level: %s",
+                level_bump,
+            )
+            break
+
+    return level_bump
+
+
 def next_version(
     repo: Repo,
     translator: VersionTranslator,
@@ -248,10 +329,20 @@ def next_version(
     allow_zero_version: bool,
     major_on_zero: bool,
     prerelease: bool = False,
+    snapshot: HistorySnapshot | None = None,
+    short_circuit: bool = False,
 ) -> Version:
     """
     Evaluate the history within `repo`, and based on the tags and commits in the repo
     history, identify the next semantic version that should be applied to a release
+
+    When a `snapshot` of the history is provided, its tags, commit graph and parse
+    results are reused instead of being read from the repository again.
+
+    When `short_circuit` is set, the commits are parsed in batches which stop as soon
+    as no remaining commit could raise the bump level (ex. a breaking change was
+    found). Use it when only the version is needed, as the parse results of the
+    remaining commits (ex. for a changelog) are not evaluated.
     """
     # Default initial version
     # Since the translator is configured by the user, we can't guarantee that it will
@@ -267,23 +358,26 @@ def next_version(
         )
 
     # Step 1. All tags, sorted descending by semver ordering rules
-    all_git_tags_as_versions = tags_and_versions(repo.tags, translator)
+    all_git_tags_as_versions = (
+        snapshot.tags_and_versions
+        if snapshot
+        else tags_and_versions(list_tags(repo, translator.tag_refs_pattern), translator)
+    )
 
-    # Retrieve all commit hashes (regardless of merges) in the current branch's history from repo origin
-    commit_hash_set = {
-        commit.hexsha
-        for commit in _traverse_graph_for_commits(head_commit=repo.active_branch.commit)
-    }
+    # Retrieve the names of the tags found in the current branch's history
+    head_commit = repo.active_branch.commit
+    reachable_tags = (
+        snapshot.reachable_tags
+        if snapshot
+        else find_reachable_tags(repo, head_commit.hexsha, translator.tag_refs_pattern)
+    )
 
     # Filter all releases that are not found in the current branch's history
-    historic_versions: list[Version] = []
-    for tag, version in all_git_tags_as_versions:
-        # TODO: move this to tags_and_versions() function?
-        # Ignore the error that is raised when tag points to a Blob or Tree object rather
-        # than a commit object (tags that point to tags that then point to commits are resolved automatically)
-        with suppress(ValueError):
-            if tag.commit.hexsha in commit_hash_set:
-                historic_versions.append(version)
+    historic_versions: list[Version] = [
+        version
+        for tag, version in all_git_tags_as_versions
+        if tag.name in reachable_tags
+    ]
 
     # Step 2. Get the latest final release version in the history of the current branch
     #  or fallback to the default 0.0.0 starting version value if none are found
@@ -329,7 +423,7 @@ def next_version(
 
     # Step 4. Walk the git tree to find all commits that have been made since the last release
     commits_since_last_release = _traverse_graph_for_commits(
-        head_commit=repo.active_branch.commit,
+        head_commit=head_commit,
         latest_release_tag_str=(
             # NOTE: the default_initial_version should not actually exist on the repository (ie v0.0.0)
             # so we provide an empty tag string when there are no tags on the repository yet
@@ -344,43 +438,33 @@ def next_version(
     )
 
     # Step 5. apply the parser to each commit in the history (could return multiple results per commit)
-    parsed_results = list(map(commit_parser.parse, commits_since_last_release))
-
-    # Step 5A. Accumulate all parsed results into a single list accounting for possible multiple results per commit
-    consolidated_results: list[ParseResult] = reduce(
-        lambda accumulated_results, p_results: [
-            *accumulated_results,
-            *(
-                # Cast to list if not already a list
-                p_results
-                if isinstance(p_results, list) or type(p_results) == tuple
-                else [p_results]
-            ),
-        ],
-        parsed_results,
-        [],
+    #   (the snapshot's parse results are reused by the changelog within the same run)
+    parse_many = (
+        snapshot.parse_all
+        if snapshot and snapshot.commit_parser is commit_parser
+        else commit_parser.parse_many
     )
 
-    # Step 5B. Validation type check for the parser results (important because of possible custom parsers)
-    if not validate_types_in_sequence(consolidated_results, (ParseError, ParsedCommit)):
-        raise TypeError("Unexpected type returned from commit_parser.parse")
-
-    # Step 5C. Parse the commits to determine the bump level that should be applied
-    parsed_levels: set[LevelBump] = {
-        parsed_result.bump  # type: ignore[union-attr] # too complex for type checkers
-        for parsed_result in filter(
-            # Filter out any non-ParsedCommit results (i.e. ParseErrors)
-            lambda parsed_result: isinstance(parsed_result, ParsedCommit),
-            consolidated_results,
+    # Step 5A. Determine the highest bump level that can affect the next version
+    if latest_version.major == 0 and not allow_zero_version:
+        # any release from a 0.x.x version is bumped to 1.0.0
+        highest_effective_bump = LevelBump.NO_RELEASE
+    elif latest_version.major == 0 and not major_on_zero:
+        # breaking changes only increment the minor digit of a 0.x.x version
+        highest_effective_bump = LevelBump.MINOR
+    else:
+        highest_effective_bump = LevelBump.MAJOR
+
+    # Step 5B. Parse the commits to determine the bump level that should be applied
+    level_bump = (
+        _highest_level_bump(
+            _parse_in_batches(commits_since_last_release, parse_many),
+            ceiling=highest_effective_bump,
         )
-    }
-
-    logger.debug(
-        "parsed the following distinct levels from the commits since the last release: %s",
-        parsed_levels,
+        if short_circuit
+        else _highest_level_bump(parse_many(commits_since_last_release))
     )
 
-    level_bump = max(parsed_levels, default=LevelBump.NO_RELEASE)
     logger.info("The type of the next release release is: %s", level_bump)
 
     if all(
@@ -0,0 +1,243 @@
+"""Lightweight representation of a repository's commit graph streamed from git"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from git.objects.commit import Commit
+from git.objects.tree import Tree
+from git.objects.util import utctz_to_altz
+from git.util import Actor, hex_to_bin
+
+from semantic_release.globals import logger
+from semantic_release.helpers import stream_git_lines, stream_git_records
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Iterable, Iterator, Sequence
+
+    from git.repo.base import Repo
+
+
+# The fields of a commit that are loaded in bulk by `git log`, each field is
+# separated by a NUL character & the raw message is last as it may span many lines
+_LOG_FORMAT_FIELDS = (
+    "%H",  # commit sha
+    "%P",  # parent shas
+    "%T",  # tree sha
+    "%an",  # author name
+    "%ae",  # author email
+    "%ad",  # author date (raw: timestamp & utc offset)
+    "%cn",  # committer name
+    "%ce",  # committer email
+    "%cd",  # committer date (raw: timestamp & utc offset)
+    "%e",  # encoding
+    "%B",  # raw message
+)
+
+
+def _revision_args(
+    rev: str, exclude: Iterable[str], topo_order: bool
+) -> tuple[list[str], str | None]:
+    """
+    Build the arguments to select the commits reachable from ``rev`` but not from
+    any of the revisions in ``exclude``. The exclusions are provided through the
+    standard input of git as there can be too many for the command line.
+    """
+    excluded_revs = str.join("", [f"^{excluded_rev}\n" for excluded_rev in exclude])
+    return (
+        [
+            *(["--topo-order"] if topo_order else []),
+            *(["--stdin"] if excluded_revs else []),
+            rev,
+            "--",
+        ],
+        excluded_revs or None,
+    )
+
+
+class CommitGraph:
+    """
+    A compact mapping of commit sha to parent shas for all the commits reachable
+    from a revision, built from the output of a single ``git rev-list --parents``
+    process.
+
+    Traversing the graph is done entirely on strings, GitPython
+    :py:class:`Commit <git.objects.commit.Commit>` objects are only created on
+    request for the commits that are actually needed.
+    """
+
+    def __init__(
+        self,
+        repo: Repo,
+        parents: dict[str, tuple[str, ...]],
+        commits: dict[str, Commit] | None = None,
+    ) -> None:
+        self.repo = repo
+        self._parents = parents
+        self._commits = commits or {}
+
+    @classmethod
+    def from_rev_list(
+        cls,
+        repo: Repo,
+        rev: str = "HEAD",
+        exclude: Iterable[str] = (),
+        topo_order: bool = False,
+    ) -> CommitGraph:
+        """
+        Load the graph of all commits reachable from ``rev`` but not from any of the
+        revisions in ``exclude``.
+
+        When ``topo_order`` is set, iterating the graph yields the commits in
+        topological order (no parent before all of its children) as git reports them.
+        """
+        parents: dict[str, tuple[str, ...]] = {}
+        revision_args, stdin = _revision_args(rev, exclude, topo_order)
+
+        for line in stream_git_lines(
+            repo,
+            "rev_list",
+            "--parents",
+            *revision_args,
+            stdin=stdin,
+        ):
+            sha, *parent_shas = line.split(" ")
+            parents[sha] = tuple(parent_shas)
+
+        logger.debug("loaded %s commits reachable from %s", len(parents), rev)
+        return cls(repo, parents)
+
+    @classmethod
+    def from_git_log(
+        cls,
+        repo: Repo,
+        rev: str = "HEAD",
+        exclude: Iterable[str] = (),
+        topo_order: bool = False,
+    ) -> CommitGraph:
+        """
+        Load the same graph as :py:meth:`from_rev_list` along with the metadata (author,
+        committer, dates, encoding & message) of every commit in it, all from the output
+        of a single ``git log`` process rather than reading each commit object
+        individually when its attributes are first accessed.
+        """
+        parents: dict[str, tuple[str, ...]] = {}
+        commits: dict[str, Commit] = {}
+        revision_args, stdin = _revision_args(rev, exclude, topo_order)
+
+        records = stream_git_records(
+            repo,
+            "log",
+            "-z",
+            "--no-show-signature",
+            "--date=raw",
+            f"--format={str.join('%x00', _LOG_FORMAT_FIELDS)}",
+            *revision_args,
+            stdin=stdin,
+        )
+
+        # Group the stream of fields by commit, any trailing empty record is dropped
+        for fields in zip(*[records] * len(_LOG_FORMAT_FIELDS)):
+            commit = cls._commit_from_log_fields(repo, fields)
+            parents[commit.hexsha] = tuple(p.hexsha for p in commit.parents)
+            commits[commit.hexsha] = commit
+
+        logger.debug("loaded %s commits reachable from %s", len(commits), rev)
+        return cls(repo, parents, commits)
+
+    @staticmethod
+    def _commit_from_log_fields(repo: Repo, fields: tuple[str, ...]) -> Commit:
+        (
+            sha,
+            parent_shas,
+            tree_sha,
+            author_name,
+            author_email,
+            author_date,
+            committer_name,
+            committer_email,
+            committer_date,
+            encoding,
+            message,
+        ) = fields
+        authored_date, author_utc_offset = author_date.split(" ")
+        committed_date, committer_utc_offset = committer_date.split(" ")
+
+        return Commit(
+            repo,
+            hex_to_bin(sha),
+            tree=Tree(repo, hex_to_bin(tree_sha)),
+            author=Actor(author_name, author_email),
+            authored_date=int(authored_date),
+            author_tz_offset=utctz_to_altz(author_utc_offset),
+            committer=Actor(committer_name, committer_email),
+            committed_date=int(committed_date),
+            committer_tz_offset=utctz_to_altz(committer_utc_offset),
+            # git re-encodes the message into UTF-8 on output
+            message=message,
+            parents=[
+                Commit(repo, hex_to_bin(parent_sha))
+                for parent_sha in parent_shas.split()
+            ],
+            encoding=encoding or Commit.default_encoding,
+        )
+
+    def __contains__(self, sha: object) -> bool:
+        return sha in self._parents
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._parents)
+
+    def parents_of(self, sha: str) -> tuple[str, ...]:
+        return self._parents.get(sha, ())
+
+    def traverse(self, start_sha: str, stop_shas: Iterable[str] = ()) -> list[str]:
+        """
+        Depth-first search of the graph from ``start_sha`` which does not continue
+        past any of the ``stop_shas`` or commits outside of the loaded graph.
+
+        Parents are pushed onto the stack from left to right so that the rightmost
+        parent is popped first as the left side is generally the merged into branch.
+        """
+        stop_nodes = set(stop_shas)
+        visited: set[str] = set()
+        shas: list[str] = []
+        stack = [start_sha]
+
+        while stack:
+            if (
+                (node := stack.pop()) in visited
+                or node in stop_nodes
+                or node not in self._parents
+            ):
+                continue
+
+            visited.add(node)
+            shas.append(node)
+            stack.extend(self._parents[node])
+
+        return shas
+
+    def to_commit(self, sha: str) -> Commit:
+        """
+        Create a GitPython Commit object with its parents pre-populated from the
+        graph. Unless the graph was loaded with the commit metadata, all other
+        attributes are lazily loaded by GitPython when accessed.
+        """
+        if sha in self._commits:
+            return self._commits[sha]
+
+        return Commit(
+            self.repo,
+            hex_to_bin(sha),
+            parents=[
+                Commit(self.repo, hex_to_bin(parent_sha))
+                for parent_sha in self.parents_of(sha)
+            ],
+        )
+
+    def to_commits(self, shas: Sequence[str]) -> list[Commit]:
+        return [self.to_commit(sha) for sha in shas]
@@ -0,0 +1,163 @@
+"""Point-in-time view of a repository's release history shared within a single run"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from semantic_release.commit_parser.parallel import parse_commits_in_parallel
+from semantic_release.globals import logger
+from semantic_release.version.algorithm import tags_and_versions
+from semantic_release.version.commit_graph import CommitGraph
+from semantic_release.version.tag_index import TagIndex, find_reachable_tags
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Iterable
+
+    from git.objects.commit import Commit
+    from git.refs.tag import Tag
+    from git.repo.base import Repo
+
+    from semantic_release.commit_parser import (
+        CommitParser,
+        ParseResult,
+        ParserOptions,
+    )
+    from semantic_release.version.translator import VersionTranslator
+    from semantic_release.version.version import Version
+
+
+class HistorySnapshot:
+    """
+    The tags, versions and commits of a repository captured once & shared between
+    every consumer of the history within a single run, such as the next version
+    calculation and the release history used to build the changelog.
+
+    This prevents listing & translating the tags, walking the commit graph and
+    parsing the same commits more than once per run. As the name suggests, the
+    snapshot does not observe changes made to the repository after it is created.
+    """
+
+    def __init__(
+        self,
+        repo: Repo,
+        translator: VersionTranslator,
+        commit_parser: CommitParser[ParseResult, ParserOptions],
+        head_sha: str,
+        tags_and_versions: list[tuple[Tag, Version]],
+        reachable_tags: set[str],
+        tag_index: TagIndex,
+        commit_graph: CommitGraph | None = None,
+        parse_workers: int = 1,
+    ) -> None:
+        self.repo = repo
+        self.translator = translator
+        self.commit_parser = commit_parser
+        self.head_sha = head_sha
+        self.tags_and_versions = tags_and_versions
+        self._commit_graph = commit_graph
+        self.reachable_tags = reachable_tags
+        self.tag_index = tag_index
+        self.parse_workers = parse_workers
+        self.released_versions = {version for _, version in tags_and_versions}
+        self._parse_results: dict[str, ParseResult | list[ParseResult]] = {}
+
+    @classmethod
+    def from_repo(
+        cls,
+        repo: Repo,
+        translator: VersionTranslator,
+        commit_parser: CommitParser[ParseResult, ParserOptions],
+        parse_workers: int = 1,
+    ) -> HistorySnapshot:
+        """
+        Capture the version tags of the repository, which of them are reachable from
+        HEAD, and the index of the tags.
+
+        Only the tags starting with the literal prefix of the translator's tag format
+        are read (ex. the tags of a single package of a monorepo), with the tags
+        themselves listed from the tag index.
+
+        When `parse_workers` is greater than 1, large batches of commits given to
+        `parse_all` are parsed in that many worker processes.
+        """
+        head_sha = repo.head.commit.hexsha
+        tag_index = TagIndex.from_repo(repo, translator.tag_refs_pattern)
+        return cls(
+            repo=repo,
+            translator=translator,
+            commit_parser=commit_parser,
+            head_sha=head_sha,
+            tags_and_versions=tags_and_versions(tag_index.tags(repo), translator),
+            reachable_tags=find_reachable_tags(
+                repo, head_sha, translator.tag_refs_pattern
+            ),
+            tag_index=tag_index,
+            parse_workers=parse_workers,
+        )
+
+    @property
+    def commit_graph(self) -> CommitGraph:
+        """
+        The graph & metadata of all the commits reachable from HEAD in topological
+        order, loaded on first use as not every consumer needs the whole history.
+        """
+        if self._commit_graph is None:
+            self._commit_graph = CommitGraph.from_git_log(
+                self.repo, self.head_sha, topo_order=True
+            )
+
+        return self._commit_graph
+
+    @property
+    def last_released(self) -> tuple[Tag, Version] | None:
+        """The tag & version of the highest version released in the repository"""
+        return self.tags_and_versions[0] if self.tags_and_versions else None
+
+    def tag_commit_sha(self, tag: Tag) -> str | None:
+        """
+        The sha of the commit a tag points to, or None if the tag points to a
+        Blob or Tree object rather than a commit object.
+        """
+        return self.tag_index.commit_sha(tag.name)
+
+    def parse(self, commit: Commit) -> ParseResult | list[ParseResult]:
+        """Parse a commit with the snapshot's commit parser, at most once per commit"""
+        if commit.hexsha not in self._parse_results:
+            self._parse_results[commit.hexsha] = self.commit_parser.parse(commit)
+        else:
+            logger.debug("reusing parse result of commit %s", commit.hexsha[:8])
+
+        return self._parse_results[commit.hexsha]
+
+    def parse_all(
+        self, commits: Iterable[Commit]
+    ) -> list[ParseResult | list[ParseResult]]:
+        """
+        Parse many commits at once, in the order given, with the snapshot's commit
+        parser & at most once per commit. The commits not yet parsed are parsed as
+        a single batch, in parallel when the snapshot is configured with multiple
+        parse workers.
+        """
+        commits = list(commits)
+        unparsed = {
+            commit.hexsha: commit
+            for commit in commits
+            if commit.hexsha not in self._parse_results
+        }
+
+        if unparsed:
+            self._parse_results.update(
+                zip(
+                    unparsed,
+                    parse_commits_in_parallel(
+                        self.commit_parser,
+                        self.repo,
+                        unparsed.values(),
+                        max_workers=self.parse_workers,
+                    )
+                    if self.parse_workers > 1
+                    else self.commit_parser.parse_many(unparsed.values()),
+                )
+            )
+
+        return list(map(self.parse, commits))
@@ -0,0 +1,222 @@
+"""Bulk queries of a repository's tags answered by git in a single process"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, NamedTuple
+
+from git.exc import GitCommandError
+from git.objects.util import utctz_to_altz
+from git.refs.tag import TagReference
+from git.util import Actor
+
+from semantic_release.globals import logger
+from semantic_release.helpers import stream_git_lines
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Iterator
+
+    from git.repo.base import Repo
+
+
+# The fields of each tag read by `git for-each-ref`, separated by NUL characters.
+# Fields prefixed with `*` are read from the object an annotated tag points to.
+_TAG_FORMAT_FIELDS = (
+    "%(refname:lstrip=2)",
+    "%(objecttype)",
+    "%(objectname)",
+    "%(*objecttype)",
+    "%(*objectname)",
+    "%(taggername)",
+    "%(taggeremail)",
+    "%(taggerdate:raw)",
+    "%(authorname)",
+    "%(authoremail)",
+    "%(authordate:raw)",
+    "%(committerdate:raw)",
+)
+
+
+def list_tags(repo: Repo, pattern: str = "refs/tags/") -> list[TagReference]:
+    """
+    List the tags matching a ``git for-each-ref`` pattern (ex. the
+    :py:attr:`~semantic_release.version.translator.VersionTranslator.tag_refs_pattern`
+    of a tag format), so that only the refs matching the pattern are read.
+    """
+    return [
+        TagReference(repo, ref)
+        for ref in stream_git_lines(
+            repo, "for_each_ref", "--format=%(refname)", pattern
+        )
+    ]
+
+
+def find_reachable_tags(
+    repo: Repo, rev: str = "HEAD", pattern: str = "refs/tags/"
+) -> set[str]:
+    """
+    Find the names of all the tags which point (directly or through an annotated tag)
+    to a commit in the history of ``rev``.
+
+    Reachability is resolved by git (``for-each-ref --merged``) so the cost is
+    proportional to the number of tags rather than the number of commits in the
+    history. Tags which point to a Blob or Tree object are never reachable.
+
+    :param pattern: only the tags matching this ``git for-each-ref`` pattern are checked
+    """
+    reachable_tags = set(
+        stream_git_lines(
+            repo,
+            "for_each_ref",
+            f"--merged={rev}",
+            "--format=%(refname:lstrip=2)",
+            pattern,
+        )
+    )
+    logger.debug("found %s tags reachable from %s", len(reachable_tags), rev)
+    return reachable_tags
+
+
+class TagInfo(NamedTuple):
+    """The metadata of a single tag as read from the tag index"""
+
+    name: str
+    """Name of the tag (without the ``refs/tags/`` prefix)"""
+
+    commit_sha: str | None
+    """Sha of the commit the tag points to, None for a tag of a Blob or Tree object"""
+
+    is_annotated: bool
+    """Whether the tag is an annotated tag object rather than a lightweight tag"""
+
+    tagger: Actor | None
+    """The tagger of an annotated tag or the author of a lightweight tag's commit"""
+
+    tagged_date: datetime | None
+    """
+    The tagging date of an annotated tag or the commit date of a lightweight
+    tag's commit (in the timezone of the author)
+    """
+
+
+def _raw_date_to_datetime(raw_date: str, utc_offset: str | None = None) -> datetime:
+    """Convert a git raw date (ex. ``1700000000 +0100``) into an aware datetime"""
+    timestamp, raw_utc_offset = raw_date.split(" ")
+    _tz = timezone(timedelta(seconds=-1 * utctz_to_altz(utc_offset or raw_utc_offset)))
+    return datetime.fromtimestamp(int(timestamp), tz=_tz)
+
+
+def _peel_to_commit(repo: Repo, tag_name: str) -> str | None:
+    try:
+        return repo.git.rev_parse(
+            "--verify", "--quiet", f"refs/tags/{tag_name}^{{commit}}"
+        )
+    except GitCommandError:
+        return None
+
+
+def _tag_info_from_fields(repo: Repo, fields: list[str]) -> TagInfo:
+    (
+        name,
+        object_type,
+        object_sha,
+        peeled_object_type,
+        peeled_object_sha,
+        tagger_name,
+        tagger_email,
+        tagger_date,
+        author_name,
+        author_email,
+        author_date,
+        committer_date,
+    ) = fields
+
+    if object_type == "tag":
+        return TagInfo(
+            name=name,
+            commit_sha=(
+                peeled_object_sha
+                if peeled_object_type == "commit"
+                # A tag of a tag, git only peels one level so let git resolve the rest
+                else _peel_to_commit(repo, name)
+                if peeled_object_type == "tag"
+                else None
+            ),
+            is_annotated=True,
+            tagger=Actor(tagger_name, tagger_email.strip("<>")),
+            tagged_date=(_raw_date_to_datetime(tagger_date) if tagger_date else None),
+        )
+
+    if object_type == "commit":
+        return TagInfo(
+            name=name,
+            commit_sha=object_sha,
+            is_annotated=False,
+            tagger=Actor(author_name, author_email.strip("<>")),
+            tagged_date=_raw_date_to_datetime(
+                committer_date, utc_offset=author_date.split(" ")[-1]
+            ),
+        )
+
+    return TagInfo(
+        name=name,
+        commit_sha=None,
+        is_annotated=False,
+        tagger=None,
+        tagged_date=None,
+    )
+
+
+class TagIndex:
+    """
+    A compact, read-only index of all the tags of a repository with each tag
+    peeled to its commit and the tagger metadata resolved.
+
+    The index is built from a single ``git for-each-ref`` process instead of reading
+    the object of every tag individually through GitPython.
+    """
+
+    def __init__(self, tags: dict[str, TagInfo]) -> None:
+        self._tags = tags
+
+    @classmethod
+    def from_repo(cls, repo: Repo, pattern: str = "refs/tags/") -> TagIndex:
+        """
+        Index the tags of the repository
+
+        :param pattern: only the tags matching this ``git for-each-ref`` pattern are
+            indexed (ex. the tags of a single package of a monorepo)
+        """
+        tags: dict[str, TagInfo] = {}
+
+        for line in stream_git_lines(
+            repo,
+            "for_each_ref",
+            f"--format={str.join('%00', _TAG_FORMAT_FIELDS)}",
+            pattern,
+        ):
+            tag_info = _tag_info_from_fields(repo, line.split("\0"))
+            tags[tag_info.name] = tag_info
+
+        logger.debug("indexed %s tags", len(tags))
+        return cls(tags)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._tags
+
+    def __getitem__(self, name: str) -> TagInfo:
+        return self._tags[name]
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def __iter__(self) -> Iterator[TagInfo]:
+        return iter(self._tags.values())
+
+    def tags(self, repo: Repo) -> list[TagReference]:
+        """The references of the indexed tags in the given repository"""
+        return [TagReference(repo, f"refs/tags/{name}") for name in self._tags]
+
+    def commit_sha(self, name: str) -> str | None:
+        """The sha of the commit a tag points to, None if unknown or not a commit"""
+        return tag.commit_sha if (tag := self._tags.get(name)) else None
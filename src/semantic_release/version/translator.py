@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import string
 from re import VERBOSE, compile as regexp, escape as regex_escape
 from typing import TYPE_CHECKING
 
@@ -62,6 +63,28 @@ class VersionTranslator:
             flags=VERBOSE,
         )
 
+    @property
+    def tag_refs_pattern(self) -> str:
+        """
+        A ``git for-each-ref`` pattern of the tags which can match the tag_format,
+        narrowed down by the literal prefix of the format (ex. ``refs/tags/pkg-a-v*``
+        for ``pkg-a-v{version}``) so that git skips the tags of any other format,
+        such as the tags of the other packages of a monorepo.
+
+        Falls back to all of the tags when the format cannot be narrowed down, which
+        includes a format with a ``/`` after its literal prefix (ex. ``v{version}/rel``)
+        as the ``*`` of a pattern does not match a ``/``.
+        """
+        prefix = next(iter(string.Formatter().parse(self.tag_format)))[0]
+        if (
+            not prefix
+            or any(char in prefix for char in "*?[\\")
+            or "/" in self.tag_format[len(prefix) :]
+        ):
+            return "refs/tags/"
+
+        return f"refs/tags/{prefix}*"
+
     def from_string(self, version_str: str) -> Version:
         """
         Return a Version instance from a string. Delegates directly to Version.parse,
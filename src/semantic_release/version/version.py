@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import re
-from functools import wraps
-from itertools import zip_longest
-from typing import Callable, Union, overload
+from functools import lru_cache, wraps
+from typing import Callable, Tuple, Union, overload
+
+from deprecated.sphinx import deprecated
 
 from semantic_release.const import SEMVER_REGEX
 from semantic_release.enums import LevelBump
@@ -16,6 +17,11 @@ from semantic_release.helpers import check_tag_format
 # https://github.com/python-semver/python-semver/blob/b5317af9a7e99e6a86df98320e73be72d5adf0de/src/semver/version.py#L32
 VersionComparable = Union["Version", str]
 VersionComparator = Callable[["Version", "Version"], bool]
+VersionSortKey = Tuple[int, int, int, int, Tuple[str, ...], int]
+
+# Number of parsed versions kept by Version.parse, enough to intern the versions
+# of every tag of very large repositories
+PARSE_CACHE_SIZE = 65536
 
 
 @overload
@@ -44,19 +50,18 @@ def _comparator(
 
     @wraps(method)
     def _wrapper(self: Version, other: VersionComparable) -> bool:
-        if not isinstance(other, (str, Version)):
+        if isinstance(other, Version):
+            return method(self, other)
+        if not isinstance(other, str):
             return False if not type_guard else NotImplemented
-        if isinstance(other, str):
-            try:
-                other_v = self.parse(
-                    other,
-                    tag_format=self.tag_format,
-                    prerelease_token=self.prerelease_token,
-                )
-            except InvalidVersion as ex:
-                raise TypeError(str(ex)) from ex
-        else:
-            other_v = other
+        try:
+            other_v = self.parse(
+                other,
+                tag_format=self.tag_format,
+                prerelease_token=self.prerelease_token,
+            )
+        except InvalidVersion as ex:
+            raise TypeError(str(ex)) from ex
 
         return method(self, other_v)  # type: ignore[misc]
 
@@ -64,8 +69,39 @@ def _comparator(
 
 
 class Version:
+    """
+    An immutable semantic version.
+
+    The sort key & hash of each version are computed once on creation, so sorting
+    versions (ex. ``sorted(versions, key=lambda v: v.sort_key)``) and using them in
+    sets or as keys of dicts is cheap. Use :py:meth:`with_tag_format` &
+    :py:meth:`with_build_metadata` to derive a version with other values.
+    """
+
+    __slots__ = (
+        "major",
+        "minor",
+        "patch",
+        "prerelease_token",
+        "prerelease_revision",
+        "build_metadata",
+        "_tag_format",
+        "_sort_key",
+        "_hash",
+    )
+
     _VERSION_REGEX = SEMVER_REGEX
 
+    major: int
+    minor: int
+    patch: int
+    prerelease_token: str
+    prerelease_revision: int | None
+    build_metadata: str
+    _tag_format: str
+    _sort_key: VersionSortKey
+    _hash: int
+
     def __init__(
         self,
         major: int,
@@ -77,24 +113,127 @@ class Version:
         build_metadata: str = "",
         tag_format: str = "v{version}",
     ) -> None:
-        self.major = major
-        self.minor = minor
-        self.patch = patch
-        self.prerelease_token = prerelease_token
-        self.prerelease_revision = prerelease_revision
-        self.build_metadata = build_metadata
-        self._tag_format = tag_format
+        object.__setattr__(self, "major", major)
+        object.__setattr__(self, "minor", minor)
+        object.__setattr__(self, "patch", patch)
+        object.__setattr__(self, "prerelease_token", prerelease_token)
+        object.__setattr__(self, "prerelease_revision", prerelease_revision)
+        object.__setattr__(self, "build_metadata", build_metadata)
+        object.__setattr__(self, "_tag_format", tag_format)
+
+        # https://semver.org/#spec-item-11 -
+        # build metadata is not used for comparison.
+        # Note we only support the following versioning currently, which
+        # is a subset of the full spec:
+        # (\d+\.\d+\.\d+)(-\w+\.\d+)?(\+.*)?
+        # A prerelease is lower than the release of the same major.minor.patch, and
+        # prereleases are compared by the dot-separated identifiers of their token
+        # (lexically, a longer token being greater when one is a prefix of the other),
+        # then by their revision number.
+        object.__setattr__(
+            self,
+            "_sort_key",
+            (major, minor, patch, 1, (), 0)
+            if prerelease_revision is None
+            else (
+                major,
+                minor,
+                patch,
+                0,
+                tuple(prerelease_token.split(".")),
+                prerelease_revision,
+            ),
+        )
+        # Consistent with __eq__, so neither the build metadata nor the tag_format
+        # are part of the hash
+        object.__setattr__(
+            self,
+            "_hash",
+            hash((major, minor, patch, prerelease_token, prerelease_revision)),
+        )
+
+    def __setattr__(self, name: str, value: object) -> None:
+        # TODO: remove in v11 along with the deprecated tag_format setter
+        if name == "tag_format":
+            object.__setattr__(self, name, value)
+            return
+
+        raise AttributeError(f"{type(self).__qualname__} instances are immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__qualname__} instances are immutable")
+
+    def __getstate__(self) -> tuple[int, int, int, str, int | None, str, str]:
+        return (
+            self.major,
+            self.minor,
+            self.patch,
+            self.prerelease_token,
+            self.prerelease_revision,
+            self.build_metadata,
+            self.tag_format,
+        )
+
+    def __setstate__(
+        self, state: tuple[int, int, int, str, int | None, str, str]
+    ) -> None:
+        major, minor, patch, token, revision, build_metadata, tag_format = state
+        Version.__init__(
+            self,
+            major,
+            minor,
+            patch,
+            prerelease_token=token,
+            prerelease_revision=revision,
+            build_metadata=build_metadata,
+            tag_format=tag_format,
+        )
 
     @property
     def tag_format(self) -> str:
         return self._tag_format
 
     @tag_format.setter
+    @deprecated(
+        version="10.7.0",
+        reason="Versions are immutable, use with_tag_format() to derive a new version",
+    )
     def tag_format(self, new_format: str) -> None:
         check_tag_format(new_format)
-        self._tag_format = new_format
+        object.__setattr__(self, "_tag_format", new_format)
+        # The parsed versions are shared, do not hand out this one for another parse
+        Version._parse.cache_clear()
+
+    @property
+    def sort_key(self) -> VersionSortKey:
+        """A tuple which sorts in the same order as the versions themselves"""
+        return self._sort_key
+
+    def with_tag_format(self, tag_format: str) -> Version:
+        """Return a copy of this version with a different tag_format"""
+        check_tag_format(tag_format)
+        return Version(
+            self.major,
+            self.minor,
+            self.patch,
+            prerelease_token=self.prerelease_token,
+            prerelease_revision=self.prerelease_revision,
+            build_metadata=self.build_metadata,
+            tag_format=tag_format,
+        )
+
+    def with_build_metadata(self, build_metadata: str) -> Version:
+        """Return a copy of this version with different build metadata"""
+        return Version(
+            self.major,
+            self.minor,
+            self.patch,
+            prerelease_token=self.prerelease_token,
+            prerelease_revision=self.prerelease_revision,
+            build_metadata=build_metadata,
+            tag_format=self.tag_format,
+        )
 
-    # Maybe cache?
     @classmethod
     def parse(
         cls,
@@ -107,12 +246,22 @@ class Version:
         Inspired by `semver.version:VersionInfo.parse`, this implementation doesn't
         allow optional minor and patch versions.
 
+        As versions are immutable, parsing the same string again returns the same
+        instance.
+
         :param prerelease_token: will be ignored if the version string is a prerelease,
             the parsed token from `version_str` will be used instead.
         """
         if not isinstance(version_str, str):
             raise InvalidVersion(f"{version_str!r} cannot be parsed as a Version")
 
+        return cls._parse(version_str, tag_format, prerelease_token)
+
+    @classmethod
+    @lru_cache(maxsize=PARSE_CACHE_SIZE)
+    def _parse(
+        cls, version_str: str, tag_format: str, prerelease_token: str
+    ) -> Version:
         logger.debug("attempting to parse string %r as Version", version_str)
         match = cls._VERSION_REGEX.fullmatch(version_str)
         if not match:
@@ -278,24 +427,24 @@ class Version:
     __add__ = bump
 
     def __hash__(self) -> int:
-        # If we use str(self) we don't capture tag_format, so another
-        # instance with a tag_format "special_{version}_format" would
-        # collide with an instance using "v{version}"/other format
-        return hash(self.__repr__())
+        return self._hash
 
     @_comparator(type_guard=False)
     def __eq__(self, other: Version) -> bool:  # type: ignore[override]
         # https://semver.org/#spec-item-11 -
         # build metadata is not used for comparison
-        return all(
-            getattr(self, attr) == getattr(other, attr)
-            for attr in (
-                "major",
-                "minor",
-                "patch",
-                "prerelease_token",
-                "prerelease_revision",
-            )
+        return self._hash == other._hash and (
+            self.major,
+            self.minor,
+            self.patch,
+            self.prerelease_token,
+            self.prerelease_revision,
+        ) == (
+            other.major,
+            other.minor,
+            other.patch,
+            other.prerelease_token,
+            other.prerelease_revision,
         )
 
     @_comparator(type_guard=False)
@@ -306,57 +455,21 @@ class Version:
     # but can't because of the decorator
     @_comparator
     def __gt__(self, other: Version) -> bool:  # type: ignore[has-type]
-        # https://semver.org/#spec-item-11 -
-        # build metadata is not used for comparison
-
-        # Note we only support the following versioning currently, which
-        # is a subset of the full spec:
-        # (\d+\.\d+\.\d+)(-\w+\.\d+)?(\+.*)?
-        if self.major != other.major:
-            return self.major > other.major
-        if self.minor != other.minor:
-            return self.minor > other.minor
-        if self.patch != other.patch:
-            return self.patch > other.patch
-        # If just one is a prerelease, then self > other if other is the prerelease
-        # If neither are prereleases then they're equal (so return False)
-        if not (self.is_prerelease and other.is_prerelease):
-            return other.is_prerelease
-        # If both are prereleases...
-        # According to the semver spec 11.4 there are many other rules for
-        # comparing precedence of pre-release versions. Here we just compare
-        # the prerelease tokens, and their revision numbers
-        if self.prerelease_token != other.prerelease_token:
-            for self_tk, other_tk in zip_longest(
-                self.prerelease_token.split("."),
-                other.prerelease_token.split("."),
-                fillvalue=None,
-            ):
-                if self_tk == other_tk:
-                    continue
-                if (self_tk is None) ^ (other_tk is None):
-                    # Longest token (i.e. non-None) is greater
-                    return other_tk is None
-                # Lexical sort, e.g. "rc" > "beta" > "alpha"
-                # we have eliminated that one or both might be None above,
-                # but mypy doesn't recognise this
-                return self_tk > other_tk  # type: ignore[operator]
-        # We have eliminated that one or both aren't prereleases by the above
-        return self.prerelease_revision > other.prerelease_revision  # type: ignore[operator]  # noqa: E501
+        return self._sort_key > other._sort_key
 
     # mypy wants to compare signature types with __le__,
     # but can't because of the decorator
     @_comparator
     def __ge__(self, other: Version) -> bool:  # type: ignore[has-type]
-        return self.__gt__(other) or self.__eq__(other)
+        return self._sort_key >= other._sort_key
 
     @_comparator
     def __lt__(self, other: Version) -> bool:
-        return not (self.__gt__(other) or self.__eq__(other))
+        return self._sort_key < other._sort_key
 
     @_comparator
     def __le__(self, other: Version) -> bool:
-        return not self.__gt__(other)
+        return self._sort_key <= other._sort_key
 
     def __sub__(self, other: Version) -> LevelBump:
         if not isinstance(other, Version):
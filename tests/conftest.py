@@ -356,7 +356,16 @@ def set_cached_repo_data(request: pytest.FixtureRequest) -> SetCachedRepoDataFn:
             return obj.__fspath__()
 
         if isinstance(obj, Version):
-            return obj.__dict__
+            # Versions are immutable slotted objects without a __dict__
+            return {
+                "major": obj.major,
+                "minor": obj.minor,
+                "patch": obj.patch,
+                "prerelease_token": obj.prerelease_token,
+                "prerelease_revision": obj.prerelease_revision,
+                "build_metadata": obj.build_metadata,
+                "tag_format": obj.tag_format,
+            }
 
         return obj
 
@@ -393,6 +393,128 @@ def test_changelog_update_mode_unchanged(
     assert expected_changelog_content == actual_content
 
 
+@pytest.mark.parametrize("args", [("--max-releases", "1"), ("--since-tag", "v0.1.1")])
+@pytest.mark.parametrize(
+    "changelog_file",
+    [
+        lazy_fixture(example_changelog_md.__name__),
+        lazy_fixture(example_changelog_rst.__name__),
+    ],
+)
+@pytest.mark.usefixtures(repo_w_trunk_only_conventional_commits.__name__)
+def test_changelog_update_mode_unchanged_w_windowed_history(
+    args: list[str],
+    run_cli: RunCliFn,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    changelog_file: Path,
+):
+    """
+    Given that the changelog file already exists for the current release,
+    When the changelog command is run in "update" mode with a windowed history,
+    Then the changelog file is not modified.
+    """
+    # Set the project configurations
+    update_pyproject_toml(
+        "tool.semantic_release.changelog.mode", ChangelogMode.UPDATE.value
+    )
+    update_pyproject_toml(
+        "tool.semantic_release.changelog.default_templates.changelog_file",
+        str(changelog_file.name),
+    )
+
+    # Capture the expected changelog content
+    expected_changelog_content = changelog_file.read_text()
+
+    # Act
+    cli_cmd = [MAIN_PROG_NAME, CHANGELOG_SUBCMD, *args]
+    result = run_cli(cli_cmd[1:])
+
+    # Evaluate
+    assert_successful_exit_code(result, cli_cmd)
+    assert expected_changelog_content == changelog_file.read_text()
+
+
+@pytest.mark.parametrize("args", [("--max-releases", "1"), ("--since-tag", "v0.1.1")])
+@pytest.mark.usefixtures(repo_w_trunk_only_conventional_commits.__name__)
+def test_changelog_update_mode_no_prev_changelog_w_windowed_history(
+    args: list[str],
+    run_cli: RunCliFn,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    example_changelog_md: Path,
+):
+    """
+    Given that the changelog file does not exist,
+    When the changelog command is run in "update" mode with a windowed history,
+    Then the command fails without writing a truncated changelog.
+    """
+    # Set the project configurations
+    update_pyproject_toml(
+        "tool.semantic_release.changelog.mode", ChangelogMode.UPDATE.value
+    )
+    update_pyproject_toml(
+        "tool.semantic_release.changelog.default_templates.changelog_file",
+        str(example_changelog_md.name),
+    )
+
+    # Remove any previous changelog to update
+    os.remove(str(example_changelog_md.resolve()))
+
+    # Act
+    cli_cmd = [MAIN_PROG_NAME, CHANGELOG_SUBCMD, *args]
+    result = run_cli(cli_cmd[1:])
+
+    # Evaluate
+    assert_exit_code(1, result, cli_cmd)
+    assert "can only be used to update an existing changelog" in result.stderr
+    assert not example_changelog_md.exists()
+
+
+@pytest.mark.parametrize("args", [("--max-releases", "1"), ("--since-tag", "v0.1.1")])
+@pytest.mark.usefixtures(repo_w_trunk_only_conventional_commits.__name__)
+def test_changelog_init_mode_w_windowed_history(
+    args: list[str],
+    run_cli: RunCliFn,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    example_changelog_md: Path,
+):
+    """
+    Given that the changelog file already exists,
+    When the changelog command is run in "init" mode with a windowed history,
+    Then the command fails without truncating the changelog.
+    """
+    # Set the project configurations
+    update_pyproject_toml(
+        "tool.semantic_release.changelog.mode", ChangelogMode.INIT.value
+    )
+    update_pyproject_toml(
+        "tool.semantic_release.changelog.default_templates.changelog_file",
+        str(example_changelog_md.name),
+    )
+
+    # Capture the expected changelog content
+    expected_changelog_content = example_changelog_md.read_text()
+
+    # Act
+    cli_cmd = [MAIN_PROG_NAME, CHANGELOG_SUBCMD, *args]
+    result = run_cli(cli_cmd[1:])
+
+    # Evaluate
+    assert_exit_code(1, result, cli_cmd)
+    assert "'init'" in result.stderr
+    assert expected_changelog_content == example_changelog_md.read_text()
+
+
+@pytest.mark.usefixtures(repo_w_trunk_only_conventional_commits.__name__)
+def test_changelog_since_tag_not_in_history(run_cli: RunCliFn):
+    # Act
+    cli_cmd = [MAIN_PROG_NAME, CHANGELOG_SUBCMD, "--since-tag", "v1.99.0"]
+    result = run_cli(cli_cmd[1:])
+
+    # Evaluate
+    assert_exit_code(1, result, cli_cmd)
+    assert "v1.99.0 is not a release" in result.stderr
+
+
 @pytest.mark.parametrize(
     "changelog_file",
     [
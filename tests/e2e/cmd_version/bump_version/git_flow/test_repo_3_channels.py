@@ -60,6 +60,7 @@ def test_gitflow_repo_rebuild_3_channels(
     git_repo_for_directory: GetGitRepo4DirFn,
     build_repo_from_definition: BuildRepoFromDefinitionFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     version_py_file: Path,
@@ -108,6 +109,7 @@ def test_gitflow_repo_rebuild_3_channels(
 
         # make sure mocks are clear
         mocked_git_fetch.reset_mock()
+        mocked_git_ls_remote.reset_mock()
         mocked_git_push.reset_mock()
         post_mocker.reset_mock()
 
@@ -167,7 +169,8 @@ def test_gitflow_repo_rebuild_3_channels(
         assert expected_release_commit_text == actual_release_commit_text
         # Make sure tag is created
         assert curr_release_tag in [tag.name for tag in mirror_git_repo.tags]
-        # fetch called to check for remote changes
-        assert mocked_git_fetch.call_count == 1
-        assert mocked_git_push.call_count == 2  # 1 for commit, 1 for tag
+        # ls-remote called to check for remote changes
+        assert mocked_git_ls_remote.call_count == 1
+        assert mocked_git_fetch.call_count == 0
+        assert mocked_git_push.call_count == 1  # 1 atomic push of the commit & tag
         assert post_mocker.call_count == 1  # vcs release creation occurred
@@ -59,6 +59,7 @@ def test_trunk_monorepo_rebuild_1_channel(
     git_repo_for_directory: GetGitRepo4DirFn,
     build_repo_from_definition: BuildRepoFromDefinitionFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     get_sanitized_md_changelog_content: GetSanitizedChangelogContentFn,
@@ -117,6 +118,7 @@ def test_trunk_monorepo_rebuild_1_channel(
 
         # make sure mocks are clear
         mocked_git_fetch.reset_mock()
+        mocked_git_ls_remote.reset_mock()
         mocked_git_push.reset_mock()
         post_mocker.reset_mock()
 
@@ -254,7 +256,8 @@ def test_trunk_monorepo_rebuild_1_channel(
             assert curr_release_str in [tag.name for tag in mirror_git_repo.tags]
 
         # Make sure publishing actions occurred
-        # fetch called to check for remote changes
-        assert mocked_git_fetch.call_count == 1
-        assert mocked_git_push.call_count == 2  # 1 for commit, 1 for tag
+        # ls-remote called to check for remote changes
+        assert mocked_git_ls_remote.call_count == 1
+        assert mocked_git_fetch.call_count == 0
+        assert mocked_git_push.call_count == 1  # 1 atomic push of the commit & tag
         assert post_mocker.call_count == 1  # vcs release creation occurred
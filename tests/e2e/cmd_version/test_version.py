@@ -7,7 +7,9 @@ from typing import TYPE_CHECKING
 import pytest
 from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
 
+from semantic_release.gitproject import GitProject
 from semantic_release.hvcs.github import Github
+from semantic_release.version.snapshot import HistorySnapshot
 
 from tests.const import (
     MAIN_PROG_NAME,
@@ -46,6 +48,7 @@ def test_version_noop_is_noop(
     next_release_version: str,
     run_cli: RunCliFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     get_wheel_file: GetWheelFileFn,
@@ -96,6 +99,7 @@ def test_version_no_git_verify(
     run_cli: RunCliFn,
     update_pyproject_toml: UpdatePyprojectTomlFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
 ):
@@ -150,11 +154,69 @@ def test_version_no_git_verify(
     # A commit has been made (regardless of precommit)
     assert [head_sha_before] == [head.hexsha for head in head_after.parents]
     assert len(tags_set_difference) == 1  # A tag has been created
-    assert mocked_git_fetch.call_count == 1  # fetch called to check for remote changes
-    assert mocked_git_push.call_count == 2  # 1 for commit, 1 for tag
+    assert (
+        mocked_git_ls_remote.call_count == 1
+    )  # ls-remote called to check for remote changes
+    assert mocked_git_fetch.call_count == 0  # no git fetch called
+    assert mocked_git_push.call_count == 1  # 1 atomic push of the commit & tag
     assert post_mocker.call_count == 1  # vcs release creation occurred
 
 
+@pytest.mark.parametrize(
+    "repo_result",
+    [lazy_fixture(repo_w_trunk_only_conventional_commits.__name__)],
+)
+def test_version_no_lazy_fetch_only_during_analysis(
+    repo_result: BuiltRepoResult,
+    run_cli: RunCliFn,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
+    mocked_git_push: MagicMock,
+    post_mocker: Mocker,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    repo = repo_result["repo"]
+
+    # setup: set configuration setting
+    update_pyproject_toml("tool.semantic_release.no_lazy_fetch", True)
+    repo.git.commit(m="chore: disable lazy fetches of the analysis", a=True)
+    # Fake an automated push to remote by updating the remote tracking branch
+    repo.git.update_ref(
+        f"refs/remotes/origin/{repo.active_branch.name}",
+        repo.head.commit.hexsha,
+    )
+
+    # setup: record the git environment of the analysis & of the release commit
+    analysis_envs: list[dict[str, str]] = []
+    commit_envs: list[dict[str, str]] = []
+    from_repo = HistorySnapshot.from_repo.__func__  # type: ignore[attr-defined]
+    git_commit = GitProject.git_commit
+
+    def recording_from_repo(cls, repo, *args, **kwargs):  # type: ignore[no-untyped-def]
+        analysis_envs.append(dict(repo.git.environment()))
+        return from_repo(cls, repo, *args, **kwargs)
+
+    def recording_git_commit(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        commit_envs.append(dict(self.repo.git.environment()))
+        return git_commit(self, *args, **kwargs)
+
+    monkeypatch.setattr(HistorySnapshot, "from_repo", classmethod(recording_from_repo))
+    monkeypatch.setattr(GitProject, "git_commit", recording_git_commit)
+
+    # Execute
+    cli_cmd = [MAIN_PROG_NAME, VERSION_SUBCMD, "--patch"]
+    result = run_cli(cli_cmd[1:])
+
+    # Evaluate
+    assert_successful_exit_code(result, cli_cmd)
+    assert analysis_envs
+    assert all(env.get("GIT_NO_LAZY_FETCH") == "1" for env in analysis_envs)
+    assert commit_envs
+    assert not any("GIT_NO_LAZY_FETCH" in env for env in commit_envs)
+    assert mocked_git_push.call_count == 1  # 1 atomic push of the commit & tag
+
+
 @pytest.mark.parametrize(
     "repo_result", [lazy_fixture(repo_w_trunk_only_conventional_commits.__name__)]
 )
@@ -162,6 +224,7 @@ def test_version_on_nonrelease_branch(
     repo_result: BuiltRepoResult,
     run_cli: RunCliFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     strip_logging_messages: StripLoggingMessagesFn,
@@ -209,6 +272,7 @@ def test_version_on_last_release(
     get_versions_from_repo_build_def: GetVersionsFromRepoBuildDefFn,
     run_cli: RunCliFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     strip_logging_messages: StripLoggingMessagesFn,
@@ -262,6 +326,7 @@ def test_version_only_tag_push(
     repo_result: BuiltRepoResult,
     run_cli: RunCliFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
 ) -> None:
@@ -71,6 +71,7 @@ def test_version_runs_build_command(
     get_wheel_file: GetWheelFileFn,
     example_pyproject_toml: Path,
     mocked_git_fetch: mock.MagicMock,
+    mocked_git_ls_remote: mock.MagicMock,
     mocked_git_push: mock.MagicMock,
     post_mocker: mock.Mock,
 ):
@@ -128,9 +129,10 @@ def test_version_runs_build_command(
         )
 
         assert built_wheel_file.exists()
-        # fetch called to check for remote changes
-        assert mocked_git_fetch.call_count == 1
-        assert mocked_git_push.call_count == 2
+        # ls-remote called to check for remote changes
+        assert mocked_git_ls_remote.call_count == 1
+        assert mocked_git_fetch.call_count == 0
+        assert mocked_git_push.call_count == 1  # 1 atomic push of the commit & tag
         assert post_mocker.call_count == 1
 
 
@@ -156,6 +158,7 @@ def test_version_runs_build_command_windows(
     example_pyproject_toml: Path,
     update_pyproject_toml: UpdatePyprojectTomlFn,
     mocked_git_fetch: mock.MagicMock,
+    mocked_git_ls_remote: mock.MagicMock,
     mocked_git_push: mock.MagicMock,
     post_mocker: mock.Mock,
     clean_os_environment: dict[str, str],
@@ -229,9 +232,10 @@ def test_version_runs_build_command_windows(
 
         dist_file_exists = built_wheel_file.exists()
         assert dist_file_exists, f"\n  Expected wheel file to be created at {built_wheel_file}, but it does not exist."
-        # fetch called to check for remote changes
-        assert mocked_git_fetch.call_count == 1
-        assert mocked_git_push.call_count == 2
+        # ls-remote called to check for remote changes
+        assert mocked_git_ls_remote.call_count == 1
+        assert mocked_git_fetch.call_count == 0
+        assert mocked_git_push.call_count == 1  # 1 atomic push of the commit & tag
         assert post_mocker.call_count == 1
 
 
@@ -347,6 +351,7 @@ def test_version_runs_build_command_w_user_env(
 def test_version_skips_build_command_with_skip_build(
     run_cli: RunCliFn,
     mocked_git_fetch: mock.MagicMock,
+    mocked_git_ls_remote: mock.MagicMock,
     mocked_git_push: mock.MagicMock,
     post_mocker: mock.Mock,
 ):
@@ -363,6 +368,9 @@ def test_version_skips_build_command_with_skip_build(
     assert_successful_exit_code(result, cli_cmd)
     patched_subprocess_run.assert_not_called()
 
-    assert mocked_git_fetch.call_count == 1  # fetch called to check for remote changes
-    assert mocked_git_push.call_count == 2
+    assert (
+        mocked_git_ls_remote.call_count == 1
+    )  # ls-remote called to check for remote changes
+    assert mocked_git_fetch.call_count == 0  # no git fetch called
+    assert mocked_git_push.call_count == 1  # 1 atomic push of the commit & tag
     assert post_mocker.call_count == 1
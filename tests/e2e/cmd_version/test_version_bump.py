@@ -322,6 +322,7 @@ def test_version_force_level(
     example_pyproject_toml: Path,
     run_cli: RunCliFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     pyproject_toml_file: Path,
@@ -391,8 +392,11 @@ def test_version_force_level(
     assert len(tags_set_difference) == 1  # A tag has been created
     assert f"v{next_release_version}" in tags_set_difference
 
-    assert mocked_git_fetch.call_count == 1  # fetch called to check for remote changes
-    assert mocked_git_push.call_count == 2  # 1 for commit, 1 for tag
+    assert (
+        mocked_git_ls_remote.call_count == 1
+    )  # ls-remote called to check for remote changes
+    assert mocked_git_fetch.call_count == 0  # no git fetch called
+    assert mocked_git_push.call_count == 1  # 1 atomic push of the commit & tag
     assert post_mocker.call_count == 1  # vcs release creation occurred
 
     # Changelog already reflects changes this should introduce
@@ -537,6 +541,7 @@ def test_version_next_greater_than_version_one_conventional(
     run_cli: RunCliFn,
     file_in_repo: str,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     stable_now_date: GetStableDateNowFn,
@@ -595,8 +600,11 @@ def test_version_next_greater_than_version_one_conventional(
     assert len(tags_set_difference) == 1  # A tag has been created
     assert f"v{next_release_version}" in tags_set_difference
 
-    assert mocked_git_fetch.call_count == 1  # fetch called to check for remote changes
-    assert mocked_git_push.call_count == 2  # 1 for commit, 1 for tag
+    assert (
+        mocked_git_ls_remote.call_count == 1
+    )  # ls-remote called to check for remote changes
+    assert mocked_git_fetch.call_count == 0  # no git fetch called
+    assert mocked_git_push.call_count == 1  # 1 atomic push of the commit & tag
     assert post_mocker.call_count == 1  # vcs release creation occurred
 
 
@@ -683,6 +691,7 @@ def test_version_next_greater_than_version_one_no_bump_conventional(
     run_cli: RunCliFn,
     file_in_repo: str,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     stable_now_date: GetStableDateNowFn,
@@ -739,6 +748,7 @@ def test_version_next_greater_than_version_one_no_bump_conventional(
     # No commit has been made
     assert head_sha_before == head_after.hexsha
     assert len(tags_set_difference) == 0  # No tag created
+    assert mocked_git_ls_remote.call_count == 0  # no git ls-remote called
     assert mocked_git_fetch.call_count == 0  # no git fetch called
     assert mocked_git_push.call_count == 0  # no git push of tag or commit
     assert post_mocker.call_count == 0  # no vcs release
@@ -850,6 +860,7 @@ def test_version_next_greater_than_version_one_emoji(
     run_cli: RunCliFn,
     file_in_repo: str,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     stable_now_date: GetStableDateNowFn,
@@ -908,8 +919,11 @@ def test_version_next_greater_than_version_one_emoji(
     assert len(tags_set_difference) == 1  # A tag has been created
     assert f"v{next_release_version}" in tags_set_difference
 
-    assert mocked_git_fetch.call_count == 1  # fetch called to check for remote changes
-    assert mocked_git_push.call_count == 2  # 1 for commit, 1 for tag
+    assert (
+        mocked_git_ls_remote.call_count == 1
+    )  # ls-remote called to check for remote changes
+    assert mocked_git_fetch.call_count == 0  # no git fetch called
+    assert mocked_git_push.call_count == 1  # 1 atomic push of the commit & tag
     assert post_mocker.call_count == 1  # vcs release creation occurred
 
 
@@ -996,6 +1010,7 @@ def test_version_next_greater_than_version_one_no_bump_emoji(
     run_cli: RunCliFn,
     file_in_repo: str,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     stable_now_date: GetStableDateNowFn,
@@ -1052,6 +1067,7 @@ def test_version_next_greater_than_version_one_no_bump_emoji(
     # No commit has been made
     assert head_sha_before == head_after.hexsha
     assert len(tags_set_difference) == 0  # No tag created
+    assert mocked_git_ls_remote.call_count == 0  # no git ls-remote called
     assert mocked_git_fetch.call_count == 0  # no git fetch called
     assert mocked_git_push.call_count == 0  # no git push of tag or commit
     assert post_mocker.call_count == 0  # no vcs release
@@ -1163,6 +1179,7 @@ def test_version_next_greater_than_version_one_scipy(
     run_cli: RunCliFn,
     file_in_repo: str,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     stable_now_date: GetStableDateNowFn,
@@ -1221,8 +1238,11 @@ def test_version_next_greater_than_version_one_scipy(
     assert len(tags_set_difference) == 1  # A tag has been created
     assert f"v{next_release_version}" in tags_set_difference
 
-    assert mocked_git_fetch.call_count == 1  # fetch called to check for remote changes
-    assert mocked_git_push.call_count == 2  # 1 for commit, 1 for tag
+    assert (
+        mocked_git_ls_remote.call_count == 1
+    )  # ls-remote called to check for remote changes
+    assert mocked_git_fetch.call_count == 0  # no git fetch called
+    assert mocked_git_push.call_count == 1  # 1 atomic push of the commit & tag
     assert post_mocker.call_count == 1  # vcs release creation occurred
 
 
@@ -1309,6 +1329,7 @@ def test_version_next_greater_than_version_one_no_bump_scipy(
     run_cli: RunCliFn,
     file_in_repo: str,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     stable_now_date: GetStableDateNowFn,
@@ -1365,6 +1386,7 @@ def test_version_next_greater_than_version_one_no_bump_scipy(
     # No commit has been made
     assert head_sha_before == head_after.hexsha
     assert len(tags_set_difference) == 0  # No tag created
+    assert mocked_git_ls_remote.call_count == 0  # no git ls-remote called
     assert mocked_git_fetch.call_count == 0  # no git fetch called
     assert mocked_git_push.call_count == 0  # no git push of tag or commit
     assert post_mocker.call_count == 0  # no vcs release
@@ -1657,6 +1679,7 @@ def test_version_next_w_zero_dot_versions_conventional(
     file_in_repo: str,
     update_pyproject_toml: UpdatePyprojectTomlFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     stable_now_date: GetStableDateNowFn,
@@ -1721,8 +1744,11 @@ def test_version_next_w_zero_dot_versions_conventional(
     assert len(tags_set_difference) == 1  # A tag has been created
     assert f"v{next_release_version}" in tags_set_difference
 
-    assert mocked_git_fetch.call_count == 1  # fetch called to check for remote changes
-    assert mocked_git_push.call_count == 2  # 1 for commit, 1 for tag
+    assert (
+        mocked_git_ls_remote.call_count == 1
+    )  # ls-remote called to check for remote changes
+    assert mocked_git_fetch.call_count == 0  # no git fetch called
+    assert mocked_git_push.call_count == 1  # 1 atomic push of the commit & tag
     assert post_mocker.call_count == 1  # vcs release creation occurred
 
 
@@ -1818,6 +1844,7 @@ def test_version_next_w_zero_dot_versions_no_bump_conventional(
     file_in_repo: str,
     update_pyproject_toml: UpdatePyprojectTomlFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     stable_now_date: GetStableDateNowFn,
@@ -1880,6 +1907,7 @@ def test_version_next_w_zero_dot_versions_no_bump_conventional(
     # No commit has been made
     assert head_sha_before == head_after.hexsha
     assert len(tags_set_difference) == 0  # No tag created
+    assert mocked_git_ls_remote.call_count == 0  # no git ls-remote called
     assert mocked_git_fetch.call_count == 0  # no git fetch called
     assert mocked_git_push.call_count == 0  # no git push of tag or commit
     assert post_mocker.call_count == 0  # no vcs release
@@ -2151,6 +2179,7 @@ def test_version_next_w_zero_dot_versions_emoji(
     file_in_repo: str,
     update_pyproject_toml: UpdatePyprojectTomlFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     stable_now_date: GetStableDateNowFn,
@@ -2215,8 +2244,11 @@ def test_version_next_w_zero_dot_versions_emoji(
     assert len(tags_set_difference) == 1  # A tag has been created
     assert f"v{next_release_version}" in tags_set_difference
 
-    assert mocked_git_fetch.call_count == 1  # fetch called to check for remote changes
-    assert mocked_git_push.call_count == 2  # 1 for commit, 1 for tag
+    assert (
+        mocked_git_ls_remote.call_count == 1
+    )  # ls-remote called to check for remote changes
+    assert mocked_git_fetch.call_count == 0  # no git fetch called
+    assert mocked_git_push.call_count == 1  # 1 atomic push of the commit & tag
     assert post_mocker.call_count == 1  # vcs release creation occurred
 
 
@@ -2312,6 +2344,7 @@ def test_version_next_w_zero_dot_versions_no_bump_emoji(
     file_in_repo: str,
     update_pyproject_toml: UpdatePyprojectTomlFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     stable_now_date: GetStableDateNowFn,
@@ -2374,6 +2407,7 @@ def test_version_next_w_zero_dot_versions_no_bump_emoji(
     # No commit has been made
     assert head_sha_before == head_after.hexsha
     assert len(tags_set_difference) == 0  # No tag created
+    assert mocked_git_ls_remote.call_count == 0  # no git ls-remote called
     assert mocked_git_fetch.call_count == 0  # no git fetch called
     assert mocked_git_push.call_count == 0  # no git push of tag or commit
     assert post_mocker.call_count == 0  # no vcs release
@@ -2645,6 +2679,7 @@ def test_version_next_w_zero_dot_versions_scipy(
     file_in_repo: str,
     update_pyproject_toml: UpdatePyprojectTomlFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     stable_now_date: GetStableDateNowFn,
@@ -2709,8 +2744,11 @@ def test_version_next_w_zero_dot_versions_scipy(
     assert len(tags_set_difference) == 1  # A tag has been created
     assert f"v{next_release_version}" in tags_set_difference
 
-    assert mocked_git_fetch.call_count == 1  # fetch called to check for remote changes
-    assert mocked_git_push.call_count == 2  # 1 for commit, 1 for tag
+    assert (
+        mocked_git_ls_remote.call_count == 1
+    )  # ls-remote called to check for remote changes
+    assert mocked_git_fetch.call_count == 0  # no git fetch called
+    assert mocked_git_push.call_count == 1  # 1 atomic push of the commit & tag
     assert post_mocker.call_count == 1  # vcs release creation occurred
 
 
@@ -2806,6 +2844,7 @@ def test_version_next_w_zero_dot_versions_no_bump_scipy(
     file_in_repo: str,
     update_pyproject_toml: UpdatePyprojectTomlFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     stable_now_date: GetStableDateNowFn,
@@ -2868,6 +2907,7 @@ def test_version_next_w_zero_dot_versions_no_bump_scipy(
     # No commit has been made
     assert head_sha_before == head_after.hexsha
     assert len(tags_set_difference) == 0  # No tag created
+    assert mocked_git_ls_remote.call_count == 0  # no git ls-remote called
     assert mocked_git_fetch.call_count == 0  # no git fetch called
     assert mocked_git_push.call_count == 0  # no git push of tag or commit
     assert post_mocker.call_count == 0  # no vcs release
@@ -3202,6 +3242,7 @@ def test_version_next_w_zero_dot_versions_minimums(
     file_in_repo: str,
     update_pyproject_toml: UpdatePyprojectTomlFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     stable_now_date: GetStableDateNowFn,
@@ -3267,6 +3308,9 @@ def test_version_next_w_zero_dot_versions_minimums(
     assert len(tags_set_difference) == 1  # A tag has been created
     assert f"v{next_release_version}" in tags_set_difference
 
-    assert mocked_git_fetch.call_count == 1  # fetch called to check for remote changes
-    assert mocked_git_push.call_count == 2  # 1 for commit, 1 for tag
+    assert (
+        mocked_git_ls_remote.call_count == 1
+    )  # ls-remote called to check for remote changes
+    assert mocked_git_fetch.call_count == 0  # no git fetch called
+    assert mocked_git_push.call_count == 1  # 1 atomic push of the commit & tag
     assert post_mocker.call_count == 1  # vcs release creation occurred
@@ -213,6 +213,7 @@ def test_version_partial_tag_creation(
     expected_moved_partial_tags: list[str],
     run_cli: RunCliFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     update_pyproject_toml: UpdatePyprojectTomlFn,
@@ -260,12 +261,11 @@ def test_version_partial_tag_creation(
     pyproject_toml_before.get("tool", {}).get("poetry", {}).pop("version", None)
 
     # Define expectations before execution (hypothesis)
-    expected_git_fetch_calls = 1
+    expected_git_ls_remote_calls = 1
+    expected_git_fetch_calls = 0
     expected_vcs_release_calls = 1
-    # 1 for commit, 1 for tag, 1 for each moved or created partial tag
-    expected_git_push_calls = (
-        2 + len(expected_new_partial_tags) + len(expected_moved_partial_tags)
-    )
+    # 1 atomic push of the commit, the tag & the moved or created partial tags
+    expected_git_push_calls = 1
 
     # Act
     cli_cmd = [MAIN_PROG_NAME, VERSION_SUBCMD, *cli_args]
@@ -321,8 +321,9 @@ def test_version_partial_tag_creation(
 
     # Expected external calls
     assert (
-        expected_git_fetch_calls == mocked_git_fetch.call_count
-    )  # fetch occurred before push
+        expected_git_ls_remote_calls == mocked_git_ls_remote.call_count
+    )  # ls-remote occurred before push
+    assert expected_git_fetch_calls == mocked_git_fetch.call_count
     assert expected_git_push_calls == mocked_git_push.call_count
     assert (
         expected_vcs_release_calls == post_mocker.call_count
@@ -56,6 +56,7 @@ def test_custom_release_notes_template(
     use_release_notes_template: UseReleaseNotesTemplateFn,
     retrieve_runtime_context: RetrieveRuntimeContextFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
 ) -> None:
@@ -90,8 +91,11 @@ def test_custom_release_notes_template(
 
     # Assert
     assert_successful_exit_code(result, cli_cmd)
-    assert mocked_git_fetch.call_count == 1  # fetch called to check for remote changes
-    assert mocked_git_push.call_count == 2  # 1 for commit, 1 for tag
+    assert (
+        mocked_git_ls_remote.call_count == 1
+    )  # ls-remote called to check for remote changes
+    assert mocked_git_fetch.call_count == 0  # no git fetch called
+    assert mocked_git_push.call_count == 1  # 1 atomic push of the commit & tag
     assert post_mocker.call_count == 1
     assert post_mocker.last_request is not None
 
@@ -131,6 +135,7 @@ def test_default_release_notes_license_statement(
     mask_initial_release: bool,
     update_pyproject_toml: UpdatePyprojectTomlFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: Mocker,
     stable_now_date: GetStableDateNowFn,
@@ -178,8 +183,11 @@ def test_default_release_notes_license_statement(
 
     # Evaluate
     assert_successful_exit_code(result, cli_cmd)
-    assert mocked_git_fetch.call_count == 1  # fetch called to check for remote changes
-    assert mocked_git_push.call_count == 2  # 1 for commit, 1 for tag
+    assert (
+        mocked_git_ls_remote.call_count == 1
+    )  # ls-remote called to check for remote changes
+    assert mocked_git_fetch.call_count == 0  # no git fetch called
+    assert mocked_git_push.call_count == 1  # 1 atomic push of the commit & tag
     assert post_mocker.call_count == 1
     assert post_mocker.last_request is not None
     request_body = post_mocker.last_request.json()
@@ -59,6 +59,7 @@ def test_version_only_stamp_version(
     expected_new_version: str,
     run_cli: RunCliFn,
     mocked_git_fetch: MagicMock,
+    mocked_git_ls_remote: MagicMock,
     mocked_git_push: MagicMock,
     post_mocker: MagicMock,
     example_pyproject_toml: Path,
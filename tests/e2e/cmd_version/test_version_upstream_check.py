@@ -5,6 +5,7 @@ from __future__ import annotations
 import contextlib
 from pathlib import PureWindowsPath
 from typing import TYPE_CHECKING, cast
+from unittest import mock
 
 import pytest
 from git import Repo
@@ -66,6 +67,7 @@ def test_version_upstream_check_success_no_changes(
     example_project_dir: ExProjectDir,
     git_repo_for_directory: GetGitRepo4DirFn,
     post_mocker: Mocker,
+    spied_git_remote_cmds: mock.MagicMock,
     get_cfg_value_from_def: GetCfgValueFromDefFn,
     get_versions_from_repo_build_def: GetVersionsFromRepoBuildDefFn,
     pyproject_toml_file: Path,
@@ -136,6 +138,8 @@ def test_version_upstream_check_success_no_changes(
 
     current_head_sha = test_repo.head.commit.hexsha
 
+    spied_git_remote_cmds.reset_mock()
+
     # Act: run PSR on the cloned repo - it should verify upstream and succeed
     with temporary_working_directory(str(test_repo.working_dir)):
         cli_cmd = [MAIN_PROG_NAME, "--strict", VERSION_SUBCMD]
@@ -146,6 +150,12 @@ def test_version_upstream_check_success_no_changes(
     # Evaluate
     assert_successful_exit_code(result, cli_cmd)
 
+    # The upstream branch is read with ls-remote, without fetching
+    assert [
+        mock.call(remote_name, f"refs/heads/{test_repo.active_branch.name}")
+    ] == spied_git_remote_cmds.ls_remote.call_args_list
+    assert spied_git_remote_cmds.fetch.call_count == 0
+
     # Verify release occurred as expected
     with test_repo:
         assert latest_tag in test_repo.tags, "Expected release tag to be created"
@@ -183,6 +193,7 @@ def test_version_upstream_check_success_no_changes_untracked_branch(
     example_project_dir: ExProjectDir,
     git_repo_for_directory: GetGitRepo4DirFn,
     post_mocker: Mocker,
+    spied_git_remote_cmds: mock.MagicMock,
     get_cfg_value_from_def: GetCfgValueFromDefFn,
     get_versions_from_repo_build_def: GetVersionsFromRepoBuildDefFn,
     pyproject_toml_file: Path,
@@ -267,6 +278,8 @@ def test_version_upstream_check_success_no_changes_untracked_branch(
     # 2. Forcefully set the branch to the current detached head
     test_repo.git.checkout("-B", ci_branch)
 
+    spied_git_remote_cmds.reset_mock()
+
     # Act: run PSR on the cloned repo - it should verify upstream and succeed
     with temporary_working_directory(str(test_repo.working_dir)):
         cli_cmd = [MAIN_PROG_NAME, "--strict", VERSION_SUBCMD]
@@ -277,6 +290,13 @@ def test_version_upstream_check_success_no_changes_untracked_branch(
     # Evaluate
     assert_successful_exit_code(result, cli_cmd)
 
+    # The upstream branch is read with ls-remote, the only fetch completes the
+    # history of the shallow clone
+    assert [
+        mock.call(remote_name, f"refs/heads/{ci_branch}")
+    ] == spied_git_remote_cmds.ls_remote.call_args_list
+    assert [mock.call("--unshallow")] == spied_git_remote_cmds.fetch.call_args_list
+
     # Verify release occurred as expected
     with test_repo:
         assert latest_tag in test_repo.tags, "Expected release tag to be created"
@@ -314,6 +334,7 @@ def test_version_no_upstream_check_on_no_version_commit(
     example_project_dir: ExProjectDir,
     git_repo_for_directory: GetGitRepo4DirFn,
     post_mocker: Mocker,
+    spied_git_remote_cmds: mock.MagicMock,
     get_cfg_value_from_def: GetCfgValueFromDefFn,
     get_versions_from_repo_build_def: GetVersionsFromRepoBuildDefFn,
     pyproject_toml_file: Path,
@@ -417,6 +438,8 @@ def test_version_no_upstream_check_on_no_version_commit(
     # 2. Forcefully set the branch to the current detached head
     test_repo.git.checkout("-B", ci_branch)
 
+    spied_git_remote_cmds.reset_mock()
+
     # Act: run PSR on the cloned repo - it should verify upstream and succeed
     with temporary_working_directory(str(test_repo.working_dir)):
         # We don't use `--no-commit` here because we want to test that the upstream check is skipped
@@ -436,6 +459,11 @@ def test_version_no_upstream_check_on_no_version_commit(
     # Evaluate
     assert_successful_exit_code(result, cli_cmd)
 
+    # The upstream is not read without a version commit, the only fetch completes
+    # the history of the shallow clone
+    assert spied_git_remote_cmds.ls_remote.call_count == 0
+    assert [mock.call("--unshallow")] == spied_git_remote_cmds.fetch.call_args_list
+
     # Verify release occurred as expected
     with test_repo:
         assert latest_tag in test_repo.tags, "Expected release tag to be created"
@@ -473,6 +501,7 @@ def test_version_upstream_check_fails_when_upstream_changed(
     example_project_dir: ExProjectDir,
     git_repo_for_directory: GetGitRepo4DirFn,
     post_mocker: Mocker,
+    spied_git_remote_cmds: mock.MagicMock,
     get_cfg_value_from_def: GetCfgValueFromDefFn,
     get_versions_from_repo_build_def: GetVersionsFromRepoBuildDefFn,
     pyproject_toml_file: Path,
@@ -548,6 +577,8 @@ def test_version_upstream_check_fails_when_upstream_changed(
     target_git_repo.index.commit("feat: upstream change by another developer")
     target_git_repo.git.push(remote_name, target_git_repo.active_branch.name)
 
+    spied_git_remote_cmds.reset_mock()
+
     # Act: run PSR - it should detect upstream changed and fail
     with temporary_working_directory(str(test_repo.working_dir)):
         cli_cmd = [MAIN_PROG_NAME, "--strict", VERSION_SUBCMD]
@@ -557,6 +588,12 @@ def test_version_upstream_check_fails_when_upstream_changed(
 
     # Evaluate
     assert_exit_code(1, result, cli_cmd)
+
+    # The upstream branch is read with ls-remote, without fetching
+    assert [
+        mock.call(remote_name, f"refs/heads/{test_repo.active_branch.name}")
+    ] == spied_git_remote_cmds.ls_remote.call_args_list
+    assert spied_git_remote_cmds.fetch.call_count == 0
     expected_err_msg = (
         f"Upstream branch '{remote_name}/{test_repo.active_branch.name}' has changed!"
     )
@@ -8,6 +8,7 @@ from unittest.mock import MagicMock
 
 import git.remote as git_remote
 import pytest
+from git.cmd import Git
 from requests_mock import ANY
 
 from semantic_release.cli import config as cli_config_module
@@ -23,7 +24,7 @@ from tests.util import prepare_mocked_git_command_wrapper_type
 
 if TYPE_CHECKING:
     from re import Pattern
-    from typing import Protocol
+    from typing import Any, Callable, Protocol
 
     from git.repo import Repo
     from pytest import MonkeyPatch
@@ -98,6 +99,62 @@ def mocked_git_fetch(monkeypatch: MonkeyPatch) -> MagicMock:
     return mocked_fetch
 
 
+@pytest.fixture
+def mocked_git_ls_remote(monkeypatch: MonkeyPatch) -> MagicMock:
+    """
+    Mock the `Repo.git.ls_remote()` method, which answers from the local
+    remote-tracking branches as if the remote was just fetched.
+    """
+    mocked_ls_remote = MagicMock()
+
+    def _ls_remote(self: Git, remote: str, *patterns: str) -> str:
+        mocked_ls_remote(remote, *patterns)
+        prefix = f"refs/remotes/{remote}/"
+        remote_refs = (
+            (sha, f"refs/heads/{ref_name[len(prefix) :]}")
+            for sha, ref_name in (
+                line.split(" ", maxsplit=1)
+                for line in self.for_each_ref(
+                    "--format=%(objectname) %(refname)", prefix
+                ).splitlines()
+            )
+        )
+        return str.join(
+            "\n",
+            (
+                f"{sha}\t{ref_name}"
+                for sha, ref_name in remote_refs
+                if ref_name in patterns
+            ),
+        )
+
+    # Set on the base class, so it survives other mocks of the git command wrapper
+    monkeypatch.setattr(Git, "ls_remote", _ls_remote, raising=False)
+
+    return mocked_ls_remote
+
+
+@pytest.fixture
+def spied_git_remote_cmds(monkeypatch: MonkeyPatch) -> MagicMock:
+    """
+    Record the `fetch` & `ls_remote` git commands, which still run against the
+    actual remote, ex. `spied_git_remote_cmds.ls_remote.call_count`.
+    """
+    spy = MagicMock()
+
+    def _spy_on(command: str) -> Callable[..., Any]:
+        def _run(self: Git, *args: Any, **kwargs: Any) -> Any:
+            getattr(spy, command)(*args, **kwargs)
+            return self._call_process(command, *args, **kwargs)
+
+        return _run
+
+    for command in ("fetch", "ls_remote"):
+        monkeypatch.setattr(Git, command, _spy_on(command), raising=False)
+
+    return spy
+
+
 @pytest.fixture
 def config_path(example_project_dir: ExProjectDir) -> Path:
     return example_project_dir / DEFAULT_CONFIG_FILE
@@ -477,6 +477,13 @@ if TYPE_CHECKING:
     class GetGitRepo4DirFn(Protocol):
         def __call__(self, directory: Path | str) -> Repo: ...
 
+    class BuildGitRepoWCommitsFn(Protocol):
+        def __call__(
+            self,
+            commits: Sequence[tuple[CommitMsg, str | None]] = (),
+            annotated_tags: bool = False,
+        ) -> Repo: ...
+
     class SplitRepoActionsByReleaseTagsFn(Protocol):
         def __call__(
             self,
@@ -2570,6 +2577,45 @@ def git_repo_for_directory() -> Generator[GetGitRepo4DirFn, None, None]:
             repo.close()
 
 
+@pytest.fixture
+def build_git_repo_w_commits(
+    tmp_path: Path,
+) -> Generator[BuildGitRepoWCommitsFn, None, None]:
+    """
+    Build a bare-bones repository of empty commits (in order) for tests which do not
+    need a whole example project. Each commit is tagged with its paired tag name, if
+    any, as an annotated tag when `annotated_tags` is set.
+    """
+    repos: list[Repo] = []
+
+    def _build_git_repo_w_commits(
+        commits: Sequence[tuple[CommitMsg, str | None]] = (),
+        annotated_tags: bool = False,
+    ) -> Repo:
+        repo = Repo.init(tmp_path / "repo")
+        repos.append(repo)
+        with repo.config_writer("repository") as config:
+            config.set_value("user", "name", "semantic release testing")
+            config.set_value("user", "email", "not_a_real@email.com")
+            config.set_value("commit", "gpgsign", False)
+            config.set_value("tag", "gpgsign", False)
+
+        for message, tag in commits:
+            repo.git.commit(m=message, allow_empty=True)
+            if tag and annotated_tags:
+                repo.git.tag(tag, a=True, m=tag)
+            elif tag:
+                repo.git.tag(tag)
+
+        return repo
+
+    try:
+        yield _build_git_repo_w_commits
+    finally:
+        for repo in repos:
+            repo.close()
+
+
 @pytest.fixture
 def example_project_git_repo(
     example_project_dir: ExProjectDir,
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from git import Git
+
+from semantic_release.changelog.history_cache import ReleaseHistoryCache
+from semantic_release.changelog.release_history import ReleaseHistory
+from semantic_release.commit_parser.conventional import ConventionalCommitParser
+from semantic_release.version.snapshot import HistorySnapshot
+from semantic_release.version.translator import VersionTranslator
+from semantic_release.version.version import Version
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from git import Repo
+
+    from tests.fixtures.git_repo import BuildGitRepoWCommitsFn
+
+
+@pytest.fixture
+def released_repo(build_git_repo_w_commits: BuildGitRepoWCommitsFn) -> Repo:
+    return build_git_repo_w_commits(
+        [
+            ("feat: initial release", "v1.0.0"),
+            ("fix: correct a bug", None),
+            ("docs: describe the fix", "v1.0.1"),
+            ("feat: add a feature", None),
+        ],
+        annotated_tags=True,
+    )
+
+
+def summarize(history: ReleaseHistory):
+    return (
+        {
+            commit_type: [result.commit.hexsha for result in results]
+            for commit_type, results in history.unreleased.items()
+        },
+        {
+            version: (
+                release["tagger"],
+                release["tagged_date"],
+                {
+                    commit_type: [result.commit.hexsha for result in results]
+                    for commit_type, results in release["elements"].items()
+                },
+            )
+            for version, release in history.released.items()
+        },
+    )
+
+
+def build_history(repo: Repo, parser: ConventionalCommitParser, cache_dir: Path):
+    return ReleaseHistory.from_git_history(
+        repo=repo,
+        translator=VersionTranslator(),
+        commit_parser=parser,
+        cache=ReleaseHistoryCache(cache_dir),
+    )
+
+
+def test_release_history_reuses_cached_releases(released_repo: Repo, tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    parser = ConventionalCommitParser()
+    expected = summarize(build_history(released_repo, parser, cache_dir))
+    assert (cache_dir / "release_history.json").exists()
+
+    # add a new release & an unreleased commit after the cached releases
+    released_repo.git.commit(m="fix: correct another bug", allow_empty=True)
+    released_repo.git.tag("v1.1.0", a=True, m="v1.1.0")
+    released_repo.git.commit(m="feat: add another feature", allow_empty=True)
+
+    with mock.patch.object(parser, parser.parse.__name__, wraps=parser.parse) as parse:
+        history = build_history(released_repo, parser, cache_dir)
+
+    # only the commits made after the last cached release are parsed
+    assert parse.call_count == 3
+    assert [Version.parse(v) for v in ("1.1.0", "1.0.1", "1.0.0")] == list(
+        history.released
+    )
+    assert {"features"} == set(history.unreleased)
+    _, released = summarize(history)
+    assert {v: released[v] for v in expected[1]} == expected[1]
+
+    # the new release is persisted so the next run parses only unreleased commits
+    with mock.patch.object(parser, parser.parse.__name__, wraps=parser.parse) as parse:
+        assert summarize(history) == summarize(
+            build_history(released_repo, parser, cache_dir)
+        )
+
+    assert parse.call_count == 1
+
+
+def test_release_history_rebuilds_when_tag_moves(released_repo: Repo, tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    parser = ConventionalCommitParser()
+    build_history(released_repo, parser, cache_dir)
+
+    # move v1.0.1 onto the previous commit, so "docs" becomes unreleased
+    released_repo.git.tag("v1.0.1", "HEAD~2", a=True, m="v1.0.1", f=True)
+    uncached_history = ReleaseHistory.from_git_history(
+        repo=released_repo,
+        translator=VersionTranslator(),
+        commit_parser=ConventionalCommitParser(),
+    )
+
+    with mock.patch.object(parser, parser.parse.__name__, wraps=parser.parse) as parse:
+        history = build_history(released_repo, parser, cache_dir)
+
+    assert parse.call_count == 4
+    assert summarize(uncached_history) == summarize(history)
+    assert {"features", "documentation"} == set(history.unreleased)
+
+
+def test_release_history_rebuilds_when_cached_commit_is_tagged(
+    released_repo: Repo, tmp_path: Path
+):
+    cache_dir = tmp_path / "cache"
+    parser = ConventionalCommitParser()
+    build_history(released_repo, parser, cache_dir)
+
+    # tag the "fix" commit of the cached v1.0.1 release
+    released_repo.git.tag("v1.0.1-rc.1", "HEAD~2", a=True, m="v1.0.1-rc.1")
+    uncached_history = ReleaseHistory.from_git_history(
+        repo=released_repo,
+        translator=VersionTranslator(),
+        commit_parser=ConventionalCommitParser(),
+    )
+
+    history = build_history(released_repo, parser, cache_dir)
+
+    assert Version.parse("1.0.1-rc.1") in history.released
+    assert summarize(uncached_history) == summarize(history)
+
+
+def test_release_history_cached_matches_uncached_after_merge(
+    build_git_repo_w_commits: BuildGitRepoWCommitsFn, tmp_path: Path
+):
+    repo = build_git_repo_w_commits(
+        [("feat: initial release", "v0.1.0")], annotated_tags=True
+    )
+    cache_dir = tmp_path / "cache"
+    parser = ConventionalCommitParser()
+    trunk_branch = repo.active_branch.name
+
+    repo.git.checkout("-b", "side")
+    repo.git.commit(m="feat: side", allow_empty=True)
+    repo.git.checkout(trunk_branch)
+    repo.git.commit(m="feat: trunk", allow_empty=True)
+    repo.git.tag("v0.2.0", a=True, m="v0.2.0")
+    build_history(repo, parser, cache_dir)
+
+    # merge the trunk into the side branch, so the tagged line is the second parent,
+    # then fast-forward the trunk to the merge
+    repo.git.checkout("side")
+    repo.git.merge(trunk_branch, no_ff=True, m="Merge branch 'trunk' into side")
+    repo.git.checkout(trunk_branch)
+    repo.git.merge("side", ff_only=True)
+
+    uncached_history = ReleaseHistory.from_git_history(
+        repo=repo,
+        translator=VersionTranslator(),
+        commit_parser=ConventionalCommitParser(),
+    )
+
+    assert summarize(uncached_history) == summarize(
+        build_history(repo, parser, cache_dir)
+    )
+
+
+def test_release_history_warm_cache_only_walks_new_commits(
+    released_repo: Repo, tmp_path: Path
+):
+    cache_dir = tmp_path / "cache"
+    parser = ConventionalCommitParser()
+    build_history(released_repo, parser, cache_dir)
+    released_repo.git.commit(m="fix: correct another bug", allow_empty=True)
+
+    snapshot = HistorySnapshot.from_repo(
+        released_repo, VersionTranslator(), commit_parser=parser
+    )
+    with mock.patch.object(
+        Git, Git.execute.__name__, autospec=True, side_effect=Git.execute
+    ) as execute:
+        history = ReleaseHistory.from_git_history(
+            repo=released_repo,
+            translator=VersionTranslator(),
+            commit_parser=parser,
+            snapshot=snapshot,
+            cache=ReleaseHistoryCache(cache_dir),
+        )
+
+    # a single walk of the commits made since the newest cached release
+    assert [call.args[1][1] for call in execute.call_args_list] == ["log"]
+    assert {"features", "bug fixes"} == set(history.unreleased)
@@ -302,3 +302,86 @@ def test_all_matching_repo_tags_are_released(
 
     for tag in repo.tags:
         assert translator.from_tag(tag.name) in release_history.released
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [
+        lazy_fixture(repo_w_trunk_only_conventional_commits.__name__),
+        *[
+            pytest.param(
+                lazy_fixture(repo_fixture_name),
+                marks=pytest.mark.comprehensive,
+            )
+            for repo_fixture_name in [
+                repo_w_trunk_only_n_prereleases_conventional_commits.__name__,
+                repo_w_github_flow_w_feature_release_channel_conventional_commits.__name__,
+                repo_w_git_flow_w_alpha_prereleases_n_conventional_commits.__name__,
+                repo_w_git_flow_w_rc_n_alpha_prereleases_n_conventional_commits.__name__,
+            ]
+        ],
+    ],
+)
+@pytest.mark.order("last")
+def test_windowed_release_history_matches_full_history(
+    repo_result: BuiltRepoResult, default_conventional_parser: ConventionalCommitParser
+):
+    repo = repo_result["repo"]
+    translator = VersionTranslator()
+    full_history = ReleaseHistory.from_git_history(
+        repo=repo,
+        translator=translator,
+        commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+    )
+    all_versions = sorted(full_history.released, reverse=True)
+
+    def summarize(history: ReleaseHistory) -> dict[Version, list[str]]:
+        return {
+            version: sorted(
+                str(result.commit.message)
+                for results in release["elements"].values()
+                for result in results
+            )
+            for version, release in history.released.items()
+        }
+
+    for window_size in range(len(all_versions) + 1):
+        windowed_versions = all_versions[:window_size]
+        expected = {
+            version: commits
+            for version, commits in summarize(full_history).items()
+            if version in windowed_versions
+        }
+
+        by_max_releases = ReleaseHistory.from_git_history(
+            repo=repo,
+            translator=translator,
+            commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+            max_releases=window_size,
+        )
+        assert expected == summarize(by_max_releases)
+        assert full_history.unreleased == by_max_releases.unreleased
+
+        if not windowed_versions:
+            continue
+
+        by_since_tag = ReleaseHistory.from_git_history(
+            repo=repo,
+            translator=translator,
+            commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+            since_tag=translator.str_to_tag(str(windowed_versions[-1])),
+        )
+        assert expected == summarize(by_since_tag)
+
+
+def test_windowed_release_history_requires_a_released_tag(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    with pytest.raises(ValueError, match="v1.0.0 is not a release"):
+        ReleaseHistory.from_git_history(
+            repo=repo_w_no_tags_conventional_commits["repo"],
+            translator=VersionTranslator(),
+            commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+            since_tag="v1.0.0",
+        )
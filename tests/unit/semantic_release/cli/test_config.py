@@ -25,7 +25,11 @@ from semantic_release.cli.config import (
     _known_hvcs,
 )
 from semantic_release.cli.util import load_raw_config_file
-from semantic_release.commit_parser.conventional import ConventionalCommitParserOptions
+from semantic_release.commit_parser.cache import CachedCommitParser
+from semantic_release.commit_parser.conventional import (
+    ConventionalCommitParser,
+    ConventionalCommitParserOptions,
+)
 from semantic_release.commit_parser.emoji import EmojiParserOptions
 from semantic_release.commit_parser.scipy import ScipyParserOptions
 from semantic_release.commit_parser.tag import TagParserOptions
@@ -227,6 +231,29 @@ def test_load_valid_runtime_config(
     assert runtime_ctx
 
 
+def test_load_runtime_config_w_cache_enabled(
+    build_configured_base_repo: BuildRepoFn,
+    example_project_dir: ExProjectDir,
+    example_pyproject_toml: Path,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    change_to_ex_proj_dir: None,
+):
+    build_configured_base_repo(example_project_dir)
+    update_pyproject_toml(
+        f"tool.{semantic_release.__name__}.cache",
+        {"enabled": True, "directory": ".psr_cache"},
+    )
+
+    runtime_ctx = RuntimeContext.from_raw_config(
+        RawConfig.model_validate(load_raw_config_file(example_pyproject_toml)),
+        global_cli_options=GlobalCommandLineOptions(),
+    )
+
+    assert isinstance(runtime_ctx.commit_parser, CachedCommitParser)
+    assert isinstance(runtime_ctx.commit_parser.parser, ConventionalCommitParser)
+    assert (example_project_dir / ".psr_cache").resolve() == runtime_ctx.cache_dir
+
+
 @pytest.mark.parametrize(
     "commit_parser",
     [
@@ -1,6 +1,10 @@
 import pytest
 
-from semantic_release.cli.commands.version import is_forced_prerelease
+from semantic_release.cli.commands.version import (
+    is_forced_prerelease,
+    is_full_release_tag,
+)
+from semantic_release.version.translator import VersionTranslator
 
 
 @pytest.mark.parametrize(
@@ -21,3 +25,18 @@ from semantic_release.cli.commands.version import is_forced_prerelease
 )
 def test_is_forced_prerelease(force_prerelease, force_level, prerelease, expected):
     assert is_forced_prerelease(force_prerelease, force_level, prerelease) == expected
+
+
+@pytest.mark.parametrize(
+    "tag_name, expected",
+    [
+        ("v1.0.0", True),
+        ("v1.1.0-rc.1", False),
+        # matches the tag format but is not a version
+        ("vlatest", False),
+        ("v-nightly", False),
+        ("not-a-release", False),
+    ],
+)
+def test_is_full_release_tag(tag_name: str, expected: bool):
+    assert expected == is_full_release_tag(tag_name, VersionTranslator())
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import sqlite3
+from textwrap import dedent
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from git import Commit, Repo
+
+from semantic_release.commit_parser.cache import (
+    CachedCommitParser,
+    ParseResultCache,
+    parser_fingerprint,
+)
+from semantic_release.commit_parser.conventional import (
+    ConventionalCommitParser,
+    ConventionalCommitParserOptions,
+)
+from semantic_release.commit_parser.token import ParsedCommit, ParseError
+
+from tests.util import CustomParserWithOpts
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from git import Actor
+
+
+@pytest.fixture
+def make_commit(commit_author: Actor):
+    def _make_commit(message: str, sha_char: str = "a") -> Commit:
+        return Commit(
+            repo=Repo(),
+            binsha=bytes.fromhex(sha_char * 40),
+            message=message,
+            author=commit_author,
+            authored_date=1700000000,
+            committer=commit_author,
+            committed_date=1700000000,
+            parents=[],
+        )
+
+    return _make_commit
+
+
+def test_cached_parser_reuses_results_from_disk(tmp_path: Path, make_commit):
+    commit = make_commit("feat(parser): add caching\n\nCloses: #123")
+    parser = ConventionalCommitParser()
+    expected = parser.parse(commit)
+
+    # First run populates the cache
+    first_cache = ParseResultCache(tmp_path)
+    CachedCommitParser(parser, cache=first_cache).parse(commit)
+    first_cache.close()
+
+    # Second run reads from disk without calling the wrapped parser
+    second_cache = ParseResultCache(tmp_path)
+    cached_parser = CachedCommitParser(parser, cache=second_cache)
+    with mock.patch.object(parser, parser.parse.__name__) as mocked_parse:
+        actual = cached_parser.parse(commit)
+
+    mocked_parse.assert_not_called()
+    assert expected == actual
+    assert (tmp_path / ".gitignore").exists()
+
+
+def test_cached_parser_preserves_unsquashed_messages(tmp_path: Path, make_commit):
+    commit = make_commit(
+        dedent(
+            """\
+            feat(cli): add a new command (#12)
+
+            * fix(config): resolve the path before validating it
+
+            * docs: describe the new command
+            """
+        )
+    )
+    parser = ConventionalCommitParser()
+    expected = parser.parse(commit)
+    cache = ParseResultCache(tmp_path)
+
+    CachedCommitParser(parser, cache=cache).parse(commit)
+    cache.close()
+
+    actual = CachedCommitParser(parser, cache=ParseResultCache(tmp_path)).parse(commit)
+
+    assert isinstance(actual, list)
+    assert isinstance(expected, list)
+    assert len(expected) == len(actual) == 3
+    for expected_result, actual_result in zip(expected, actual):
+        assert isinstance(actual_result, ParsedCommit)
+        assert expected_result.message == actual_result.message
+        assert expected_result.descriptions == actual_result.descriptions
+        assert (
+            expected_result.linked_merge_request == actual_result.linked_merge_request
+        )
+
+
+def test_cached_parser_caches_parse_errors(tmp_path: Path, make_commit):
+    commit = make_commit("not a conventional commit")
+    parser = ConventionalCommitParser()
+    cache = ParseResultCache(tmp_path)
+
+    CachedCommitParser(parser, cache=cache).parse(commit)
+    cache.close()
+
+    actual = CachedCommitParser(parser, cache=ParseResultCache(tmp_path)).parse(commit)
+
+    assert isinstance(actual, list)
+    assert isinstance(actual[0], ParseError)
+    assert actual == parser.parse(commit)
+
+
+def test_parser_fingerprint_depends_on_options():
+    default_parser = ConventionalCommitParser()
+    assert parser_fingerprint(default_parser) == parser_fingerprint(
+        ConventionalCommitParser()
+    )
+    assert parser_fingerprint(default_parser) != parser_fingerprint(
+        ConventionalCommitParser(
+            ConventionalCommitParserOptions(parse_squash_commits=False)
+        )
+    )
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path: Path):
+    cache = ParseResultCache(tmp_path, max_entries=2)
+
+    for sha in ("a", "b", "c"):
+        cache.set("fingerprint", sha, {"sha": sha})
+        # flush per entry to ensure distinct timestamps of use
+        cache.flush()
+
+    cache.close()
+
+    with sqlite3.connect(str(cache.db_file)) as conn:
+        remaining = {row[0] for row in conn.execute("SELECT sha FROM parse_results")}
+
+    assert {"b", "c"} == remaining
+
+
+def test_cache_disables_itself_on_error(tmp_path: Path):
+    # A file where the directory should be prevents creation of the database
+    cache_dir = tmp_path / "cache"
+    cache_dir.write_text("not a directory")
+    cache = ParseResultCache(cache_dir)
+
+    assert cache.get("fingerprint", "a") is None
+    cache.set("fingerprint", "a", {"sha": "a"})
+    cache.close()
+
+    assert cache.get("fingerprint", "a") is None
+
+
+def test_cached_parser_preserves_single_result_of_custom_parser(
+    tmp_path: Path, make_commit
+):
+    commit = make_commit("custom message")
+    parser = CustomParserWithOpts()
+    cache = ParseResultCache(tmp_path)
+
+    CachedCommitParser(parser, cache=cache).parse(commit)
+    cache.close()
+
+    actual = CachedCommitParser(parser, cache=ParseResultCache(tmp_path)).parse(commit)
+
+    assert isinstance(actual, ParsedCommit)
+    assert parser.parse(commit) == actual
+
+
+def test_cached_parser_parses_misses_as_a_batch(tmp_path: Path, make_commit):
+    parser = ConventionalCommitParser()
+    cache = ParseResultCache(tmp_path)
+    commits = [
+        make_commit("feat: add a feature", sha_char="a"),
+        make_commit("fix: correct a bug", sha_char="b"),
+        make_commit("docs: describe the fix", sha_char="c"),
+    ]
+    cached_parser = CachedCommitParser(parser, cache=cache)
+    cached_parser.parse(commits[1])
+
+    with mock.patch.object(
+        parser, parser.parse_many.__name__, wraps=parser.parse_many
+    ) as parse_many:
+        actual = cached_parser.parse_many(commits)
+
+    parse_many.assert_called_once_with([commits[0], commits[2]])
+    assert [parser.parse(commit) for commit in commits] == actual
+    assert all(cached_parser.load(commit) is not None for commit in commits)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import os
+from fnmatch import fnmatch
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from git import Repo
+
+from semantic_release.commit_parser.conventional import (
+    ConventionalCommitMonorepoParser,
+    ConventionalCommitMonorepoParserOptions,
+)
+from semantic_release.commit_parser.conventional.parser_monorepo import (
+    _compile_fnmatch_patterns,
+    _fnmatch_patterns_to_pathspecs,
+)
+from semantic_release.commit_parser.token import ParsedCommit, ParseError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [
+        ["/repo/pkg1", "/repo/pkg1/**"],
+        ["/repo/pkg1/*.py", "/repo/docs/[a-c]*", "/repo/pkg?/README.md"],
+        ["/repo/**"],
+        ["/repo/weird[name/**", "/repo/+(special)/**"],
+    ],
+)
+def test_compiled_patterns_match_like_fnmatch(patterns: list[str]):
+    paths = [
+        "/repo/pkg1",
+        "/repo/pkg1/src/module.py",
+        "/repo/pkg1/setup.py",
+        "/repo/pkg2/README.md",
+        "/repo/pkg10/README.md",
+        "/repo/docs/api.md",
+        "/repo/docs/index.md",
+        "/repo/weird[name/file.txt",
+        "/repo/+(special)/file.txt",
+        "/other/pkg1/setup.py",
+    ]
+    matcher = _compile_fnmatch_patterns(patterns)
+
+    assert matcher is not None
+    assert [any(fnmatch(path, pattern) for pattern in patterns) for path in paths] == [
+        bool(matcher.match(os.path.normcase(path))) for path in paths
+    ]
+
+
+def test_compiled_patterns_without_patterns():
+    assert _compile_fnmatch_patterns([]) is None
+
+
+def test_path_filters_compiled_once_per_working_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    repo = Repo.init(tmp_path / "repo")
+    with repo.config_writer("repository") as config:
+        config.set_value("user", "name", "semantic release testing")
+        config.set_value("user", "email", "not_a_real@email.com")
+        config.set_value("commit", "gpgsign", False)
+
+    for path in ("pkg1/src/feature.py", "pkg1/tests/test_feature.py", "pkg2/fix.py"):
+        file = tmp_path / "repo" / path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(path)
+        repo.git.add(path)
+        repo.git.commit(m=f"feat: add {path}")
+
+    monkeypatch.chdir(str(tmp_path / "repo" / "pkg1"))
+    parser = ConventionalCommitMonorepoParser(
+        ConventionalCommitMonorepoParserOptions(path_filters=(".", "!tests"))
+    )
+    relevant = [
+        parser._has_relevant_changed_files(commit) for commit in repo.iter_commits()
+    ]
+
+    # only the commit changing pkg1/src is relevant to the package in pkg1
+    assert relevant == [False, False, True]
+    assert len(parser._repo_path_filters) == 1
+
+
+@pytest.mark.parametrize(
+    "patterns, expected",
+    [
+        (
+            ["/repo/pkg1", "/repo/pkg1/**", "/repo/docs/*.md"],
+            (":(top)pkg1", ":(top)pkg1/**", ":(top)docs/*.md"),
+        ),
+        # patterns with ".." never match a path from git
+        (["/repo/pkg1/**", "/repo/pkg1/../../docs/**"], (":(top)pkg1/**",)),
+        # patterns which git interprets differently are not limited
+        (["/repo/pkg1/**", "/repo/pkg[!2]/**"], ()),
+    ],
+)
+@pytest.mark.skipif(os.name == "nt", reason="posix paths only")
+def test_fnmatch_patterns_to_pathspecs(patterns: list[str], expected: tuple[str, ...]):
+    assert expected == _fnmatch_patterns_to_pathspecs("/repo", patterns)
+
+
+def test_parser_skips_commits_outside_of_package(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    repo = Repo.init(tmp_path / "repo")
+    with repo.config_writer("repository") as config:
+        config.set_value("user", "name", "semantic release testing")
+        config.set_value("user", "email", "not_a_real@email.com")
+        config.set_value("commit", "gpgsign", False)
+
+    for message, path in [
+        ("feat: add a feature to pkg1", "pkg1/feature.py"),
+        ("fix: correct a bug in pkg2", "pkg2/fix.py"),
+        ("docs(pkg1-docs): describe pkg1", "docs/pkg1.md"),
+    ]:
+        file = tmp_path / "repo" / path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(message)
+        repo.git.add(path)
+        repo.git.commit(m=message)
+
+    monkeypatch.chdir(str(tmp_path / "repo" / "pkg1"))
+    parser = ConventionalCommitMonorepoParser(
+        ConventionalCommitMonorepoParserOptions(
+            path_filters=(".",), scope_prefix="pkg1-"
+        )
+    )
+
+    with mock.patch.object(
+        parser._base_parser,
+        parser._base_parser.unsquash_commit.__name__,
+        wraps=parser._base_parser.unsquash_commit,
+    ) as unsquash_commit:
+        docs_result, pkg2_result, pkg1_result = parser.parse_many(
+            list(repo.iter_commits())
+        )
+
+    # only the pkg2 commit is skipped, the docs commit has the package scope
+    assert unsquash_commit.call_count == 2
+    assert isinstance(pkg2_result, ParseError)
+    assert isinstance(pkg1_result, list)
+    assert isinstance(pkg1_result[0], ParsedCommit)
+    assert isinstance(docs_result, list)
+    assert isinstance(docs_result[0], ParsedCommit)
+    # only the changed files within the package are loaded from git
+    assert {("pkg1/feature.py",), ()} == set(
+        next(iter(parser._repo_path_filters.values())).changed_files.values()
+    )
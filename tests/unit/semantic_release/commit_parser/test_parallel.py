@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from textwrap import dedent
+from typing import TYPE_CHECKING
+
+import pytest
+
+from semantic_release.commit_parser.cache import CachedCommitParser, ParseResultCache
+from semantic_release.commit_parser.conventional import (
+    ConventionalCommitParser,
+    ConventionalCommitParserOptions,
+)
+from semantic_release.commit_parser.parallel import parse_commits_in_parallel
+from semantic_release.version.commit_graph import CommitGraph
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from git import Commit, Repo
+
+    from tests.fixtures.git_repo import BuildGitRepoWCommitsFn
+
+
+@pytest.fixture
+def history_repo(build_git_repo_w_commits: BuildGitRepoWCommitsFn) -> Repo:
+    repo = build_git_repo_w_commits(
+        [
+            ("feat: initial commit", None),
+            ("fix(parser): correct a bug\n\nResolves: #12", None),
+            ("not a conventional commit", None),
+            (
+                dedent(
+                    """\
+                    feat(cli): add some options (#20)
+
+                    * fix(cli): handle an empty value
+
+                    * docs(cli): describe the options
+                    """
+                ),
+                None,
+            ),
+            ("feat!: drop support for something\n\nBREAKING CHANGE: it is gone", None),
+        ]
+    )
+
+    repo.git.checkout("-b", "feature", "HEAD~2")
+    repo.git.commit(m="perf: speed up a thing", allow_empty=True)
+    repo.git.checkout("-")
+    repo.git.merge("feature", no_ff=True, m="Merge branch 'feature'")
+    return repo
+
+
+def history_commits(repo: Repo) -> list[Commit]:
+    graph = CommitGraph.from_git_log(repo, repo.head.commit.hexsha, topo_order=True)
+    return graph.to_commits(list(graph))
+
+
+@pytest.mark.parametrize("ignore_merge_commits", [True, False])
+def test_parallel_parse_matches_serial_parse(
+    history_repo: Repo, ignore_merge_commits: bool
+):
+    parser = ConventionalCommitParser(
+        ConventionalCommitParserOptions(ignore_merge_commits=ignore_merge_commits)
+    )
+    commits = history_commits(history_repo)
+
+    results = parse_commits_in_parallel(
+        parser, history_repo, commits, max_workers=2, min_commits=1
+    )
+
+    assert list(map(parser.parse, commits)) == results
+    # results are rebuilt around the original commit objects
+    assert all(
+        result.commit is commit
+        for commit, result in zip(commits, results)
+        if not isinstance(result, list)
+    )
+
+
+def test_parallel_parse_skips_cached_commits(history_repo: Repo, tmp_path: Path):
+    cache = ParseResultCache(tmp_path / "cache")
+    parser = ConventionalCommitParser()
+    cached_parser = CachedCommitParser(parser, cache)
+    commits = history_commits(history_repo)
+
+    # only the oldest commit is cached beforehand, with a distinguishable result
+    cache.set(
+        cached_parser.fingerprint,
+        commits[-1].hexsha,
+        {
+            "is_list": False,
+            "results": [{"kind": "error", "error": "cached", "message": None}],
+        },
+    )
+
+    results = parse_commits_in_parallel(
+        cached_parser, history_repo, commits, max_workers=2, min_commits=1
+    )
+
+    assert results[-1].error == "cached"  # type: ignore[union-attr]
+    assert list(map(parser.parse, commits[:-1])) == results[:-1]
+    # the results parsed by the workers are stored in the cache
+    assert all(cached_parser.load(commit) is not None for commit in commits)
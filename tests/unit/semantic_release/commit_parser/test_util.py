@@ -1,6 +1,33 @@
+from __future__ import annotations
+
+from copy import copy
+from textwrap import dedent
+from typing import TYPE_CHECKING
+from unittest import mock
+
 import pytest
+from git import Commit, Repo
+
+from semantic_release.commit_parser.conventional import (
+    ConventionalCommitMonorepoParser,
+    ConventionalCommitMonorepoParserOptions,
+    ConventionalCommitParser,
+)
+from semantic_release.commit_parser.emoji import EmojiCommitParser
+from semantic_release.commit_parser.scipy import ScipyCommitParser
+from semantic_release.commit_parser.util import (
+    CommitView,
+    changed_files_by_commit,
+    memoized_by_message,
+    parse_paragraphs,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from semantic_release.commit_parser._base import CommitParser
 
-from semantic_release.commit_parser.util import parse_paragraphs
+    from tests.conftest import MakeCommitObjFn
 
 
 @pytest.mark.parametrize(
@@ -24,3 +51,181 @@ from semantic_release.commit_parser.util import parse_paragraphs
 )
 def test_parse_paragraphs(text, expected):
     assert parse_paragraphs(text) == expected
+
+
+def test_memoized_by_message():
+    parse_message = mock.Mock(side_effect=ConventionalCommitParser().parse_message)
+    parse_message_once = memoized_by_message(parse_message)
+
+    first = parse_message_once("fix: correct a bug")
+    second = parse_message_once("fix: correct a bug")
+    parse_message_once("feat: add a feature")
+
+    assert first is second
+    assert parse_message.call_count == 2
+
+    # each memoized function keeps its own memo
+    memoized_by_message(parse_message)("fix: correct a bug")
+    assert parse_message.call_count == 3
+
+
+def test_parse_many_uses_subclass_overrides(make_commit_obj: MakeCommitObjFn):
+    class CustomParser(ConventionalCommitParser):
+        def parse_commit(self, commit: Commit):
+            return super().parse_commit(commit)
+
+    parser = CustomParser()
+    commits = [make_commit_obj("fix: correct a bug")] * 2
+
+    with mock.patch.object(
+        CustomParser, CustomParser.parse_commit.__name__, autospec=True
+    ) as parse_commit:
+        parser.parse_many(commits)
+
+    assert parse_commit.call_count == 2
+    # the parser itself is never modified by a batch
+    assert "parse_message" not in vars(parser)
+
+
+def test_parse_many_memoizes_subclass_parse_message(make_commit_obj: MakeCommitObjFn):
+    class CustomParser(ConventionalCommitParser):
+        def parse_message(self, message: str):
+            return super().parse_message(message.replace("bugfix", "fix"))
+
+    parser = CustomParser()
+    commits = [make_commit_obj("bugfix: correct a bug")] * 3
+
+    with mock.patch.object(
+        CustomParser,
+        CustomParser.parse_message.__name__,
+        autospec=True,
+        side_effect=CustomParser.parse_message,
+    ) as parse_message:
+        results = parser.parse_many(commits)
+
+    # the overridden message parsing hook is used, once per distinct message
+    assert parse_message.call_count == 1
+    assert [parser.parse(commit) for commit in commits] == results
+
+
+@pytest.mark.parametrize(
+    "parser",
+    [ConventionalCommitParser(), EmojiCommitParser(), ScipyCommitParser()],
+)
+def test_parse_many_matches_parse(
+    parser: CommitParser, make_commit_obj: MakeCommitObjFn
+):
+    commits = [
+        make_commit_obj(message)
+        for message in [
+            "fix: correct a bug\n\nResolves: #12, #13",
+            "Merge branch 'main' into feature",
+            "Merge branch 'main' into feature",
+            ":sparkles: add a feature",
+            "ENH: add a feature",
+            dedent(
+                """\
+                feat(cli): add some options (#20)
+
+                * fix(cli): handle an empty value
+
+                * docs(cli): describe the options
+                """
+            ),
+            "not a valid commit message",
+        ]
+    ]
+
+    assert [parser.parse(commit) for commit in commits] == parser.parse_many(commits)
+
+
+@pytest.fixture
+def monorepo(tmp_path: Path) -> Repo:
+    repo = Repo.init(tmp_path / "repo")
+    with repo.config_writer("repository") as config:
+        config.set_value("user", "name", "semantic release testing")
+        config.set_value("user", "email", "not_a_real@email.com")
+        config.set_value("commit", "gpgsign", False)
+
+    def commit(message: str, *paths: str) -> None:
+        for path in paths:
+            file = tmp_path / "repo" / path
+            file.parent.mkdir(parents=True, exist_ok=True)
+            file.write_text(f"{message}\n")
+            repo.git.add(path)
+
+        repo.git.commit(m=message, allow_empty=True)
+
+    commit("feat(pkg1): initial commit", "pkg1/README.md", "README.md")
+    commit("fix(pkg2): correct a bug", "pkg2/src/file with spaces.py")
+    repo.git.checkout("-b", "feature")
+    commit("feat(pkg1): add a feature", "pkg1/src/feature.py")
+    repo.git.checkout("-")
+    commit("docs: describe the packages", "docs/index.md")
+    repo.git.merge("feature", no_ff=True, m="Merge branch 'feature'")
+    repo.git.mv("pkg1/README.md", "pkg1/README.rst")
+    commit("docs(pkg1): rename the readme")
+    commit("chore: an empty commit")
+    return repo
+
+
+def test_changed_files_by_commit_matches_commit_stats(monorepo: Repo):
+    commits = list(monorepo.iter_commits())
+
+    actual = changed_files_by_commit(monorepo, [commit.hexsha for commit in commits])
+
+    assert {commit.hexsha: tuple(sorted(commit.stats.files)) for commit in commits} == {
+        sha: tuple(sorted(files)) for sha, files in actual.items()
+    }
+
+
+def test_monorepo_parse_many_loads_changed_files_once(
+    monorepo: Repo, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.chdir(str(monorepo.working_dir))
+    options = ConventionalCommitMonorepoParserOptions(
+        path_filters=("pkg1",), scope_prefix="pkg1"
+    )
+    commits = list(monorepo.iter_commits())
+    expected = list(map(ConventionalCommitMonorepoParser(options).parse, commits))
+
+    parser = ConventionalCommitMonorepoParser(options)
+    module = ConventionalCommitMonorepoParser.__module__
+    with mock.patch(
+        f"{module}.{changed_files_by_commit.__name__}", wraps=changed_files_by_commit
+    ) as loader:
+        actual = parser.parse_many(commits)
+
+    assert expected == actual
+    loader.assert_called_once()
+
+
+def test_commit_view_shares_the_original_commit(monorepo: Repo):
+    original = Commit(monorepo, monorepo.head.commit.binsha)
+    view = CommitView(original, b"chore: a separated message")
+
+    assert view.message == "chore: a separated message"
+    assert original == view
+    assert original.hexsha == view.hexsha
+    assert view.commit is original
+    # the lazily loaded attributes are shared with the original commit, not copied
+    assert original.author is view.author
+    assert original.parents is view.parents
+    assert original.committed_datetime == view.committed_datetime
+    assert original.message == "chore: an empty commit\n"
+
+    with pytest.raises(AttributeError):
+        view.message = "chore: another message"  # type: ignore[misc]
+
+    view_copy = copy(view)
+    assert isinstance(view_copy, CommitView)
+    assert view.message == view_copy.message
+    assert view_copy.commit is original
+
+
+def test_commit_view_of_a_view_uses_the_original_commit(monorepo: Repo):
+    original = monorepo.head.commit
+    view = CommitView(CommitView(original, "chore: a"), "chore: b")
+
+    assert view.commit is original
+    assert view.message == "chore: b"
@@ -3,19 +3,22 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, cast
-from unittest.mock import MagicMock, PropertyMock, patch
+from unittest.mock import MagicMock, PropertyMock, call, patch
 
 import pytest
-from git import GitCommandError
+from git import GitCommandError, Repo
 
 import semantic_release.gitproject
+from semantic_release.cli.commands.version import is_full_release_tag
 from semantic_release.errors import (
     DetachedHeadGitError,
     GitFetchError,
+    GitPushError,
     LocalGitError,
     UnknownUpstreamBranchError,
     UpstreamBranchChangedError,
 )
+from semantic_release.version.translator import VersionTranslator
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -28,6 +31,9 @@ if TYPE_CHECKING:
 
         rev_parse: MagicMock
         fetch: MagicMock
+        ls_remote: MagicMock
+        merge_base: MagicMock
+        cat_file: MagicMock
         push: MagicMock
 
     class RepoMock(MagicMock):
@@ -74,13 +80,11 @@ def mock_repo(tmp_path: Path) -> RepoMock:
     repo.remotes = {"origin": remote_obj}
     repo.refs = {"origin/main": ref_obj}
 
-    # Mock git.rev_parse
+    # Mock git.rev_parse & the upstream branch listed by git.ls_remote with the
+    # same SHA so that comparisons in verify_upstream_unchanged succeed.
     repo.git = MagicMock()
     repo.git.rev_parse = MagicMock(return_value="abc123")
-
-    # Ensure repo.commit returns a commit-like object with the expected hexsha
-    # and no parents so that comparisons in verify_upstream_unchanged succeed.
-    commit_obj.iter_parents = MagicMock(return_value=[])
+    repo.git.ls_remote = MagicMock(return_value="abc123\trefs/heads/main")
     repo.commit = MagicMock(return_value=commit_obj)
 
     return repo
@@ -98,9 +102,7 @@ def mock_gitproject(
 ) -> Generator[GitProject, None, None]:
     """Patch the GitProject to use the mock Repo."""
     module_path = semantic_release.gitproject.__name__
-    with patch(f"{module_path}.Repo") as mock_repo_class:
-        mock_repo_class.return_value.__enter__ = MagicMock(return_value=mock_repo)
-        mock_repo_class.return_value.__exit__ = MagicMock(return_value=False)
+    with patch(f"{module_path}.Repo", return_value=mock_repo):
         yield git_project
 
 
@@ -111,10 +113,13 @@ def test_verify_upstream_unchanged_success(
     # Should not raise an exception
     mock_gitproject.verify_upstream_unchanged(local_ref="HEAD", noop=False)
 
-    # Verify fetch was called
-    mock_repo.remotes["origin"].fetch.assert_called_once()
+    # Verify only the upstream branch was listed, without fetching
+    mock_repo.git.ls_remote.assert_called_once_with("origin", "refs/heads/main")
+    mock_repo.remotes["origin"].fetch.assert_not_called()
     # Verify rev_parse was called for HEAD
     mock_repo.git.rev_parse.assert_called_once_with("HEAD")
+    # Verify the ancestry was not checked as the SHAs are the same
+    mock_repo.git.merge_base.assert_not_called()
 
 
 def test_verify_upstream_unchanged_fails_when_changed(
@@ -125,18 +130,64 @@ def test_verify_upstream_unchanged_fails_when_changed(
     mock_repo.git.rev_parse = MagicMock(
         return_value="def456"  # Different from upstream
     )
+    # The upstream commit is not an ancestor of the local commit
+    mock_repo.git.merge_base = MagicMock(side_effect=GitCommandError("merge-base", 1))
+
+    with pytest.raises(
+        UpstreamBranchChangedError, match=r"Upstream branch .* has changed"
+    ):
+        mock_gitproject.verify_upstream_unchanged(local_ref="HEAD", noop=False)
 
-    # Ensure repo.commit returns a commit-like object with the different hexsha
-    changed_commit = MagicMock()
-    changed_commit.hexsha = "def456"
-    changed_commit.iter_parents = MagicMock(return_value=[])
-    mock_repo.commit = MagicMock(return_value=changed_commit)
+    mock_repo.git.merge_base.assert_called_once_with(
+        "--is-ancestor", "abc123", "def456"
+    )
+
+
+def test_verify_upstream_unchanged_fails_when_upstream_commit_unknown(
+    mock_gitproject: GitProject, mock_repo: RepoMock
+):
+    """Test that an upstream commit missing from the local repository is a change."""
+    mock_repo.git.rev_parse = MagicMock(return_value="def456")
+    mock_repo.git.merge_base = MagicMock(
+        side_effect=GitCommandError("merge-base", 128, "fatal: Not a valid commit name")
+    )
+    mock_repo.git.cat_file = MagicMock(side_effect=GitCommandError("cat-file", 128))
 
     with pytest.raises(
         UpstreamBranchChangedError, match=r"Upstream branch .* has changed"
     ):
         mock_gitproject.verify_upstream_unchanged(local_ref="HEAD", noop=False)
 
+    mock_repo.git.cat_file.assert_called_once_with("-e", "abc123^{commit}")
+
+
+def test_verify_upstream_unchanged_ancestry_check_fails(
+    mock_gitproject: GitProject, mock_repo: RepoMock
+):
+    """Test that any other failure of the ancestry check is a local git error."""
+    mock_repo.git.rev_parse = MagicMock(return_value="def456")
+    mock_repo.git.merge_base = MagicMock(
+        side_effect=GitCommandError("merge-base", 128, "fatal: unexpected error")
+    )
+
+    with pytest.raises(LocalGitError, match="Unable to compare local ref 'HEAD'"):
+        mock_gitproject.verify_upstream_unchanged(local_ref="HEAD", noop=False)
+
+
+def test_verify_upstream_unchanged_when_ahead_of_upstream(
+    mock_gitproject: GitProject, mock_repo: RepoMock
+):
+    """Test that verify_upstream_unchanged succeeds when upstream is an ancestor."""
+    # The local commit is a descendant of upstream (ex. the release commit)
+    mock_repo.git.rev_parse = MagicMock(return_value="def456")
+
+    # Should not raise an exception
+    mock_gitproject.verify_upstream_unchanged(local_ref="HEAD", noop=False)
+
+    mock_repo.git.merge_base.assert_called_once_with(
+        "--is-ancestor", "abc123", "def456"
+    )
+
 
 def test_verify_upstream_unchanged_noop(
     mock_gitproject: GitProject, mock_repo: RepoMock
@@ -200,12 +251,14 @@ def test_verify_upstream_unchanged_fetch_fails(
     mock_gitproject: GitProject, mock_repo: RepoMock
 ):
     """Test that verify_upstream_unchanged raises GitFetchError when fetch fails."""
-    # Mock fetch to raise an error
-    mock_repo.remotes["origin"].fetch = MagicMock(
-        side_effect=GitCommandError("fetch", "error")
+    # Mock ls-remote to raise an error
+    mock_repo.git.ls_remote = MagicMock(
+        side_effect=GitCommandError("ls-remote", "error")
     )
 
-    with pytest.raises(GitFetchError, match="Failed to fetch from remote"):
+    with pytest.raises(
+        GitFetchError, match="Failed to read upstream branch 'main' from remote"
+    ):
         mock_gitproject.verify_upstream_unchanged(local_ref="HEAD", noop=False)
 
 
@@ -213,10 +266,9 @@ def test_verify_upstream_unchanged_upstream_sha_fails(
     mock_gitproject: GitProject, mock_repo: RepoMock
 ):
     """Test that verify_upstream_unchanged raises error when upstream SHA cannot be determined."""
-    # Mock refs to raise AttributeError (simulating missing branch)
-    mock_repo.remotes["origin"].refs = MagicMock()
-    mock_repo.remotes["origin"].refs.__getitem__ = MagicMock(
-        side_effect=AttributeError("No such ref")
+    # Mock ls-remote to list no matching branch (simulating missing branch)
+    mock_repo.git.ls_remote = MagicMock(
+        return_value="abc123\trefs/heads/other/refs/heads/main"
     )
 
     with pytest.raises(GitFetchError, match="Unable to determine upstream branch SHA"):
@@ -261,11 +313,10 @@ def test_verify_upstream_unchanged_with_remote_url(
         local_ref="HEAD", remote_url=remote_url, noop=False
     )
 
-    # Verify git.fetch was called with the remote_url and proper refspec instead of remote_ref_obj.fetch()
-    mock_repo.git.fetch.assert_called_once_with(
-        remote_url, "refs/heads/main:refs/remotes/origin/main"
-    )
-    # Verify that remote_ref_obj.fetch() was NOT called
+    # Verify git.ls_remote was called with the remote_url instead of the remote name
+    mock_repo.git.ls_remote.assert_called_once_with(remote_url, "refs/heads/main")
+    # Verify that nothing was fetched
+    mock_repo.git.fetch.assert_not_called()
     mock_repo.remotes["origin"].fetch.assert_not_called()
 
 
@@ -330,3 +381,270 @@ def test_git_unshallow_other_error(
     # Should raise the exception
     with pytest.raises(GitCommandError):
         mock_gitproject.git_unshallow(noop=False)
+
+
+@pytest.fixture
+def shallow_clone(tmp_path: Path) -> Repo:
+    """
+    Create a shallow clone of a repository with 2 releases within 60 commits & with
+    prereleases before & after the latest release.
+    """
+    origin = Repo.init(tmp_path / "origin")
+    with origin.config_writer("repository") as config:
+        config.set_value("user", "name", "semantic release testing")
+        config.set_value("user", "email", "not_a_real@email.com")
+        config.set_value("commit", "gpgsign", False)
+        config.set_value("tag", "gpgsign", False)
+
+    for i in range(1, 61):
+        origin.git.commit(m=f"fix: commit {i}", allow_empty=True)
+        if i in (10, 40):
+            origin.git.tag(f"v1.{i}.0", a=True, m=f"v1.{i}.0")
+
+    origin.git.tag("not-a-release", "HEAD~5")
+    # matches the tag format but is not a version
+    origin.git.tag("vlatest", "HEAD~2")
+    origin.git.tag("v1.41.0-rc.1", "HEAD~10", a=True, m="v1.41.0-rc.1")
+    origin.git.tag("v1.20.0-beta.1", "HEAD~40", a=True, m="v1.20.0-beta.1")
+
+    return Repo.clone_from(
+        f"file://{(tmp_path / 'origin').as_posix()}",
+        tmp_path / "clone",
+        depth=1,
+    )
+
+
+@pytest.mark.parametrize(
+    "depth_step, fetched_commits",
+    [
+        # the commit of the clone, then steps of 5, 10 & 20 commits until v1.40.0
+        (5, 36),
+        (50, 51),
+    ],
+)
+def test_git_deepen_to_release(
+    shallow_clone: Repo, depth_step: int, fetched_commits: int
+) -> None:
+    """Test the clone is only deepened until the latest release is fetched."""
+    translator = VersionTranslator()
+    project = semantic_release.gitproject.GitProject(shallow_clone.working_dir)
+
+    with project:
+        project.git_deepen_to_release(
+            lambda tag: is_full_release_tag(tag, translator), depth_step=depth_step
+        )
+
+        assert fetched_commits == int(project.repo.git.rev_list("--count", "HEAD"))
+        assert project.is_shallow_clone()
+        # neither the prerelease made after the latest release nor a tag which is
+        # not a version stops the deepening
+        assert {"vlatest", "v1.41.0-rc.1", "v1.40.0"} <= set(
+            project.repo.git.tag().split()
+        )
+
+
+@pytest.mark.parametrize(
+    "prerelease_token",
+    [
+        # a prerelease was made since the latest release
+        "rc",
+        # the first prerelease since the latest release
+        "beta",
+    ],
+)
+def test_git_deepen_to_release_for_prerelease(
+    shallow_clone: Repo, prerelease_token: str
+) -> None:
+    """Test a prerelease only needs the history since the latest full release."""
+    translator = VersionTranslator(prerelease_token=prerelease_token)
+    project = semantic_release.gitproject.GitProject(shallow_clone.working_dir)
+
+    with project:
+        project.git_deepen_to_release(
+            lambda tag: is_full_release_tag(tag, translator), depth_step=5
+        )
+
+        assert int(project.repo.git.rev_list("--count", "HEAD")) == 36
+        assert project.is_shallow_clone()
+        assert "v1.20.0-beta.1" not in project.repo.git.tag().split()
+
+
+def test_git_deepen_to_release_without_releases(shallow_clone: Repo) -> None:
+    """Test the clone is fully fetched when none of its tags are releases."""
+    project = semantic_release.gitproject.GitProject(shallow_clone.working_dir)
+
+    with project:
+        project.git_deepen_to_release(lambda _: False, depth_step=5)
+
+        assert not project.is_shallow_clone()
+        assert int(project.repo.git.rev_list("--count", "HEAD")) == 60
+
+
+def test_git_deepen_to_release_noop(
+    mock_gitproject: GitProject, mock_repo: RepoMock
+) -> None:
+    """Test git_deepen_to_release in noop mode does not execute the command."""
+    mock_gitproject.git_deepen_to_release(lambda _: True, noop=True)
+    mock_repo.git.fetch.assert_not_called()
+
+
+def test_repo_is_shared_until_closed(
+    git_project: GitProject, mock_repo: RepoMock
+) -> None:
+    """Test the repository is opened once & shared by all operations until closed."""
+    module_path = semantic_release.gitproject.__name__
+    with patch(f"{module_path}.Repo", return_value=mock_repo) as mock_repo_class:
+        git_project.is_shallow_clone()
+        git_project.git_push_branch("https://example.com/repo.git", "main")
+        git_project.git_push_tag("https://example.com/repo.git", "v1.0.0")
+
+        assert mock_repo_class.call_count == 1
+
+        git_project.close()
+        mock_repo.close.assert_called_once()
+
+        git_project.is_shallow_clone()
+        assert mock_repo_class.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "cached_diff_status, working_diff_status, expected",
+    [(0, 0, False), (1, 0, True), (0, 1, True)],
+)
+def test_is_dirty(
+    mock_gitproject: GitProject,
+    mock_repo: RepoMock,
+    cached_diff_status: int,
+    working_diff_status: int,
+    expected: bool,
+) -> None:
+    """Test is_dirty checks the index & working tree with quiet diffs."""
+
+    def diff(*args: str) -> str:
+        status = cached_diff_status if "--cached" in args else working_diff_status
+        if status:
+            raise GitCommandError(["git", "diff", *args], status=status)
+        return ""
+
+    mock_repo.git.diff = MagicMock(side_effect=diff)
+
+    assert mock_gitproject.is_dirty() is expected
+    assert all("--quiet" in call.args for call in mock_repo.git.diff.call_args_list)
+
+
+def test_is_dirty_raises_on_git_error(
+    mock_gitproject: GitProject, mock_repo: RepoMock
+) -> None:
+    """Test is_dirty raises errors other than the differences found exit code."""
+    mock_repo.git.diff = MagicMock(
+        side_effect=GitCommandError(["git", "diff"], status=128)
+    )
+
+    with pytest.raises(GitCommandError):
+        mock_gitproject.is_dirty()
+
+
+@pytest.fixture
+def clone_of_bare_remote(tmp_path: Path) -> Repo:
+    """Create a clone of a bare remote with a released commit & its partial tags."""
+    remote = Repo.init(tmp_path / "remote.git", bare=True)
+    clone = Repo.clone_from(remote.git_dir, tmp_path / "clone")
+    with clone.config_writer("repository") as config:
+        config.set_value("user", "name", "semantic release testing")
+        config.set_value("user", "email", "not_a_real@email.com")
+        config.set_value("commit", "gpgsign", False)
+        config.set_value("tag", "gpgsign", False)
+
+    clone.git.commit(m="feat: initial release", allow_empty=True)
+    for tag in ("v1.0.0", "v1", "v1.0"):
+        clone.git.tag(tag)
+
+    clone.git.push("origin", "HEAD", "--tags")
+    return clone
+
+
+def test_git_push_refs_atomic(clone_of_bare_remote: Repo) -> None:
+    """Test the branch, the tag & the moved partial tags are pushed at once."""
+    clone = clone_of_bare_remote
+    clone.git.commit(m="feat: add a feature", allow_empty=True)
+    clone.git.tag("v1.1.0")
+    clone.git.tag("v1", force=True)
+    clone.git.tag("v1.1")
+    branch = clone.active_branch.name
+    project = semantic_release.gitproject.GitProject(clone.working_dir)
+
+    with project:
+        project.git_push_refs(
+            str(clone.remotes.origin.url),
+            branches=[branch],
+            tags=["v1.1.0"],
+            force_tags=["v1", "v1.1"],
+        )
+
+    remote_refs = clone.git.ls_remote("origin", heads=True, tags=True).splitlines()
+    head_sha = clone.head.commit.hexsha
+    assert {
+        f"refs/heads/{branch}",
+        "refs/tags/v1.1.0",
+        "refs/tags/v1",
+        "refs/tags/v1.1",
+    } == {ref for sha, ref in map(str.split, remote_refs) if sha == head_sha}
+
+
+def test_git_push_refs_rejected_updates_nothing(clone_of_bare_remote: Repo) -> None:
+    """Test that no ref is updated when one of them is rejected by the remote."""
+    clone = clone_of_bare_remote
+    remote_refs_before = clone.git.ls_remote("origin")
+    clone.git.commit(m="feat: add a feature", allow_empty=True)
+    # Moving a tag which is not forced is rejected by the remote
+    clone.git.tag("v1.0.0", force=True)
+    project = semantic_release.gitproject.GitProject(clone.working_dir)
+
+    with project, pytest.raises(GitPushError):
+        project.git_push_refs(
+            str(clone.remotes.origin.url),
+            branches=[clone.active_branch.name],
+            tags=["v1.0.0"],
+        )
+
+    assert remote_refs_before == clone.git.ls_remote("origin")
+
+
+def test_git_push_refs_without_atomic_support(
+    mock_gitproject: GitProject, mock_repo: RepoMock
+) -> None:
+    """Test the refs are pushed without --atomic when the remote does not support it."""
+    mock_repo.git.push = MagicMock(
+        side_effect=[
+            GitCommandError(
+                "push", 128, "fatal: the receiving end does not support --atomic push"
+            ),
+            "",
+        ]
+    )
+
+    mock_gitproject.git_push_refs(
+        "https://example.com/repo.git", branches=["main"], tags=["v1.0.0"]
+    )
+
+    assert [
+        call(
+            "--atomic",
+            "https://example.com/repo.git",
+            "refs/heads/main",
+            "refs/tags/v1.0.0",
+        ),
+        call("https://example.com/repo.git", "refs/heads/main", "refs/tags/v1.0.0"),
+    ] == mock_repo.git.push.call_args_list
+
+
+def test_git_push_refs_noop(mock_gitproject: GitProject, mock_repo: RepoMock) -> None:
+    """Test git_push_refs in noop mode does not execute the command."""
+    mock_gitproject.git_push_refs(
+        "https://example.com/repo.git",
+        branches=["main"],
+        tags=["v1.0.0"],
+        force_tags=["v1"],
+        noop=True,
+    )
+    mock_repo.git.push.assert_not_called()
@@ -1,9 +1,28 @@
-from typing import Iterable
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
 
 import pytest
+from git import Repo
 
+from semantic_release.changelog.release_history import ReleaseHistory
+from semantic_release.commit_parser.conventional import (
+    ConventionalCommitMonorepoParser,
+    ConventionalCommitMonorepoParserOptions,
+)
 from semantic_release.globals import logger
-from semantic_release.helpers import ParsedGitUrl, parse_git_url, sort_numerically
+from semantic_release.helpers import (
+    LazyFetchCounter,
+    ParsedGitUrl,
+    disable_lazy_fetch,
+    parse_git_url,
+    sort_numerically,
+)
+from semantic_release.version.algorithm import next_version
+from semantic_release.version.translator import VersionTranslator
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 @pytest.mark.parametrize(
@@ -320,3 +339,117 @@ def test_sort_numerically(
         allow_hex=allow_hex,
     )
     assert sorted_list == actual_list
+
+
+@pytest.fixture
+def blobless_clone(tmp_path: Path) -> Repo:
+    origin = Repo.init(tmp_path / "origin")
+    with origin.config_writer("repository") as config:
+        config.set_value("user", "name", "semantic release testing")
+        config.set_value("user", "email", "not_a_real@email.com")
+        config.set_value("commit", "gpgsign", False)
+        config.set_value("tag", "gpgsign", False)
+        config.set_value("uploadpack", "allowFilter", True)
+
+    for message, path, tag in [
+        ("feat(pkg1): initial commit", "pkg1/README.md", "v1.0.0"),
+        ("fix(pkg2): correct a bug", "pkg2/file.py", None),
+        ("feat(pkg1): add a feature", "pkg1/feature.py", None),
+    ]:
+        file = tmp_path / "origin" / path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(f"{message}\n")
+        origin.git.add(path)
+        origin.git.commit(m=message)
+        if tag:
+            origin.git.tag(tag, a=True, m=tag)
+
+    return Repo.clone_from(
+        f"file://{(tmp_path / 'origin').as_posix()}",
+        tmp_path / "clone",
+        filter="blob:none",
+        no_checkout=True,
+    )
+
+
+def test_history_analysis_of_partial_clone_fetches_no_objects(
+    blobless_clone: Repo, monkeypatch: pytest.MonkeyPatch
+):
+    """Test the history analysis of a blobless clone only reads commits & trees."""
+    monkeypatch.chdir(blobless_clone.working_dir)
+    lazy_fetches = LazyFetchCounter(blobless_clone)
+    translator = VersionTranslator()
+    parser = ConventionalCommitMonorepoParser(
+        ConventionalCommitMonorepoParserOptions(
+            path_filters=("pkg1",), scope_prefix="pkg1"
+        )
+    )
+
+    next_version(
+        repo=blobless_clone,
+        translator=translator,
+        commit_parser=parser,  # type: ignore[arg-type]
+        allow_zero_version=True,
+        major_on_zero=True,
+    )
+    ReleaseHistory.from_git_history(
+        repo=blobless_clone, translator=translator, commit_parser=parser
+    )
+
+    assert lazy_fetches.is_partial_clone
+    assert lazy_fetches.count() == 0
+
+
+def test_lazy_fetch_counter_warns_of_fetched_objects(
+    blobless_clone: Repo, caplog: pytest.LogCaptureFixture
+):
+    """Test reading the contents of files in a blobless clone is counted & reported."""
+    lazy_fetches = LazyFetchCounter(blobless_clone)
+
+    # computing the stats of a commit reads the contents of its changed files
+    assert blobless_clone.head.commit.stats.total["lines"] == 1
+
+    caplog.set_level("WARNING", logger=logger.name)
+    assert lazy_fetches.warn_if_fetched("test operation") == 1
+    assert "The test operation fetched 1 missing objects" in caplog.text
+
+    # counting starts again after each warning
+    assert lazy_fetches.count() == 0
+
+
+def test_lazy_fetch_counter_of_full_clone(blobless_clone: Repo, tmp_path: Path):
+    """Test a full clone is never reported to have fetched objects."""
+    repo = Repo.clone_from(blobless_clone.remotes.origin.url, tmp_path / "full")
+    lazy_fetches = LazyFetchCounter(repo)
+
+    assert not lazy_fetches.is_partial_clone
+    assert lazy_fetches.warn_if_fetched("test operation") == 0
+
+
+def test_lazy_fetch_counter_of_clone_with_promisor_remote(
+    blobless_clone: Repo, tmp_path: Path
+):
+    """Test a partial clone is detected from its configuration, not from its packs."""
+    repo = Repo.clone_from(blobless_clone.remotes.origin.url, tmp_path / "full")
+    with repo.config_writer("repository") as config:
+        config.set_value('remote "origin"', "promisor", True)
+
+    assert LazyFetchCounter(repo).is_partial_clone
+
+
+def test_disable_lazy_fetch(blobless_clone: Repo):
+    """Test lazy fetching is only disabled within the context."""
+    with disable_lazy_fetch(blobless_clone):
+        assert blobless_clone.git.environment()["GIT_NO_LAZY_FETCH"] == "1"
+
+    assert "GIT_NO_LAZY_FETCH" not in blobless_clone.git.environment()
+
+
+def test_disable_lazy_fetch_restores_environment(blobless_clone: Repo):
+    """Test a value set before the context is restored when the context exits."""
+    blobless_clone.git.update_environment(GIT_NO_LAZY_FETCH="0")
+
+    with pytest.raises(RuntimeError), disable_lazy_fetch(blobless_clone):
+        raise RuntimeError("failed analysis")
+
+    assert blobless_clone.git.environment()["GIT_NO_LAZY_FETCH"] == "0"
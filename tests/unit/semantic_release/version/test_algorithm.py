@@ -4,12 +4,16 @@ from typing import TYPE_CHECKING
 from unittest import mock
 
 import pytest
-from git import Commit, Repo, TagReference
+from git import Repo
 
+from semantic_release.commit_parser.conventional import ConventionalCommitParser
 from semantic_release.enums import LevelBump
 from semantic_release.version.algorithm import (
+    _highest_level_bump,
     _increment_version,
     _traverse_graph_for_commits,
+    latest_tags_and_versions,
+    next_version,
     tags_and_versions,
 )
 from semantic_release.version.translator import VersionTranslator
@@ -18,89 +22,123 @@ from semantic_release.version.version import Version
 from tests.fixtures.repos import repo_w_initial_commit
 
 if TYPE_CHECKING:
+    from pathlib import Path
     from typing import Sequence
 
+    from tests.conftest import MakeCommitObjFn
+
+
+@pytest.fixture
+def empty_git_repo(tmp_path: Path) -> Repo:
+    repo = Repo.init(tmp_path)
+    with repo.config_writer("repository") as config:
+        config.set_value("user", "name", "semantic release testing")
+        config.set_value("user", "email", "not_a_real@email.com")
+        config.set_value("commit", "gpgsign", False)
+    return repo
+
+
+def _empty_commit(repo: Repo, message: str) -> str:
+    repo.git.commit(m=message, allow_empty=True)
+    return repo.head.commit.hexsha
+
 
 @pytest.mark.usefixtures(repo_w_initial_commit.__name__)
-def test_traverse_graph_for_commits():
-    # Setup fake git graph
+def test_traverse_graph_for_commits(empty_git_repo: Repo):
+    # Setup git graph
     """
-    * merge commit 6 (start) [3636363]
+    * merge commit 6 (start)
     |\
-    | * commit 5 [3535353]
-    | * commit 4 [3434343]
+    | * commit 5
+    | * commit 4
     |/
-    * commit 3 [3333333]
-    * commit 2 [3232323]
-    * commit 1 [3131313]
-    * v1.0.0 [3030303]
+    * commit 3
+    * commit 2
+    * commit 1
+    * v1.0.0
     """
-    repo = Repo()
-    v1_commit = Commit(repo, binsha=b"0" * 20, parents=[])
-
-    class TagReferenceOverride(TagReference):
-        commit = v1_commit  # mocking the commit property
-
-    v1_tag = TagReferenceOverride(repo, "refs/tags/v1.0.0", check_path=False)
-
-    trunk = Commit(
-        repo,
-        binsha=b"3" * 20,
-        parents=[
-            Commit(
-                repo,
-                binsha=b"2" * 20,
-                parents=[
-                    Commit(repo, binsha=b"1" * 20, parents=[v1_commit]),
-                ],
-            ),
-        ],
-    )
-    start_commit = Commit(
-        repo,
-        binsha=b"6" * 20,
-        parents=[
-            trunk,
-            Commit(
-                repo,
-                binsha=b"5" * 20,
-                parents=[
-                    Commit(repo, binsha=b"4" * 20, parents=[trunk]),
-                ],
-            ),
-        ],
-    )
+    repo = empty_git_repo
+
+    def commit(message: str) -> str:
+        return _empty_commit(repo, message)
 
-    commit_1 = trunk.parents[0].parents[0]
-    commit_2 = trunk.parents[0]
-    commit_3 = trunk
-    commit_4 = start_commit.parents[1].parents[0]
-    commit_5 = start_commit.parents[1]
-    commit_6 = start_commit
+    commit("v1.0.0")
+    repo.git.tag("v1.0.0")
+    trunk_branch = repo.active_branch.name
+
+    commit_1 = commit("commit 1")
+    commit_2 = commit("commit 2")
+    commit_3 = commit("commit 3")
+
+    repo.git.checkout("-b", "feature")
+    commit_4 = commit("commit 4")
+    commit_5 = commit("commit 5")
+
+    repo.git.checkout(trunk_branch)
+    repo.git.merge("feature", no_ff=True, m="merge commit 6")
+    start_commit = repo.head.commit
 
     expected_commit_order = [
-        commit_6.hexsha,
-        commit_5.hexsha,
-        commit_4.hexsha,
-        commit_3.hexsha,
-        commit_2.hexsha,
-        commit_1.hexsha,
+        start_commit.hexsha,
+        commit_5,
+        commit_4,
+        commit_3,
+        commit_2,
+        commit_1,
     ]
 
     # Execute
-    with mock.patch.object(
-        repo, repo.iter_commits.__name__, return_value=iter([v1_commit])
-    ):
-        actual_commit_order = [
-            commit.hexsha
-            for commit in _traverse_graph_for_commits(
-                head_commit=start_commit,
-                latest_release_tag_str=v1_tag.name,
-            )
-        ]
+    actual_commits = _traverse_graph_for_commits(
+        head_commit=start_commit,
+        latest_release_tag_str="v1.0.0",
+    )
 
     # Verify
-    assert expected_commit_order == actual_commit_order
+    assert expected_commit_order == [commit.hexsha for commit in actual_commits]
+    assert [commit_3, commit_5] == [
+        parent.hexsha for parent in actual_commits[0].parents
+    ]
+    assert str(actual_commits[-1].message).strip() == "commit 1"
+
+
+def test_traverse_graph_for_commits_includes_branches_forked_before_release(
+    empty_git_repo: Repo,
+):
+    # Setup git graph
+    """
+    * merge commit 4 (start)
+    |\
+    | * commit 3
+    * | commit 2
+    * | v1.0.0
+    |/
+    * commit 1
+    """
+    repo = empty_git_repo
+    commit_1 = _empty_commit(repo, "commit 1")
+    trunk_branch = repo.active_branch.name
+
+    repo.git.checkout("-b", "feature")
+    commit_3 = _empty_commit(repo, "commit 3")
+
+    repo.git.checkout(trunk_branch)
+    _empty_commit(repo, "v1.0.0")
+    repo.git.tag("v1.0.0")
+    commit_2 = _empty_commit(repo, "commit 2")
+    repo.git.merge("feature", no_ff=True, m="merge commit 4")
+    start_commit = repo.head.commit
+
+    # Execute
+    actual_commits = _traverse_graph_for_commits(
+        head_commit=start_commit,
+        latest_release_tag_str="v1.0.0",
+    )
+
+    # Verify: the walk stops at the release but not at the fork point of the branch
+    assert [start_commit.hexsha, commit_3, commit_2] == [
+        commit.hexsha for commit in actual_commits
+    ]
+    assert commit_1 not in [commit.hexsha for commit in actual_commits]
 
 
 @pytest.mark.parametrize(
@@ -369,3 +407,126 @@ def test_increment_version_invalid_operation(
             major_on_zero=False,
             allow_zero_version=True,
         )
+
+
+@pytest.mark.parametrize(
+    "count, max_parsed_tags",
+    [
+        (1, 20),
+        (2, 20),
+        (3, 20),
+        (5, 20),
+        # there are fewer releases than requested, so every tag is parsed
+        (20, 65),
+    ],
+)
+def test_latest_tags_and_versions(
+    empty_git_repo: Repo, count: int, max_parsed_tags: int
+):
+    _empty_commit(empty_git_repo, "feat: initial commit")
+    for tag in [
+        "v1.0.0-rc.1",
+        "v1.0.0",
+        "v1.1.0-rc.1",
+        "v1.1.0-rc.2",
+        "v1.1.0-rc.10",
+        "v1.1.0",
+        "v1.2.0-rc.1",
+        "v1.9.0",
+        "v1.10.0-alpha.1",
+        "v1.10.0-rc.1",
+        "v1",
+        "v1.9",
+        "other-2.0.0",
+        "v2.0.0-a",
+        "v2.0.0-a.1",
+    ]:
+        empty_git_repo.git.tag(tag)
+
+    # the nightly prereleases of old versions should not need to be parsed
+    for i in range(50):
+        empty_git_repo.git.tag(f"v0.1.0-nightly.{i}")
+
+    translator = VersionTranslator()
+    expected = tags_and_versions(empty_git_repo.tags, translator)[:count]
+
+    with mock.patch.object(
+        translator, translator.from_tag.__name__, wraps=translator.from_tag
+    ) as from_tag:
+        actual = latest_tags_and_versions(empty_git_repo, translator, count=count)
+
+    assert [(tag.name, version) for tag, version in expected] == [
+        (tag.name, version) for tag, version in actual
+    ]
+    assert all(tag.commit == empty_git_repo.head.commit for tag, _ in actual)
+    assert from_tag.call_count <= max_parsed_tags
+
+
+def test_latest_tags_and_versions_without_tags(empty_git_repo: Repo):
+    _empty_commit(empty_git_repo, "feat: initial commit")
+    empty_git_repo.git.tag("not-a-release")
+
+    assert latest_tags_and_versions(empty_git_repo, VersionTranslator()) == []
+
+
+def test_highest_level_bump_stops_at_the_ceiling(make_commit_obj: MakeCommitObjFn):
+    parser = ConventionalCommitParser()
+    consumed: list[str] = []
+
+    def parse_lazily(messages: list[str]):
+        for message in messages:
+            consumed.append(message)
+            yield parser.parse(make_commit_obj(message))
+
+    messages = ["fix: a", "not conventional", "feat: b", "feat!: c", "fix: d"]
+    assert _highest_level_bump(parse_lazily(messages)) == LevelBump.MAJOR
+    assert messages == consumed
+
+    consumed.clear()
+    assert (
+        _highest_level_bump(parse_lazily(messages), ceiling=LevelBump.MINOR)
+        == LevelBump.MINOR
+    )
+    assert messages[:3] == consumed
+
+
+@pytest.mark.parametrize(
+    "latest_tag, allow_zero_version, major_on_zero, expected_version, parsed_commits",
+    [
+        # the breaking change of the newest commit is found in the first batch
+        ("v1.0.0", True, True, "2.0.0", 32),
+        ("v0.1.0", True, False, "0.2.0", 32),
+        # every commit is bumped to 1.0.0 so none need to be parsed
+        ("v0.1.0", False, True, "1.0.0", 0),
+    ],
+)
+def test_next_version_short_circuit(
+    empty_git_repo: Repo,
+    latest_tag: str,
+    allow_zero_version: bool,
+    major_on_zero: bool,
+    expected_version: str,
+    parsed_commits: int,
+):
+    _empty_commit(empty_git_repo, "feat: initial commit")
+    empty_git_repo.git.tag(latest_tag)
+    for i in range(40):
+        _empty_commit(empty_git_repo, f"fix: correct bug {i}")
+
+    _empty_commit(empty_git_repo, "feat!: drop support for something")
+
+    parser = ConventionalCommitParser()
+    kwargs = {
+        "repo": empty_git_repo,
+        "translator": VersionTranslator(),
+        "commit_parser": parser,
+        "allow_zero_version": allow_zero_version,
+        "major_on_zero": major_on_zero,
+    }
+    assert expected_version == str(next_version(**kwargs))  # type: ignore[arg-type]
+
+    with mock.patch.object(parser, parser.parse.__name__, wraps=parser.parse) as parse:
+        actual = next_version(**kwargs, short_circuit=True)  # type: ignore[arg-type]
+
+    assert expected_version == str(actual)
+    assert parsed_commits == parse.call_count
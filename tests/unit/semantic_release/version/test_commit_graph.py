@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from git import GitCommandError
+
+from semantic_release.version.commit_graph import CommitGraph, stream_git_lines
+
+if TYPE_CHECKING:
+    from git import Repo
+
+    from tests.fixtures.git_repo import BuildGitRepoWCommitsFn
+
+
+@pytest.fixture
+def linear_repo(build_git_repo_w_commits: BuildGitRepoWCommitsFn) -> Repo:
+    return build_git_repo_w_commits([(f"commit {i}", f"v0.{i}.0") for i in range(1, 4)])
+
+
+def test_commit_graph_from_rev_list(linear_repo: Repo):
+    head_sha = linear_repo.head.commit.hexsha
+    parent_sha = linear_repo.head.commit.parents[0].hexsha
+
+    graph = CommitGraph.from_rev_list(linear_repo, head_sha, exclude=["v0.1.0"])
+
+    assert len(graph) == 2
+    assert head_sha in graph
+    assert linear_repo.commit("v0.1.0").hexsha not in graph
+    assert (parent_sha,) == graph.parents_of(head_sha)
+    # the traversal stops at the boundary of the loaded graph
+    assert [head_sha, parent_sha] == graph.traverse(head_sha)
+    assert [head_sha] == graph.traverse(head_sha, stop_shas=[parent_sha])
+
+
+def test_commit_graph_to_commit_lazily_loads_metadata(linear_repo: Repo):
+    head_sha = linear_repo.head.commit.hexsha
+    graph = CommitGraph.from_rev_list(linear_repo)
+
+    commit = graph.to_commit(head_sha)
+
+    assert str(commit.message).strip() == "commit 3"
+    assert [linear_repo.commit("v0.2.0").hexsha] == [p.hexsha for p in commit.parents]
+
+
+def test_stream_git_lines_raises_on_git_failure(linear_repo: Repo):
+    with pytest.raises(GitCommandError):
+        list(stream_git_lines(linear_repo, "rev_list", "does-not-exist", "--"))
+
+
+def test_commit_graph_from_git_log_loads_commit_metadata(linear_repo: Repo):
+    linear_repo.git.commit(
+        m="feat(graph): load metadata\n\nin bulk from one process\n",
+        allow_empty=True,
+        date="2024-01-02T03:04:05+05:30",
+    )
+    expected_commits = list(linear_repo.iter_commits("HEAD", topo_order=True))
+
+    graph = CommitGraph.from_git_log(linear_repo, topo_order=True)
+    actual_commits = [graph.to_commit(sha) for sha in graph]
+
+    assert [c.hexsha for c in expected_commits] == [c.hexsha for c in actual_commits]
+    for expected, actual in zip(expected_commits, actual_commits):
+        for attr in (
+            "message",
+            "author",
+            "authored_date",
+            "author_tz_offset",
+            "committer",
+            "committed_date",
+            "committer_tz_offset",
+            "encoding",
+        ):
+            assert getattr(expected, attr) == getattr(actual, attr), attr
+
+        assert expected.tree.hexsha == actual.tree.hexsha
+        assert [p.hexsha for p in expected.parents] == [
+            p.hexsha for p in actual.parents
+        ]
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from semantic_release.changelog.release_history import ReleaseHistory
+from semantic_release.commit_parser.conventional import ConventionalCommitParser
+from semantic_release.version.algorithm import next_version
+from semantic_release.version.snapshot import HistorySnapshot
+from semantic_release.version.translator import VersionTranslator
+from semantic_release.version.version import Version
+
+if TYPE_CHECKING:
+    from git import Repo
+
+    from tests.fixtures.git_repo import BuildGitRepoWCommitsFn
+
+
+@pytest.fixture
+def released_repo(build_git_repo_w_commits: BuildGitRepoWCommitsFn) -> Repo:
+    return build_git_repo_w_commits(
+        [
+            ("feat: initial release", "v1.0.0"),
+            ("fix: correct a bug", "v1.0.1"),
+            ("feat: add a feature", None),
+            ("docs: describe the feature", None),
+        ]
+    )
+
+
+def test_history_snapshot_from_repo(released_repo: Repo):
+    snapshot = HistorySnapshot.from_repo(
+        released_repo, VersionTranslator(), ConventionalCommitParser()
+    )
+
+    assert [Version.parse("1.0.1"), Version.parse("1.0.0")] == [
+        version for _, version in snapshot.tags_and_versions
+    ]
+    assert {Version.parse("1.0.0"), Version.parse("1.0.1")} == (
+        snapshot.released_versions
+    )
+    assert snapshot.last_released is not None
+    assert snapshot.last_released[0].name == "v1.0.1"
+    assert len(snapshot.commit_graph) == 4
+    assert released_repo.head.commit.hexsha == next(iter(snapshot.commit_graph))
+    assert snapshot.tag_commit_sha(snapshot.last_released[0]) == (
+        released_repo.commit("v1.0.1").hexsha
+    )
+
+
+def test_history_snapshot_shares_parse_results(released_repo: Repo):
+    translator = VersionTranslator()
+    parser = ConventionalCommitParser()
+    snapshot = HistorySnapshot.from_repo(released_repo, translator, parser)
+
+    with mock.patch.object(parser, parser.parse.__name__, wraps=parser.parse) as parse:
+        new_version = next_version(
+            repo=released_repo,
+            translator=translator,
+            commit_parser=parser,
+            allow_zero_version=True,
+            major_on_zero=True,
+            snapshot=snapshot,
+        )
+        history = ReleaseHistory.from_git_history(
+            repo=released_repo,
+            translator=translator,
+            commit_parser=parser,
+            snapshot=snapshot,
+        )
+
+    assert Version.parse("1.1.0") == new_version
+    assert {Version.parse("1.0.0"), Version.parse("1.0.1")} == set(history.released)
+    assert {"features", "documentation"} == set(history.unreleased)
+    # every commit is only parsed once even though both consumers read them
+    assert len(snapshot.commit_graph) == parse.call_count
+
+
+def test_history_snapshot_only_reads_tags_of_the_tag_format(released_repo: Repo):
+    released_repo.git.tag("pkg-b-v2.0.0")
+    released_repo.git.tag("pkg-a-v0.1.0", "HEAD~2")
+
+    snapshot = HistorySnapshot.from_repo(
+        released_repo,
+        VersionTranslator(tag_format="pkg-a-v{version}"),
+        ConventionalCommitParser(),
+    )
+
+    assert [tag.name for tag, _ in snapshot.tags_and_versions] == ["pkg-a-v0.1.0"]
+    assert {"pkg-a-v0.1.0"} == {tag.name for tag in snapshot.tag_index}
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+import pytest
+from git import TagObject
+
+from semantic_release.version.tag_index import (
+    TagIndex,
+    find_reachable_tags,
+    list_tags,
+)
+from semantic_release.version.translator import VersionTranslator
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from git import Repo
+
+    from tests.fixtures.git_repo import BuildGitRepoWCommitsFn
+
+
+@pytest.fixture
+def tagged_repo(
+    build_git_repo_w_commits: BuildGitRepoWCommitsFn, tmp_path: Path
+) -> Repo:
+    repo = build_git_repo_w_commits([("feat: initial commit", "v1.0.0")])
+    repo.git.commit(m="fix: a bug", allow_empty=True)
+    repo.git.tag("v1.0.1", a=True, m="annotated release")
+    trunk_branch = repo.active_branch.name
+
+    repo.git.checkout("-b", "feature")
+    repo.git.commit(m="feat: unreleased feature", allow_empty=True)
+    repo.git.tag("v1.1.0-rc.1")
+    repo.git.checkout(trunk_branch)
+
+    blob_file = tmp_path / "untracked.txt"
+    blob_file.write_text("not a commit")
+    repo.git.tag("blob-tag", repo.git.hash_object("-w", str(blob_file)))
+
+    return repo
+
+
+def test_find_reachable_tags(tagged_repo: Repo):
+    assert {"v1.0.0", "v1.0.1"} == find_reachable_tags(tagged_repo)
+    assert {"v1.0.0", "v1.0.1", "v1.1.0-rc.1"} == find_reachable_tags(
+        tagged_repo, "feature"
+    )
+    assert {"v1.0.0"} == find_reachable_tags(tagged_repo, pattern="refs/tags/v1.0.0")
+
+
+def test_list_tags_matching_pattern(tagged_repo: Repo):
+    assert {"v1.0.0", "v1.0.1", "v1.1.0-rc.1", "blob-tag"} == {
+        tag.name for tag in list_tags(tagged_repo)
+    }
+    assert {"v1.0.0", "v1.0.1", "v1.1.0-rc.1"} == {
+        tag.name for tag in list_tags(tagged_repo, "refs/tags/v*")
+    }
+
+
+def test_tag_index_from_repo(tagged_repo: Repo):
+    tagged_repo.git.tag(
+        "v1.0.1-nested",
+        "v1.0.1",
+        a=True,
+        m="tag of a tag",
+        env={"GIT_COMMITTER_DATE": "2024-01-02T03:04:05+05:30"},
+    )
+
+    tag_index = TagIndex.from_repo(tagged_repo)
+
+    assert {tag.name for tag in tagged_repo.tags} == {tag.name for tag in tag_index}
+    assert tag_index.commit_sha("blob-tag") is None
+    assert tag_index.commit_sha("does-not-exist") is None
+
+    for tag in tagged_repo.tags:
+        if tag.name == "blob-tag":
+            continue
+
+        # Resolve the tag metadata the slow way through GitPython
+        if isinstance(tag.object, TagObject):
+            expected_tagger = tag.object.tagger
+            _tz = timezone(timedelta(seconds=-1 * tag.object.tagger_tz_offset))
+            expected_date = datetime.fromtimestamp(tag.object.tagged_date, tz=_tz)
+        else:
+            expected_tagger = tag.object.author
+            _tz = timezone(timedelta(seconds=-1 * tag.object.author_tz_offset))
+            expected_date = datetime.fromtimestamp(tag.object.committed_date, tz=_tz)
+
+        tag_info = tag_index[tag.name]
+        assert tag.commit.hexsha == tag_info.commit_sha
+        assert isinstance(tag.object, TagObject) == tag_info.is_annotated
+        assert expected_tagger == tag_info.tagger
+        assert expected_date == tag_info.tagged_date
+        assert expected_date.utcoffset() == tag_info.tagged_date.utcoffset()
+
+
+def test_tag_index_from_repo_matching_pattern(tagged_repo: Repo):
+    tag_index = TagIndex.from_repo(tagged_repo, "refs/tags/v*")
+
+    assert {"v1.0.0", "v1.0.1", "v1.1.0-rc.1"} == {tag.name for tag in tag_index}
+    assert {tag.name for tag in tag_index} == {
+        tag.name for tag in tag_index.tags(tagged_repo)
+    }
+    assert all(
+        tag_index.commit_sha(tag.name) == tag.commit.hexsha
+        for tag in tag_index.tags(tagged_repo)
+    )
+
+
+@pytest.mark.parametrize(
+    "tag_format", ["v{version}", "pkg/v{version}", "v{version}/rel"]
+)
+def test_list_tags_matching_tag_refs_pattern(tagged_repo: Repo, tag_format: str):
+    translator = VersionTranslator(tag_format=tag_format)
+    tag = translator.str_to_tag("2.0.0")
+    tagged_repo.git.tag(tag)
+
+    assert tag in {
+        tag.name for tag in list_tags(tagged_repo, translator.tag_refs_pattern)
+    }
+    assert tag in find_reachable_tags(tagged_repo, pattern=translator.tag_refs_pattern)
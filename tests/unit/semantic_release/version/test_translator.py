@@ -92,3 +92,19 @@ def test_translator_converts_versions_with_default_formatting_rules(
     assert expected_tag == actual_tag
     assert expected_version_obj == (translator.from_tag(expected_tag) or "")
     assert version_string == str(translator.from_tag(actual_tag) or "")
+
+
+@pytest.mark.parametrize(
+    "tag_format, expected_pattern",
+    [
+        ("v{version}", "refs/tags/v*"),
+        ("pkg-a-v{version}", "refs/tags/pkg-a-v*"),
+        ("pkg/a/v{version}", "refs/tags/pkg/a/v*"),
+        ("{version}", "refs/tags/"),
+        ("release-*-{version}", "refs/tags/"),
+        # a '*' does not match the '/' after the version
+        ("v{version}/rel", "refs/tags/"),
+    ],
+)
+def test_translator_tag_refs_pattern(tag_format: str, expected_pattern: str):
+    assert expected_pattern == VersionTranslator(tag_format=tag_format).tag_refs_pattern
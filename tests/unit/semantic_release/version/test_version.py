@@ -1,5 +1,6 @@
 import operator
 import random
+from copy import copy, deepcopy
 
 import pytest
 
@@ -92,7 +93,7 @@ def a_version(request):
 )
 def test_tag_format_must_contain_version_field(a_version, bad_format):
     with pytest.raises(ValueError, match=f"Invalid tag_format {bad_format!r}"):
-        a_version.tag_format = bad_format
+        a_version.with_tag_format(bad_format)
 
 
 @pytest.mark.parametrize(
@@ -106,8 +107,9 @@ def test_tag_format_must_contain_version_field(a_version, bad_format):
     ],
 )
 def test_change_tag_format_updates_as_tag_method(a_version, tag_format):
-    a_version.tag_format = tag_format
-    assert a_version.as_tag() == tag_format.format(version=str(a_version))
+    new_version = a_version.with_tag_format(tag_format)
+    assert new_version.as_tag() == tag_format.format(version=str(a_version))
+    assert a_version == new_version
 
 
 @pytest.mark.parametrize(
@@ -329,3 +331,67 @@ def test_prerelease_always_less_than_full(major, minor, patch, prerelease_revisi
     full = Version(major, minor, patch)
     pre = Version(major, minor, patch, prerelease_revision=prerelease_revision)
     assert pre < full
+
+
+def test_deprecated_tag_format_setter():
+    version = Version.parse("1.2.3", tag_format="v{version}")
+
+    with pytest.deprecated_call():
+        version.tag_format = "release-{version}"
+
+    assert version.as_tag() == "release-1.2.3"
+    # the modified version is not returned by later parses of the same string
+    assert Version.parse("1.2.3", tag_format="v{version}").as_tag() == "v1.2.3"
+
+    with pytest.deprecated_call(), pytest.raises(
+        ValueError, match="Invalid tag_format"
+    ):
+        version.tag_format = "no_version_field"
+
+
+def test_version_is_immutable(a_version):
+    with pytest.raises(AttributeError):
+        a_version.build_metadata = "build.1"
+
+    with pytest.raises(AttributeError):
+        del a_version.major
+
+
+def test_version_with_build_metadata(a_version):
+    new_version = a_version.with_build_metadata("build.1")
+
+    assert str(new_version).endswith("+build.1")
+    assert a_version == new_version
+    assert hash(a_version) == hash(new_version)
+    assert a_version.tag_format == new_version.tag_format
+
+
+def test_version_parse_interns_versions():
+    assert Version.parse("1.2.3-rc.1") is Version.parse("1.2.3-rc.1")
+    assert Version.parse("1.2.3") is not Version.parse("1.2.3", tag_format="{version}")
+
+
+def test_version_copies_are_equal(a_version):
+    for new_version in (copy(a_version), deepcopy(a_version)):
+        assert a_version == new_version
+        assert repr(a_version) == repr(new_version)
+        assert a_version.sort_key == new_version.sort_key
+
+
+def test_version_sort_key_matches_comparison():
+    versions = [Version.parse(version_str) for version_str in EXAMPLE_VERSION_STRINGS]
+    versions.extend(
+        Version.parse(version_str)
+        for version_str in (
+            "1.0.0-rc.2",
+            "1.0.0-alpha.3",
+            "1.0.0-alpha.beta.1",
+            "1.0.0-beta.2",
+        )
+    )
+    random.shuffle(versions)
+
+    by_key = sorted(versions, key=lambda v: v.sort_key)
+
+    assert all(lower < upper for lower, upper in zip(by_key, by_key[1:]))
+    assert by_key == sorted(versions)